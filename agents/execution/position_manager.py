@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from decimal import Decimal
+import numpy as np
 
 
 class PositionSide(str, Enum):
@@ -25,7 +26,7 @@ class PositionStatus(str, Enum):
     PARTIALLY_CLOSED = "partially_closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Trading position"""
 
@@ -47,7 +48,7 @@ class Position:
     metadata: Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionUpdate:
     """Position update event"""
 
@@ -69,7 +70,14 @@ class PositionManager:
     def __init__(self):
         self.positions: Dict[str, Position] = {}
         self.closed_positions: List[Position] = []
-        self.position_updates: List[PositionUpdate] = []
+        # Audit trail stored as plain tuples in PositionUpdate field order;
+        # PositionUpdate objects are only materialized on read.
+        self._update_log: List[Tuple] = []
+
+    @property
+    def position_updates(self) -> List[PositionUpdate]:
+        """All recorded position updates (materialized on access)"""
+        return [PositionUpdate(*u) for u in self._update_log]
 
     def open_position(
         self,
@@ -145,10 +153,9 @@ class PositionManager:
         Returns:
             Updated Position or None
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return None
-
-        position = self.positions[position_id]
         position.current_price = current_price
 
         # Calculate unrealized P&L
@@ -184,11 +191,10 @@ class PositionManager:
         Returns:
             Updated Position or None
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return None
 
-        position = self.positions[position_id]
-
         # Calculate new average entry price
         total_cost = (position.quantity * position.entry_price) + (
             additional_quantity * price
@@ -201,8 +207,12 @@ class PositionManager:
         position.quantity = new_quantity
         position.current_price = price
 
-        # Recalculate P&L
-        self.update_position_price(position_id, price)
+        # Recalculate P&L inline (avoids a second lookup via update_position_price)
+        side_sign = 1.0 if position.side == PositionSide.LONG else -1.0
+        pnl_per_unit = (price - new_avg_price) * side_sign
+        position.unrealized_pnl = pnl_per_unit * new_quantity
+        position.unrealized_pnl_pct = (pnl_per_unit / new_avg_price) * 100
+        position.total_pnl = position.unrealized_pnl + position.realized_pnl
 
         # Record update
         self._record_update(
@@ -234,11 +244,10 @@ class PositionManager:
         Returns:
             Updated Position or None
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return None
 
-        position = self.positions[position_id]
-
         if reduce_quantity >= position.quantity:
             # Full close
             return self.close_position(position_id, price)
@@ -257,8 +266,11 @@ class PositionManager:
         position.current_price = price
         position.status = PositionStatus.PARTIALLY_CLOSED
 
-        # Recalculate unrealized P&L for remaining quantity
-        self.update_position_price(position_id, price)
+        # Recalculate unrealized P&L for remaining quantity (entry price is
+        # unchanged, so the per-unit P&L computed above still applies)
+        position.unrealized_pnl = pnl_per_unit * position.quantity
+        position.unrealized_pnl_pct = (pnl_per_unit / position.entry_price) * 100
+        position.total_pnl = position.unrealized_pnl + position.realized_pnl
 
         # Record update
         self._record_update(
@@ -286,11 +298,10 @@ class PositionManager:
         Returns:
             Closed Position or None
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return None
 
-        position = self.positions[position_id]
-
         # Calculate final P&L
         if position.side == PositionSide.LONG:
             pnl_per_unit = exit_price - position.entry_price
@@ -363,10 +374,14 @@ class PositionManager:
         Returns:
             Total portfolio value (cash + positions)
         """
-        positions_value = sum(
-            p.quantity * p.current_price for p in self.positions.values()
-        )
-        return account_balance + positions_value
+        n = len(self.positions)
+        if n == 0:
+            return account_balance
+
+        positions = self.positions.values()
+        quantities = np.fromiter((p.quantity for p in positions), dtype=np.float64, count=n)
+        prices = np.fromiter((p.current_price for p in positions), dtype=np.float64, count=n)
+        return account_balance + float(np.vdot(quantities, prices))
 
     def get_exposure(self) -> Dict[str, float]:
         """
@@ -393,11 +408,10 @@ class PositionManager:
         Returns:
             (hit_stop_loss, stop_loss_price)
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return False, None
 
-        position = self.positions[position_id]
-
         if not position.stop_loss:
             return False, None
 
@@ -419,11 +433,10 @@ class PositionManager:
         Returns:
             (hit_take_profit, take_profit_price)
         """
-        if position_id not in self.positions:
+        position = self.positions.get(position_id)
+        if position is None:
             return False, None
 
-        position = self.positions[position_id]
-
         if not position.take_profit:
             return False, None
 
@@ -447,24 +460,25 @@ class PositionManager:
         metadata: Dict,
     ):
         """Record position update for audit trail"""
-        update = PositionUpdate(
-            position_id=position_id,
-            symbol=symbol,
-            action=action,
-            quantity=quantity,
-            price=price,
-            pnl=pnl,
-            timestamp=datetime.utcnow(),
-            metadata=metadata,
+        self._update_log.append(
+            (
+                position_id,
+                symbol,
+                action,
+                quantity,
+                price,
+                pnl,
+                datetime.utcnow(),
+                metadata,
+            )
         )
-        self.position_updates.append(update)
 
     def get_position_history(
         self, position_id: str
     ) -> List[PositionUpdate]:
         """Get all updates for a position"""
         return [
-            u for u in self.position_updates if u.position_id == position_id
+            PositionUpdate(*u) for u in self._update_log if u[0] == position_id
         ]
 
     def get_performance_stats(self) -> Dict:
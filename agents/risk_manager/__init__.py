@@ -15,6 +15,8 @@ from agents.risk_manager.risk_assessment import (
     VaRCalculator,
     PortfolioRiskAnalyzer,
     TradeValidator,
+    ActivePosition,
+    PositionArray,
     RiskMetrics,
     TradeRiskAssessment,
 )
@@ -27,6 +29,7 @@ from agents.risk_manager.stop_loss_placement import (
     TrailingStopLoss,
     StopLossMethod,
     StopLossLevels,
+    StopLossBatch,
 )
 
 __all__ = [
@@ -39,6 +42,8 @@ __all__ = [
     "VaRCalculator",
     "PortfolioRiskAnalyzer",
     "TradeValidator",
+    "ActivePosition",
+    "PositionArray",
     "RiskMetrics",
     "TradeRiskAssessment",
     "StopLossManager",
@@ -49,4 +54,5 @@ __all__ = [
     "TrailingStopLoss",
     "StopLossMethod",
     "StopLossLevels",
+    "StopLossBatch",
 ]
@@ -3,12 +3,16 @@ Risk Manager Agent
 Position sizing, risk assessment, and trade approval.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
+from functools import lru_cache
 import asyncio
-import json
+import time
 import uuid
 
+import numpy as np
+import orjson
+
 from agents.base.agent import BaseAgent
 from agents.base.protocol import (
     MessageType,
@@ -20,6 +24,8 @@ from agents.base.protocol import (
 )
 from agents.risk_manager.position_sizing import PositionSizer
 from agents.risk_manager.risk_assessment import (
+    ActivePosition,
+    PositionArray,
     VaRCalculator,
     PortfolioRiskAnalyzer,
     TradeValidator,
@@ -28,11 +34,96 @@ from agents.risk_manager.stop_loss_placement import (
     StopLossManager,
     StopLossMethod,
 )
-from infrastructure.database.postgresql import get_db, PostgreSQLDatabase
+from infrastructure.database.postgresql import get_db, BatchWriter, PostgreSQLDatabase
 from infrastructure.database.influxdb import get_influx, InfluxDBManager
 from core.config.settings import settings
 
 
+# Risk assessment rows are buffered and written in batches
+ASSESSMENT_BATCH_SIZE = 500
+ASSESSMENT_FLUSH_INTERVAL = 0.2  # seconds
+
+# Last-resort prices when neither InfluxDB nor the intent provide one
+FALLBACK_PRICES = {
+    "BTC/USDT": 50000.0,
+    "ETH/USDT": 2500.0,
+    "SOL/USDT": 150.0,
+}
+
+# Portfolios at least this large compute risk off the event loop
+PORTFOLIO_RISK_OFFLOAD_THRESHOLD = 1000
+
+# Intents for the same symbol arriving within this window are coalesced
+INTENT_DEBOUNCE_SECONDS = 0.05
+
+# Exchange balance is refreshed in the background and trusted for BALANCE_CACHE_TTL
+BALANCE_REFRESH_INTERVAL = 2.0  # seconds
+BALANCE_CACHE_TTL = 5.0  # seconds
+
+INSERT_RISK_ASSESSMENT_QUERY = """
+    INSERT INTO risk_assessments (
+        signal_id, symbol, risk_score, position_size,
+        var_estimate, max_loss, approved, rejection_reason,
+        metadata
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+"""
+
+SELECT_OPEN_POSITIONS_QUERY = """
+    SELECT symbol, side, quantity, entry_price,
+           current_price, stop_loss, take_profit,
+           (quantity * entry_price) as size_usd
+    FROM positions
+    WHERE status = 'OPEN'
+"""
+
+# Price, ATR and price std in a single Flux script; each sub-query is
+# tagged via yield() and split on the "result" column
+MARKET_DATA_QUERY = """
+from(bucket: "{bucket}")
+    |> range(start: -1h)
+    |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+    |> filter(fn: (r) => r["symbol"] == "{symbol}")
+    |> filter(fn: (r) => r["_field"] == "close")
+    |> last()
+    |> yield(name: "price")
+
+from(bucket: "{bucket}")
+    |> range(start: -1h)
+    |> filter(fn: (r) => r["_measurement"] == "indicator")
+    |> filter(fn: (r) => r["symbol"] == "{symbol}")
+    |> filter(fn: (r) => r["name"] == "atr")
+    |> last()
+    |> yield(name: "atr")
+
+from(bucket: "{bucket}")
+    |> range(start: -24h)
+    |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+    |> filter(fn: (r) => r["symbol"] == "{symbol}")
+    |> filter(fn: (r) => r["_field"] == "close")
+    |> stddev()
+    |> yield(name: "std")
+"""
+
+
+@lru_cache(maxsize=128)
+def _market_data_query(bucket: str, symbol: str) -> str:
+    """Render MARKET_DATA_QUERY once per (bucket, symbol)"""
+    return MARKET_DATA_QUERY.format(bucket=bucket, symbol=symbol)
+
+
+def _compute_portfolio_risk(positions: PositionArray) -> float:
+    """Total USD at risk across the open positions"""
+    if not len(positions):
+        return 0.0
+
+    entry, stop, size = positions.entries, positions.stops, positions.sizes
+
+    # Positions without a stop-loss contribute no measured risk
+    risk = np.where(stop != 0.0, np.abs(entry - stop) / entry * size, 0.0)
+    return float(risk.sum())
+
+
 class RiskManagerAgent(BaseAgent):
     """
     Risk Manager Agent - Risk Assessment and Position Sizing
@@ -68,6 +159,7 @@ class RiskManagerAgent(BaseAgent):
         self.max_position_risk = max_position_risk
         self.position_sizing_method = position_sizing_method
         self.stop_loss_method = stop_loss_method
+        self._stop_loss_enum = StopLossMethod(stop_loss_method)
         self.min_confidence = min_confidence
         self.min_rr_ratio = min_rr_ratio
 
@@ -90,7 +182,7 @@ class RiskManagerAgent(BaseAgent):
         )
 
         self.stop_loss_manager = StopLossManager(
-            default_method=StopLossMethod(stop_loss_method),
+            default_method=self._stop_loss_enum,
             default_rr_ratio=2.0,
         )
 
@@ -112,7 +204,9 @@ class RiskManagerAgent(BaseAgent):
         self._influx: Optional[InfluxDBClient] = None
 
         # State tracking
-        self.active_positions: List[Dict] = []
+        self.active_positions: Dict[str, ActivePosition] = {}  # symbol -> position
+        # Column snapshot of active_positions, rebuilt on every portfolio change
+        self._position_array = PositionArray.from_positions(())
         self.current_portfolio_risk: float = 0.0
         self.returns_history: Dict[str, List[float]] = {}
 
@@ -120,6 +214,34 @@ class RiskManagerAgent(BaseAgent):
         self.balance_lock = asyncio.Lock()
         self.reserved_balance: Dict[str, float] = {}  # order_id -> reserved amount
 
+        # Shared exchange client and cached free balances
+        self._exchange = None
+        self._exchange_lock = asyncio.Lock()
+        self._balance_cache: Dict[str, float] = {}  # currency -> free amount
+        self._balance_expiry: float = 0.0  # monotonic time
+        self._balance_refresh_task: Optional[asyncio.Task] = None
+        # Balance prefetches still running after their intent returned early
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Currency held back for published orders: order_id -> (currency, amount)
+        self.reserved_currency: Dict[str, tuple] = {}
+
+        # Market data cache: symbol -> (monotonic expiry, market data)
+        self._md_cache: Dict[str, tuple] = {}
+        self._md_cache_ttl = settings.trading.market_data_cache_ttl
+        self._md_cache_hits = 0
+        self._md_cache_misses = 0
+
+        # Set on shutdown to release run()
+        self._stop_event = asyncio.Event()
+
+        # Latest pending trade intent per symbol, drained by _intent_worker
+        self._pending_intents: Dict[str, TradeIntent] = {}
+        self._intents_available = asyncio.Event()
+        self._intent_worker_task: Optional[asyncio.Task] = None
+
+        # Buffered risk assessment inserts
+        self._assessment_writer: Optional[BatchWriter] = None
+
     async def initialize(self) -> None:
         """Initialize agent resources"""
         await super().initialize()
@@ -130,9 +252,30 @@ class RiskManagerAgent(BaseAgent):
         # Connect to InfluxDB
         self._influx = get_influx()
 
+        # Exchange client reused for balance checks
+        import ccxt.async_support as ccxt
+
+        self._exchange = ccxt.binance({
+            'apiKey': settings.exchange.binance_api_key,
+            'secret': settings.exchange.binance_secret,
+            'enableRateLimit': True,
+        })
+        self._balance_refresh_task = asyncio.create_task(self._balance_refresher())
+
         # Load active positions and portfolio state
         await self._load_portfolio_state()
 
+        # Start trade intent worker and background writer for risk assessments
+        self._intent_worker_task = asyncio.create_task(self._intent_worker())
+        self._assessment_writer = BatchWriter(
+            self._db,
+            INSERT_RISK_ASSESSMENT_QUERY,
+            name="risk_assessments",
+            batch_size=ASSESSMENT_BATCH_SIZE,
+            flush_interval=ASSESSMENT_FLUSH_INTERVAL,
+        )
+        self._assessment_writer.start()
+
         self.logger.info(
             "risk_manager_initialized",
             account_balance=self.account_balance,
@@ -145,7 +288,7 @@ class RiskManagerAgent(BaseAgent):
     async def setup(self) -> None:
         """Setup subscriptions"""
         # Subscribe to trade intents from Strategy Agent
-        await self.subscribe_topic("trade.intent", self._handle_trade_intent)
+        await self.subscribe_topic("trade.intent", self._enqueue_trade_intent)
         # Subscribe to position updates
         await self.subscribe_topic("position.update", self._handle_position_update)
         # Subscribe to execution reports to release reserved balance
@@ -155,9 +298,8 @@ class RiskManagerAgent(BaseAgent):
         self.logger.info("risk_manager_setup_complete")
 
     async def run(self) -> None:
-        """Main agent loop (event-driven, just wait)"""
-        while self._running:
-            await asyncio.sleep(1)
+        """Main agent loop (event-driven, wait until shutdown)"""
+        await self._stop_event.wait()
 
     async def cleanup(self) -> None:
         """Cleanup resources"""
@@ -174,6 +316,23 @@ class RiskManagerAgent(BaseAgent):
 
     async def shutdown(self) -> None:
         """Shutdown agent gracefully"""
+        self._stop_event.set()
+
+        for task in (self._intent_worker_task, self._balance_refresh_task, *self._background_tasks):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        # Write any buffered risk assessments before closing the database
+        if self._assessment_writer:
+            await self._assessment_writer.stop()
+
+        if self._exchange:
+            await self._exchange.close()
+
         if self._db:
             await self._db.close()
 
@@ -182,6 +341,24 @@ class RiskManagerAgent(BaseAgent):
 
         await super().shutdown()
 
+    async def _enqueue_trade_intent(self, message: TradeIntent) -> None:
+        """Queue trade intent; a newer intent replaces a pending one for the same symbol"""
+        self._pending_intents[message.symbol] = message
+        self._intents_available.set()
+
+    async def _intent_worker(self) -> None:
+        """Process pending trade intents once per symbol after a short debounce"""
+        while True:
+            await self._intents_available.wait()
+            await asyncio.sleep(INTENT_DEBOUNCE_SECONDS)
+
+            self._intents_available.clear()
+            pending = self._pending_intents
+            self._pending_intents = {}
+
+            for message in pending.values():
+                await self._handle_trade_intent(message)
+
     async def _handle_trade_intent(self, message: TradeIntent) -> None:
         """Handle trade intent from Strategy Agent"""
         try:
@@ -197,7 +374,15 @@ class RiskManagerAgent(BaseAgent):
             custom_stop = metadata.get('stop_loss')
             custom_tp = metadata.get('take_profit')
 
-            self.logger.info(
+            # Refresh a stale balance cache while market data is being fetched
+            balance_task = None
+            if time.monotonic() >= self._balance_expiry:
+                balance_task = asyncio.create_task(self._prefetch_balance())
+                # Keep a reference until done; rejected intents never await it
+                self._background_tasks.add(balance_task)
+                balance_task.add_done_callback(self._background_tasks.discard)
+
+            self.logger.debug(
                 "trade_intent_received",
                 symbol=symbol,
                 side=side,
@@ -223,12 +408,7 @@ class RiskManagerAgent(BaseAgent):
 
             # Last resort: hardcoded fallback prices
             if not current_price or current_price == 0.0:
-                fallback_prices = {
-                    "BTC/USDT": 50000.0,
-                    "ETH/USDT": 2500.0,
-                    "SOL/USDT": 150.0,
-                }
-                current_price = fallback_prices.get(symbol, 1000.0)
+                current_price = FALLBACK_PRICES.get(symbol, 1000.0)
                 self.logger.warning(
                     "using_fallback_price",
                     symbol=symbol,
@@ -240,7 +420,7 @@ class RiskManagerAgent(BaseAgent):
                 symbol=symbol,
                 current_price=current_price,
                 side=side,
-                method=StopLossMethod(self.stop_loss_method),
+                method=self._stop_loss_enum,
                 atr=atr,
                 price_std=price_std,
                 custom_stop=custom_stop,
@@ -268,7 +448,7 @@ class RiskManagerAgent(BaseAgent):
                 reward_risk_ratio=stop_levels.reward_risk_ratio,
                 current_portfolio_risk=self.current_portfolio_risk,
                 account_balance=self.account_balance,
-                existing_positions=self.active_positions,
+                existing_positions=self._position_array,
             )
 
             # Store risk assessment
@@ -300,6 +480,8 @@ class RiskManagerAgent(BaseAgent):
                         return
 
                     # Additional balance and asset checks before order execution
+                    if balance_task is not None:
+                        await balance_task
                     can_execute, execution_reason = await self._can_execute_order(
                         symbol=symbol,
                         side=side,
@@ -320,20 +502,13 @@ class RiskManagerAgent(BaseAgent):
                     # Reserve balance immediately
                     order_id = str(uuid.uuid4())
                     self.reserved_balance[order_id] = position_size.size_usd
-
-                    self.logger.info(
-                        "trade_approved",
-                        symbol=symbol,
-                        side=side,
-                        quantity=position_size.quantity,
-                        size_usd=position_size.size_usd,
-                        risk_amount=position_size.risk_amount,
-                        stop_loss=stop_levels.stop_loss,
-                        take_profit=stop_levels.take_profit,
-                        risk_score=risk_assessment.risk_score,
-                        order_id=order_id,
-                        reserved_balance=position_size.size_usd,
-                    )
+                    if side.upper() == "BUY":
+                        self.reserved_currency[order_id] = ("USDT", position_size.size_usd)
+                    else:
+                        self.reserved_currency[order_id] = (
+                            symbol.split('/')[0],
+                            position_size.quantity,
+                        )
 
                     # Create and publish order
                     order = await self._create_order(
@@ -346,23 +521,23 @@ class RiskManagerAgent(BaseAgent):
                     if not order.correlation_id:
                         order.correlation_id = order_id
 
+                    await self.publish_message("trade.order", order, priority=9)
+
+                    # Single event for approval, order creation and publish
                     self.logger.info(
-                        "order_created",
+                        "trade_order_published",
                         symbol=symbol,
                         side=order.side.value,
                         quantity=order.quantity,
+                        size_usd=position_size.size_usd,
+                        risk_amount=position_size.risk_amount,
+                        stop_loss=stop_levels.stop_loss,
+                        take_profit=stop_levels.take_profit,
+                        risk_score=risk_assessment.risk_score,
                         order_type=order.order_type.value,
                         order_id=order.correlation_id,
                     )
 
-                    await self.publish_message("trade.order", order, priority=9)
-
-                    self.logger.info(
-                        "order_published",
-                        symbol=symbol,
-                        order_id=order.correlation_id or "none",
-                    )
-
                     # Update portfolio risk
                     self.current_portfolio_risk = (
                         risk_assessment.portfolio_risk_after
@@ -404,8 +579,29 @@ class RiskManagerAgent(BaseAgent):
 
     async def _handle_position_update(self, message: Any) -> None:
         """Handle position updates from Execution Agent"""
-        # Update active positions and portfolio risk
-        await self._load_portfolio_state()
+        # Drop cached market data for the touched symbol
+        symbol = getattr(message, "symbol", None)
+        if symbol:
+            self._md_cache.pop(symbol, None)
+        else:
+            self._md_cache.clear()
+
+        # Apply the update in memory; unknown positions need a resync from the
+        # database since the message does not carry stop-loss levels
+        quantity = getattr(message, "quantity", None)
+        position = self.active_positions.get(symbol) if symbol else None
+
+        if position is not None and quantity is not None:
+            if quantity <= 0:
+                del self.active_positions[symbol]
+            else:
+                position.quantity = quantity
+                position.entry_price = message.entry_price
+                position.current_price = message.current_price
+                position.size_usd = quantity * message.entry_price
+            await self._update_portfolio_risk()
+        elif quantity is None or quantity > 0:
+            await self._load_portfolio_state()
 
         self.logger.debug(
             "position_updated",
@@ -426,11 +622,13 @@ class RiskManagerAgent(BaseAgent):
             async with self.balance_lock:
                 if order_id in self.reserved_balance:
                     reserved_amount = self.reserved_balance.pop(order_id)
+                    self.reserved_currency.pop(order_id, None)
 
                     # Update actual balance based on order status
                     if status == 'FILLED':
                         # Deduct the used amount for filled orders
                         self.account_balance -= reserved_amount
+                        self._balance_expiry = 0.0
                         event_type = "balance_released_after_fill"
                     else:
                         # Return the reserved amount for rejected/cancelled orders
@@ -463,10 +661,12 @@ class RiskManagerAgent(BaseAgent):
                 async with self.balance_lock:
                     if order_id in self.reserved_balance:
                         reserved_amount = self.reserved_balance.pop(order_id)
+                        self.reserved_currency.pop(order_id, None)
 
                         # For filled orders, update actual balance
                         if status == 'FILLED':
                             self.account_balance -= reserved_amount
+                            self._balance_expiry = 0.0
 
                         self.logger.info(
                             "balance_reservation_released",
@@ -480,57 +680,53 @@ class RiskManagerAgent(BaseAgent):
             self.log_error(e, {"handler": "order_status"})
 
     async def _get_market_data(self, symbol: str) -> Dict[str, float]:
-        """Get current market data and technical indicators"""
-        try:
-            from core.config.settings import settings
-
-            # Get latest price (Flux query)
-            price_query = f"""
-            from(bucket: "{settings.influxdb.bucket}")
-                |> range(start: -1h)
-                |> filter(fn: (r) => r["_measurement"] == "ohlcv")
-                |> filter(fn: (r) => r["symbol"] == "{symbol}")
-                |> filter(fn: (r) => r["_field"] == "close")
-                |> last()
-            """
-            price_result = await self._influx.query(price_query)
-            current_price = (
-                price_result[0]["_value"]
-                if price_result and "_value" in price_result[0]
-                else 50000.0
+        """Get current market data and technical indicators (TTL cached)"""
+        now = time.monotonic()
+        cached = self._md_cache.get(symbol)
+        if cached is not None and now < cached[0]:
+            self._md_cache_hits += 1
+            self._log_md_cache_stats()
+            return cached[1]
+
+        self._md_cache_misses += 1
+        self._log_md_cache_stats()
+
+        market_data = await self._fetch_market_data(symbol)
+        if market_data is not None:
+            self._md_cache[symbol] = (now + self._md_cache_ttl, market_data)
+            return market_data
+
+        # Return default values
+        return {"price": 50000.0, "atr": None, "std": None}
+
+    def _log_md_cache_stats(self) -> None:
+        """Log market data cache hit rate every 1000 lookups"""
+        total = self._md_cache_hits + self._md_cache_misses
+        if total % 1000 == 0:
+            self.logger.info(
+                "market_data_cache_stats",
+                hits=self._md_cache_hits,
+                misses=self._md_cache_misses,
+                hit_rate=self._md_cache_hits / total,
             )
 
-            # Get ATR (Flux query)
-            atr_query = f"""
-            from(bucket: "{settings.influxdb.bucket}")
-                |> range(start: -1h)
-                |> filter(fn: (r) => r["_measurement"] == "indicator")
-                |> filter(fn: (r) => r["symbol"] == "{symbol}")
-                |> filter(fn: (r) => r["name"] == "atr")
-                |> last()
-            """
-            atr_result = await self._influx.query(atr_query)
-            atr = (
-                atr_result[0]["_value"]
-                if atr_result and "_value" in atr_result[0]
-                else None
+    async def _fetch_market_data(self, symbol: str) -> Optional[Dict[str, float]]:
+        """Query current market data and technical indicators from InfluxDB"""
+        try:
+            rows = await self._influx.query(
+                _market_data_query(settings.influxdb.bucket, symbol)
             )
 
-            # Calculate recent price std (Flux query)
-            std_query = f"""
-            from(bucket: "{settings.influxdb.bucket}")
-                |> range(start: -24h)
-                |> filter(fn: (r) => r["_measurement"] == "ohlcv")
-                |> filter(fn: (r) => r["symbol"] == "{symbol}")
-                |> filter(fn: (r) => r["_field"] == "close")
-                |> stddev()
-            """
-            std_result = await self._influx.query(std_query)
-            price_std = (
-                std_result[0]["_value"]
-                if std_result and "_value" in std_result[0]
-                else None
-            )
+            # Keep the first value of each result set
+            values: Dict[str, Any] = {}
+            for row in rows:
+                values.setdefault(row.get("result"), row.get("_value"))
+
+            current_price = values.get("price")
+            if current_price is None:
+                current_price = 50000.0
+            atr = values.get("atr")
+            price_std = values.get("std")
 
             return {
                 "price": current_price,
@@ -542,8 +738,7 @@ class RiskManagerAgent(BaseAgent):
             self.logger.error(
                 "market_data_error", symbol=symbol, error=str(e)
             )
-            # Return default values
-            return {"price": 50000.0, "atr": None, "std": None}
+            return None
 
     async def _can_execute_order(
         self, symbol: str, side: str, quantity: float, size_usd: float
@@ -555,57 +750,42 @@ class RiskManagerAgent(BaseAgent):
             (can_execute: bool, reason: str)
         """
         try:
-            # Fetch current account balance from exchange
-            import ccxt.async_support as ccxt
-
-            exchange = ccxt.binance({
-                'apiKey': settings.exchange.binance_api_key,
-                'secret': settings.exchange.binance_secret,
-                'enableRateLimit': True,
-            })
+            # For BUY orders, check USDT balance
+            if side.upper() == "BUY":
+                available_usdt = await self._get_available_balance('USDT')
 
-            try:
-                balance = await exchange.fetch_balance()
-
-                # For BUY orders, check USDT balance
-                if side.upper() == "BUY":
-                    available_usdt = balance['free'].get('USDT', 0.0)
-
-                    if available_usdt < size_usd:
-                        return False, f"Insufficient USDT balance: have ${available_usdt:.2f}, need ${size_usd:.2f}"
-
-                    self.logger.info(
-                        "buy_order_balance_check",
-                        symbol=symbol,
-                        available_usdt=available_usdt,
-                        required_usdt=size_usd,
-                        approved=True
-                    )
-                    return True, "Sufficient USDT balance"
+                if available_usdt < size_usd:
+                    return False, f"Insufficient USDT balance: have ${available_usdt:.2f}, need ${size_usd:.2f}"
 
-                # For SELL orders, check if we own the base asset
-                elif side.upper() == "SELL":
-                    # Extract base currency from symbol (e.g., BTC from BTC/USDT)
-                    base_currency = symbol.split('/')[0]
-                    available_base = balance['free'].get(base_currency, 0.0)
+                self.logger.debug(
+                    "buy_order_balance_check",
+                    symbol=symbol,
+                    available_usdt=available_usdt,
+                    required_usdt=size_usd,
+                    approved=True
+                )
+                return True, "Sufficient USDT balance"
 
-                    if available_base < quantity:
-                        return False, f"Insufficient {base_currency} balance: have {available_base}, need {quantity}"
+            # For SELL orders, check if we own the base asset
+            elif side.upper() == "SELL":
+                # Extract base currency from symbol (e.g., BTC from BTC/USDT)
+                base_currency = symbol.split('/')[0]
+                available_base = await self._get_available_balance(base_currency)
 
-                    self.logger.info(
-                        "sell_order_balance_check",
-                        symbol=symbol,
-                        base_currency=base_currency,
-                        available=available_base,
-                        required=quantity,
-                        approved=True
-                    )
-                    return True, f"Sufficient {base_currency} balance"
+                if available_base < quantity:
+                    return False, f"Insufficient {base_currency} balance: have {available_base}, need {quantity}"
 
-                return True, "Unknown side, allowing order"
+                self.logger.debug(
+                    "sell_order_balance_check",
+                    symbol=symbol,
+                    base_currency=base_currency,
+                    available=available_base,
+                    required=quantity,
+                    approved=True
+                )
+                return True, f"Sufficient {base_currency} balance"
 
-            finally:
-                await exchange.close()
+            return True, "Unknown side, allowing order"
 
         except Exception as e:
             self.logger.error(
@@ -617,42 +797,82 @@ class RiskManagerAgent(BaseAgent):
             # On error, allow order to proceed (let exchange reject if needed)
             return True, f"Balance check failed: {str(e)}, allowing order"
 
+    async def _get_available_balance(self, currency: str) -> float:
+        """
+        Free exchange balance for a currency minus amounts reserved for
+        published orders. Served from the in-process cache; the exchange is
+        only hit when the cache is stale.
+        """
+        if time.monotonic() >= self._balance_expiry:
+            await self._refresh_balance()
+
+        reserved = sum(
+            amount for cur, amount in self.reserved_currency.values() if cur == currency
+        )
+        return self._balance_cache.get(currency, 0.0) - reserved
+
+    async def _refresh_balance(self) -> None:
+        """Fetch free balances from the exchange into the cache"""
+        async with self._exchange_lock:
+            # Another caller may have refreshed it while we waited
+            if time.monotonic() < self._balance_expiry:
+                return
+
+            balance = await self._exchange.fetch_balance()
+            self._balance_cache = {
+                currency: float(free or 0.0)
+                for currency, free in balance['free'].items()
+            }
+            self._balance_expiry = time.monotonic() + BALANCE_CACHE_TTL
+
+    async def _prefetch_balance(self) -> None:
+        """Refresh the balance cache, logging instead of raising on failure"""
+        try:
+            await self._refresh_balance()
+        except Exception as e:
+            self.logger.warning("balance_prefetch_error", error=str(e))
+
+    async def _balance_refresher(self) -> None:
+        """Keep the balance cache warm in the background"""
+        while True:
+            try:
+                # Force a refresh regardless of expiry
+                self._balance_expiry = 0.0
+                await self._refresh_balance()
+            except Exception as e:
+                self.logger.warning("balance_refresh_error", error=str(e))
+            await asyncio.sleep(BALANCE_REFRESH_INTERVAL)
+
     async def _load_portfolio_state(self) -> None:
-        """Load current portfolio state from database"""
+        """Load current portfolio state from database (cold start / resync)"""
         try:
             # Get active positions
-            query = """
-                SELECT symbol, side, quantity, entry_price,
-                       current_price, stop_loss, take_profit,
-                       (quantity * entry_price) as size_usd
-                FROM positions
-                WHERE status = 'OPEN'
-            """
-
-            positions = await self._db.fetch_all(query)
-            self.active_positions = [dict(p) for p in positions]
-
-            # Calculate current portfolio risk
-            total_risk = 0.0
-            for pos in self.active_positions:
-                if pos["stop_loss"]:
-                    entry = pos["entry_price"]
-                    stop = pos["stop_loss"]
-                    risk_pct = abs(entry - stop) / entry
-                    position_risk = pos["size_usd"] * risk_pct
-                    total_risk += position_risk
-
-            self.current_portfolio_risk = (
-                total_risk / self.account_balance
-                if self.account_balance > 0
-                else 0.0
-            )
+            positions = await self._db.fetch_all(SELECT_OPEN_POSITIONS_QUERY)
+            self.active_positions = {p["symbol"]: ActivePosition(**p) for p in positions}
+            await self._update_portfolio_risk()
 
         except Exception as e:
             self.logger.error("load_portfolio_error", error=str(e))
-            self.active_positions = []
+            self.active_positions = {}
+            self._position_array = PositionArray.from_positions(())
             self.current_portfolio_risk = 0.0
 
+    async def _update_portfolio_risk(self) -> None:
+        """Recalculate current portfolio risk from active positions"""
+        # Snapshot on the event loop; large portfolios are reduced in a thread
+        positions = PositionArray.from_positions(self.active_positions.values())
+        self._position_array = positions
+        if len(positions) >= PORTFOLIO_RISK_OFFLOAD_THRESHOLD:
+            total_risk = await asyncio.to_thread(_compute_portfolio_risk, positions)
+        else:
+            total_risk = _compute_portfolio_risk(positions)
+
+        self.current_portfolio_risk = (
+            total_risk / self.account_balance
+            if self.account_balance > 0
+            else 0.0
+        )
+
     async def _store_risk_assessment(
         self,
         trade_intent: TradeIntent,
@@ -660,38 +880,31 @@ class RiskManagerAgent(BaseAgent):
         stop_levels: Any,
         risk_assessment: Any,
     ) -> None:
-        """Store risk assessment in database"""
+        """Queue risk assessment for batched storage in database"""
         try:
-            query = """
-                INSERT INTO risk_assessments (
-                    signal_id, symbol, risk_score, position_size,
-                    var_estimate, max_loss, approved, rejection_reason,
-                    metadata
+            self._assessment_writer.put(
+                (
+                    None,  # signal_id (could link to signal table)
+                    trade_intent.symbol,
+                    risk_assessment.risk_score,
+                    position_size.size_usd,
+                    risk_assessment.var_contribution,
+                    position_size.risk_amount,
+                    risk_assessment.approved,
+                    risk_assessment.rejection_reason,
+                    orjson.dumps(
+                        {
+                            "trade_intent_id": trade_intent.correlation_id or str(uuid.uuid4()),
+                            "confidence": trade_intent.confidence,
+                            "kelly_fraction": position_size.kelly_fraction,
+                            "sizing_method": position_size.method,
+                            "stop_loss": stop_levels.stop_loss,
+                            "take_profit": stop_levels.take_profit,
+                            "rr_ratio": stop_levels.reward_risk_ratio,
+                        },
+                        option=orjson.OPT_SERIALIZE_NUMPY,
+                    ).decode(),
                 )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-            """
-
-            await self._db.execute(
-                query,
-                None,  # signal_id (could link to signal table)
-                trade_intent.symbol,
-                risk_assessment.risk_score,
-                position_size.size_usd,
-                risk_assessment.var_contribution,
-                position_size.risk_amount,
-                risk_assessment.approved,
-                risk_assessment.rejection_reason,
-                json.dumps(
-                    {
-                        "trade_intent_id": trade_intent.correlation_id or str(uuid.uuid4()),
-                        "confidence": trade_intent.confidence,
-                        "kelly_fraction": position_size.kelly_fraction,
-                        "sizing_method": position_size.method,
-                        "stop_loss": stop_levels.stop_loss,
-                        "take_profit": stop_levels.take_profit,
-                        "rr_ratio": stop_levels.reward_risk_ratio,
-                    }
-                ),
             )
 
         except Exception as e:
@@ -9,6 +9,11 @@ from decimal import Decimal
 import math
 
 
+def _clamp(value: float, lo: float, hi: float) -> float:
+    """Clamp value to the closed interval [lo, hi]"""
+    return min(hi, max(lo, value))
+
+
 @dataclass
 class PositionSize:
     """Position size calculation result"""
@@ -18,9 +23,23 @@ class PositionSize:
     risk_amount: float
     kelly_fraction: float
     method: str
-    reasoning: str
     metadata: Dict
 
+    @property
+    def reasoning(self) -> str:
+        """Human-readable summary, formatted only when requested"""
+        meta = self.metadata
+        return (
+            f"Position size: ${self.size_usd:,.2f} ({self.kelly_fraction:.1%} of portfolio) | "
+            f"Risk: ${self.risk_amount:,.2f} ({meta['stop_loss_pct']:.1%} stop) | "
+            f"R:R {meta['reward_risk_ratio']:.2f}:1 | "
+            f"Win prob: {meta['win_probability']:.1%} | "
+            f"Method: {self.method}"
+        )
+
+    def __str__(self) -> str:
+        return self.reasoning
+
 
 class KellyCriterion:
     """
@@ -75,12 +94,12 @@ class KellyCriterion:
         ) / reward_risk_ratio
 
         # Apply constraints
-        kelly_fraction = max(self.min_kelly_fraction, kelly_fraction)
-        kelly_fraction = min(self.max_kelly_fraction, kelly_fraction)
+        kelly_fraction = _clamp(
+            kelly_fraction, self.min_kelly_fraction, self.max_kelly_fraction
+        )
 
-        # Additional safety: reduce if confidence is low
-        if win_probability < self.confidence_threshold:
-            kelly_fraction *= 0.5  # Half Kelly for low confidence
+        # Additional safety: half Kelly for low confidence (branch-free)
+        kelly_fraction *= 0.5 + 0.5 * (win_probability >= self.confidence_threshold)
 
         return kelly_fraction
 
@@ -187,16 +206,38 @@ class PositionSizer:
         max_total_risk: float = 0.20,  # Max 20% total portfolio risk
         default_method: str = "kelly",
     ):
-        self.account_balance = account_balance
         self.max_position_pct = max_position_pct
         self.max_total_risk = max_total_risk
         self.default_method = default_method
+        self.account_balance = account_balance
 
         # Initialize sizing methods
         self.kelly = KellyCriterion(max_kelly_fraction=0.25)
         self.fixed = FixedFractional(risk_per_trade=0.02)
         self.volatility = VolatilityBased(base_risk=0.02)
 
+        # Sizing method dispatch table
+        self._methods = {
+            "kelly": self._size_kelly,
+            "fixed": self._size_fixed,
+            "volatility": self._size_volatility,
+            "hybrid": self._size_hybrid,
+        }
+
+    @property
+    def account_balance(self) -> float:
+        """Total account balance"""
+        return self._account_balance
+
+    @account_balance.setter
+    def account_balance(self, value: float) -> None:
+        # Balance-derived limits are read on every sizing call; refresh them
+        # here so the hot path never recomputes them
+        self._account_balance = value
+        self._max_position_size = value * self.max_position_pct
+        self._small_acct_threshold = value * 0.80
+        self._max_portfolio_risk_usd = value * self.max_total_risk
+
     def calculate_position_size(
         self,
         symbol: str,
@@ -246,70 +287,17 @@ class PositionSizer:
         # Confidence 0.6 -> 55% win probability
         # Confidence 0.8 -> 65% win probability
         win_probability = 0.50 + (confidence - 0.5) * 0.3
-        win_probability = max(0.51, min(0.70, win_probability))
+        win_probability = _clamp(win_probability, 0.51, 0.70)
 
         # Calculate based on method
-        if method == "kelly":
-            kelly_fraction = self.kelly.calculate(
-                win_probability, reward_risk_ratio, self.account_balance
-            )
-            position_size = self.account_balance * kelly_fraction
-            sizing_method = "Kelly Criterion"
-
-        elif method == "fixed":
-            position_size = self.fixed.calculate(
-                self.account_balance, stop_loss_pct
-            )
-            kelly_fraction = position_size / self.account_balance
-            sizing_method = "Fixed Fractional"
-
-        elif method == "volatility" and atr:
-            position_size, _ = self.volatility.calculate(
-                self.account_balance, current_price, atr
-            )
-            kelly_fraction = position_size / self.account_balance
-            sizing_method = "Volatility-Based (ATR)"
-
-        elif method == "hybrid":
-            # Combine Kelly and Fixed methods
-            kelly_fraction = self.kelly.calculate(
-                win_probability, reward_risk_ratio, self.account_balance
-            )
-            kelly_size = self.account_balance * kelly_fraction
-
-            fixed_size = self.fixed.calculate(
-                self.account_balance, stop_loss_pct
-            )
-
-            # Use the more conservative (smaller) size, but respect max_position_pct
-            # For small accounts, max_position_pct may be higher to meet exchange minimums
-            conservative_size = min(kelly_size, fixed_size)
-            max_allowed = self.account_balance * self.max_position_pct
-
-            # If both methods suggest less than max, use conservative
-            # But allow max if it's needed for small accounts
-            if conservative_size < max_allowed and max_allowed <= self.account_balance * 0.80:
-                # Small account optimization: use max_position_pct if reasonable
-                position_size = max_allowed
-                sizing_method = "Hybrid (Kelly + Fixed, max-adjusted)"
-            else:
-                position_size = conservative_size
-                sizing_method = "Hybrid (Kelly + Fixed)"
-
-            kelly_fraction = position_size / self.account_balance
-
-        else:
-            # Default to fixed fractional
-            position_size = self.fixed.calculate(
-                self.account_balance, stop_loss_pct
-            )
-            kelly_fraction = position_size / self.account_balance
-            sizing_method = "Fixed Fractional (default)"
+        sizer = self._methods.get(method, self._size_default)
+        position_size, kelly_fraction, sizing_method = sizer(
+            current_price, stop_loss_pct, win_probability, reward_risk_ratio, atr
+        )
 
         # Apply maximum position size constraint
-        max_position_size = self.account_balance * self.max_position_pct
-        if position_size > max_position_size:
-            position_size = max_position_size
+        if position_size > self._max_position_size:
+            position_size = self._max_position_size
             kelly_fraction = self.max_position_pct
 
         # Check portfolio risk limit
@@ -320,10 +308,11 @@ class PositionSizer:
 
         if new_total_risk > self.max_total_risk:
             # Reduce position size to stay within portfolio risk limit
-            available_risk = self.max_total_risk - current_portfolio_risk
-            position_size = (
-                available_risk * self.account_balance
-            ) / stop_loss_pct
+            available_risk_usd = (
+                self._max_portfolio_risk_usd
+                - current_portfolio_risk * self.account_balance
+            )
+            position_size = available_risk_usd / stop_loss_pct
             kelly_fraction = position_size / self.account_balance
             sizing_method += " (risk-adjusted)"
 
@@ -355,22 +344,12 @@ class PositionSizer:
         position_size = round(position_size, 2)
         risk_amount = round(position_size * stop_loss_pct, 2)
 
-        # Build reasoning
-        reasoning = (
-            f"Position size: ${position_size:,.2f} ({kelly_fraction:.1%} of portfolio) | "
-            f"Risk: ${risk_amount:,.2f} ({stop_loss_pct:.1%} stop) | "
-            f"R:R {reward_risk_ratio:.2f}:1 | "
-            f"Win prob: {win_probability:.1%} | "
-            f"Method: {sizing_method}"
-        )
-
         return PositionSize(
             quantity=quantity,
             size_usd=position_size,
             risk_amount=risk_amount,
             kelly_fraction=kelly_fraction,
             method=sizing_method,
-            reasoning=reasoning,
             metadata={
                 "win_probability": win_probability,
                 "reward_risk_ratio": reward_risk_ratio,
@@ -381,6 +360,109 @@ class PositionSizer:
             },
         )
 
+    def _size_kelly(
+        self,
+        current_price: float,
+        stop_loss_pct: float,
+        win_probability: float,
+        reward_risk_ratio: float,
+        atr: Optional[float],
+    ) -> Tuple[float, float, str]:
+        """Kelly Criterion sizing: (position_size, kelly_fraction, method)"""
+        kelly_fraction = self.kelly.calculate(
+            win_probability, reward_risk_ratio, self.account_balance
+        )
+        position_size = self.account_balance * kelly_fraction
+        return position_size, kelly_fraction, "Kelly Criterion"
+
+    def _size_fixed(
+        self,
+        current_price: float,
+        stop_loss_pct: float,
+        win_probability: float,
+        reward_risk_ratio: float,
+        atr: Optional[float],
+    ) -> Tuple[float, float, str]:
+        """Fixed fractional sizing: (position_size, kelly_fraction, method)"""
+        position_size = self.fixed.calculate(self.account_balance, stop_loss_pct)
+        return (
+            position_size,
+            position_size / self.account_balance,
+            "Fixed Fractional",
+        )
+
+    def _size_volatility(
+        self,
+        current_price: float,
+        stop_loss_pct: float,
+        win_probability: float,
+        reward_risk_ratio: float,
+        atr: Optional[float],
+    ) -> Tuple[float, float, str]:
+        """ATR-based sizing, falling back to the default without ATR"""
+        if not atr:
+            return self._size_default(
+                current_price, stop_loss_pct, win_probability, reward_risk_ratio, atr
+            )
+
+        position_size, _ = self.volatility.calculate(
+            self.account_balance, current_price, atr
+        )
+        return (
+            position_size,
+            position_size / self.account_balance,
+            "Volatility-Based (ATR)",
+        )
+
+    def _size_hybrid(
+        self,
+        current_price: float,
+        stop_loss_pct: float,
+        win_probability: float,
+        reward_risk_ratio: float,
+        atr: Optional[float],
+    ) -> Tuple[float, float, str]:
+        """Combined Kelly and Fixed sizing: (position_size, kelly_fraction, method)"""
+        kelly_fraction = self.kelly.calculate(
+            win_probability, reward_risk_ratio, self.account_balance
+        )
+        kelly_size = self.account_balance * kelly_fraction
+
+        fixed_size = self.fixed.calculate(self.account_balance, stop_loss_pct)
+
+        # Use the more conservative (smaller) size, but respect max_position_pct
+        # For small accounts, max_position_pct may be higher to meet exchange minimums
+        conservative_size = min(kelly_size, fixed_size)
+        max_allowed = self._max_position_size
+
+        # If both methods suggest less than max, use conservative
+        # But allow max if it's needed for small accounts
+        if conservative_size < max_allowed and max_allowed <= self._small_acct_threshold:
+            # Small account optimization: use max_position_pct if reasonable
+            position_size = max_allowed
+            sizing_method = "Hybrid (Kelly + Fixed, max-adjusted)"
+        else:
+            position_size = conservative_size
+            sizing_method = "Hybrid (Kelly + Fixed)"
+
+        return position_size, position_size / self.account_balance, sizing_method
+
+    def _size_default(
+        self,
+        current_price: float,
+        stop_loss_pct: float,
+        win_probability: float,
+        reward_risk_ratio: float,
+        atr: Optional[float],
+    ) -> Tuple[float, float, str]:
+        """Default to fixed fractional sizing"""
+        position_size = self.fixed.calculate(self.account_balance, stop_loss_pct)
+        return (
+            position_size,
+            position_size / self.account_balance,
+            "Fixed Fractional (default)",
+        )
+
     def update_account_balance(self, new_balance: float) -> None:
         """Update account balance"""
         self.account_balance = new_balance
@@ -3,11 +3,38 @@ Risk Assessment Module
 VaR calculation, portfolio risk metrics, and trade validation.
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+import math
+import threading
 from datetime import datetime, timedelta
 import numpy as np
-from scipy import stats
+
+from agents.risk_manager.var_kernels import (
+    NUMBA_AVAILABLE,
+    historical_tail_kernel,
+    historical_var_kernel,
+    parametric_var_kernel,
+    conditional_var_kernel,
+    max_drawdown_kernel,
+    sharpe_sortino_kernel,
+)
+
+# One-sided z-scores of the standard normal distribution: the inverse CDF
+# at p=0.05 and p=0.01, i.e. scipy.stats.norm.ppf(0.05) and norm.ppf(0.01)
+Z_95 = -1.6448536269514729
+Z_99 = -2.3263478740408408
+
+# Entries kept in VaRCalculator's parametric VaR cache
+PARAMETRIC_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=1024)
+def _base(symbol: str) -> str:
+    """Base currency of a trading pair, e.g. BTC for BTC/USDT"""
+    return symbol.split("/", 1)[0]
 
 
 @dataclass
@@ -25,6 +52,84 @@ class RiskMetrics:
     rejection_reason: Optional[str] = None
 
 
+@dataclass(slots=True)
+class ActivePosition:
+    """Open position as tracked by the risk manager"""
+
+    symbol: str
+    side: str
+    quantity: float
+    entry_price: float
+    current_price: float
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    size_usd: float
+
+
+@dataclass(slots=True)
+class PositionArray:
+    """
+    Open positions as column arrays (struct-of-arrays)
+
+    Portfolio metrics reduce whole columns at once instead of looking up
+    fields position by position. Missing stop-losses are stored as 0.0.
+    """
+
+    symbols: np.ndarray  # object
+    bases: np.ndarray  # object, base currency per symbol
+    sizes: np.ndarray  # size_usd
+    entries: np.ndarray  # entry_price
+    stops: np.ndarray  # stop_loss
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    @classmethod
+    def _from_rows(cls, symbols: List[str], rows: List[Tuple]) -> "PositionArray":
+        columns = np.array(rows, dtype=np.float64).reshape(-1, 3).T
+        return cls(
+            symbols=np.array(symbols, dtype=object),
+            bases=np.array([_base(s) for s in symbols], dtype=object),
+            sizes=columns[0],
+            entries=columns[1],
+            stops=columns[2],
+        )
+
+    @classmethod
+    def from_dicts(cls, positions: Iterable[Dict]) -> "PositionArray":
+        """Build from position dicts with symbol, size_usd, entry_price, stop_loss"""
+        symbols = []
+        rows = []
+        for p in positions:
+            symbols.append(p.get("symbol", "UNKNOWN"))
+            rows.append(
+                (p.get("size_usd", 0), p.get("entry_price", 0), p.get("stop_loss") or 0.0)
+            )
+        return cls._from_rows(symbols, rows)
+
+    @classmethod
+    def from_positions(cls, positions: Iterable[ActivePosition]) -> "PositionArray":
+        """Build from ActivePosition objects"""
+        symbols = []
+        rows = []
+        for p in positions:
+            symbols.append(p.symbol)
+            rows.append((p.size_usd, p.entry_price, p.stop_loss or 0.0))
+        return cls._from_rows(symbols, rows)
+
+
+def _as_position_array(
+    positions: Union[PositionArray, Iterable[Dict], Iterable[ActivePosition]],
+) -> PositionArray:
+    """Adapt position dicts or ActivePosition objects to PositionArray"""
+    if isinstance(positions, PositionArray):
+        return positions
+    positions = list(positions)
+    if positions and isinstance(positions[0], ActivePosition):
+        return PositionArray.from_positions(positions)
+    return PositionArray.from_dicts(positions)
+
+
 @dataclass
 class TradeRiskAssessment:
     """Individual trade risk assessment"""
@@ -46,9 +151,19 @@ class VaRCalculator:
     Supports Historical, Parametric, and Monte Carlo methods
     """
 
+    # PCG64 generator shared by all calculators; Generator is not thread-safe
+    _rng = np.random.default_rng()
+    _rng_lock = threading.Lock()
+
     def __init__(self, confidence_level: float = 0.95):
         self.confidence_level = confidence_level
 
+        # Reusable Monte Carlo simulation buffer
+        self._mc_buf: Optional[np.ndarray] = None
+
+        # Parametric VaR per unit of position value, keyed on array identity
+        self._parametric_cache: OrderedDict = OrderedDict()
+
     def historical_var(
         self, returns: np.ndarray, position_value: float
     ) -> Tuple[float, float]:
@@ -66,17 +181,8 @@ class VaRCalculator:
             # Insufficient data, use conservative estimate
             return position_value * 0.05, position_value * 0.10
 
-        # Sort returns
-        sorted_returns = np.sort(returns)
-
-        # Calculate VaR at different confidence levels
-        var_95_idx = int(len(sorted_returns) * 0.05)
-        var_99_idx = int(len(sorted_returns) * 0.01)
-
-        var_95 = abs(sorted_returns[var_95_idx] * position_value)
-        var_99 = abs(sorted_returns[var_99_idx] * position_value)
-
-        return var_95, var_99
+        var_95, var_99 = historical_var_kernel(returns, position_value)
+        return float(var_95), float(var_99)
 
     def parametric_var(
         self, returns: np.ndarray, position_value: float
@@ -91,22 +197,32 @@ class VaRCalculator:
         Returns:
             (var_95, var_99)
         """
-        if len(returns) < 30:
+        # Lists (e.g. returns_history) become float64 arrays for the kernel;
+        # float64 arrays pass through as the same object
+        values = np.asarray(returns, dtype=np.float64)
+        if len(values) < 30:
             return position_value * 0.05, position_value * 0.10
 
-        # Calculate mean and std
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
-
-        # Z-scores for confidence levels
-        z_95 = stats.norm.ppf(0.05)  # -1.645
-        z_99 = stats.norm.ppf(0.01)  # -2.326
-
-        # Calculate VaR
-        var_95 = abs((mean_return + z_95 * std_return) * position_value)
-        var_99 = abs((mean_return + z_99 * std_return) * position_value)
-
-        return var_95, var_99
+        # Only read-only input arrays are memoized: they cannot change in
+        # place, and holding a reference keeps their id from being reused.
+        # A converted copy is never cached, as it is new on every call.
+        if values is not returns or values.flags.writeable:
+            var_95, var_99 = parametric_var_kernel(values, position_value, Z_95, Z_99)
+            return float(var_95), float(var_99)
+
+        key = id(returns)
+        cached = self._parametric_cache.get(key)
+        if cached is not None and cached[0] is returns:
+            self._parametric_cache.move_to_end(key)
+            _, unit_95, unit_99 = cached
+        else:
+            unit_95, unit_99 = parametric_var_kernel(returns, 1.0, Z_95, Z_99)
+            self._parametric_cache[key] = (returns, float(unit_95), float(unit_99))
+            if len(self._parametric_cache) > PARAMETRIC_CACHE_SIZE:
+                self._parametric_cache.popitem(last=False)
+
+        scale = abs(position_value)
+        return float(unit_95 * scale), float(unit_99 * scale)
 
     def monte_carlo_var(
         self,
@@ -129,20 +245,37 @@ class VaRCalculator:
             return position_value * 0.05, position_value * 0.10
 
         # Estimate parameters
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
+        mean_return = float(np.mean(returns))
+        std_return = float(np.std(returns))
 
-        # Generate random scenarios
-        simulated_returns = np.random.normal(
-            mean_return, std_return, num_simulations
+        return self._simulate_var(
+            mean_return, std_return, position_value, num_simulations
         )
 
-        # Calculate potential losses
-        simulated_values = simulated_returns * position_value
-
-        # Calculate VaR
-        var_95 = abs(np.percentile(simulated_values, 5))
-        var_99 = abs(np.percentile(simulated_values, 1))
+    def _simulate_var(
+        self,
+        mean_return: float,
+        std_return: float,
+        position_value: float,
+        num_simulations: int,
+    ) -> Tuple[float, float]:
+        """Simulate normal returns with the given moments and read both VaR tails"""
+        # Simulate returns in place into the reusable buffer
+        if self._mc_buf is None or len(self._mc_buf) != num_simulations:
+            self._mc_buf = np.empty(num_simulations)
+        simulated_returns = self._mc_buf
+        with self._rng_lock:
+            self._rng.standard_normal(out=simulated_returns)
+        simulated_returns *= std_return
+        simulated_returns += mean_return
+
+        # One in-place partial sort for both tails, scaled afterwards
+        k_99 = max(1, int(num_simulations * 0.01))
+        k_95 = max(1, int(num_simulations * 0.05))
+        simulated_returns.partition((k_99, k_95))
+
+        var_95 = abs(float(simulated_returns[k_95]) * position_value)
+        var_99 = abs(float(simulated_returns[k_99]) * position_value)
 
         return var_95, var_99
 
@@ -163,14 +296,52 @@ class VaRCalculator:
         if len(returns) < 30:
             return position_value * 0.08
 
-        sorted_returns = np.sort(returns)
-        var_95_idx = int(len(sorted_returns) * 0.05)
-
         # Average of worst 5% scenarios
-        worst_returns = sorted_returns[:var_95_idx]
-        cvar = abs(np.mean(worst_returns) * position_value)
+        return float(conditional_var_kernel(returns, position_value))
+
+    def compute_all(
+        self,
+        returns: np.ndarray,
+        position_value: float,
+        num_simulations: int = 10000,
+    ) -> Dict[str, Tuple[float, float]]:
+        """
+        All VaR estimates from one partial sort and one pass for the moments
 
-        return cvar
+        Args:
+            returns: Array of historical returns
+            position_value: Current position value
+            num_simulations: Number of Monte Carlo simulations
+
+        Returns:
+            Dict with historical, parametric and monte_carlo (var_95, var_99)
+            tuples and cvar_95
+        """
+        if len(returns) < 30:
+            fallback = (position_value * 0.05, position_value * 0.10)
+            return {
+                "historical": fallback,
+                "parametric": fallback,
+                "monte_carlo": fallback,
+                "cvar_95": position_value * 0.08,
+            }
+
+        var_95, var_99, cvar_95 = historical_tail_kernel(returns, position_value)
+
+        mean_return = float(np.mean(returns))
+        std_return = float(np.std(returns))
+
+        return {
+            "historical": (float(var_95), float(var_99)),
+            "parametric": (
+                abs((mean_return + Z_95 * std_return) * position_value),
+                abs((mean_return + Z_99 * std_return) * position_value),
+            ),
+            "monte_carlo": self._simulate_var(
+                mean_return, std_return, position_value, num_simulations
+            ),
+            "cvar_95": float(cvar_95),
+        }
 
 
 class PortfolioRiskAnalyzer:
@@ -192,47 +363,54 @@ class PortfolioRiskAnalyzer:
 
     def calculate_portfolio_var(
         self,
-        positions: List[Dict],
+        positions: Union[PositionArray, List[Dict]],
         returns_history: Dict[str, np.ndarray],
     ) -> float:
         """
         Calculate portfolio-level VaR
 
         Args:
-            positions: List of position dicts
+            positions: PositionArray or list of position dicts
             returns_history: Historical returns per symbol
 
         Returns:
             Portfolio VaR percentage
         """
-        if not positions:
+        if not len(positions):
             return 0.0
 
-        total_value = sum(p["size_usd"] for p in positions)
+        arr = _as_position_array(positions)
+        sizes = arr.sizes
+        total_value = float(sizes.sum())
         if total_value == 0:
             return 0.0
 
-        # Calculate individual VaRs
-        position_vars = []
-        for pos in positions:
-            symbol = pos["symbol"]
-            returns = returns_history.get(symbol, np.array([]))
+        # Conservative 5% estimate unless there is enough return history
+        position_vars = sizes * 0.05
 
-            if len(returns) > 0:
-                var_95, _ = self.var_calc.parametric_var(
-                    returns, pos["size_usd"]
-                )
-                position_vars.append(var_95)
-            else:
-                # Conservative estimate
-                position_vars.append(pos["size_usd"] * 0.05)
+        histories = [
+            np.asarray(returns_history.get(symbol, ()), dtype=np.float64)
+            for symbol in arr.symbols.tolist()
+        ]
+        rows = [i for i, r in enumerate(histories) if len(r) >= 30]
+
+        if rows:
+            # Stack histories into a NaN-padded matrix and reduce all rows at once
+            max_len = max(len(histories[i]) for i in rows)
+            stacked = np.full((len(rows), max_len), np.nan)
+            for row, i in enumerate(rows):
+                stacked[row, : len(histories[i])] = histories[i]
+
+            means = np.nanmean(stacked, axis=1)
+            stds = np.nanstd(stacked, axis=1)
+            position_vars[rows] = np.abs((means + Z_95 * stds) * sizes[rows])
 
         # Simple addition (conservative, assumes perfect correlation)
         # TODO: Add correlation matrix for more accurate calculation
-        portfolio_var = sum(position_vars)
+        portfolio_var = position_vars.sum()
         portfolio_var_pct = portfolio_var / total_value
 
-        return portfolio_var_pct
+        return float(portfolio_var_pct)
 
     def calculate_max_drawdown(self, equity_curve: np.ndarray) -> float:
         """
@@ -247,6 +425,12 @@ class PortfolioRiskAnalyzer:
         if len(equity_curve) < 2:
             return 0.0
 
+        if NUMBA_AVAILABLE:
+            # Compiled single pass: tracks the peak as a scalar
+            return float(
+                max_drawdown_kernel(np.asarray(equity_curve, dtype=np.float64))
+            )
+
         # Calculate running maximum
         running_max = np.maximum.accumulate(equity_curve)
 
@@ -254,10 +438,37 @@ class PortfolioRiskAnalyzer:
         drawdown = (equity_curve - running_max) / running_max
 
         # Maximum drawdown
-        max_dd = abs(np.min(drawdown))
+        max_dd = abs(float(np.min(drawdown)))
 
         return max_dd
 
+    def calculate_ratios(
+        self, returns: np.ndarray, risk_free_rate: float = 0.02
+    ) -> Tuple[float, float]:
+        """
+        Calculate Sharpe and Sortino ratios together
+
+        Args:
+            returns: Array of returns
+            risk_free_rate: Annual risk-free rate
+
+        Returns:
+            (sharpe_ratio, sortino_ratio)
+        """
+        if len(returns) < 2:
+            return 0.0, 0.0
+
+        if NUMBA_AVAILABLE:
+            sharpe, sortino = sharpe_sortino_kernel(
+                np.asarray(returns, dtype=np.float64), risk_free_rate / 252
+            )
+            return float(sharpe), float(sortino)
+
+        return (
+            self.calculate_sharpe_ratio(returns, risk_free_rate),
+            self.calculate_sortino_ratio(returns, risk_free_rate),
+        )
+
     def calculate_sharpe_ratio(
         self, returns: np.ndarray, risk_free_rate: float = 0.02
     ) -> float:
@@ -274,14 +485,17 @@ class PortfolioRiskAnalyzer:
         if len(returns) < 2:
             return 0.0
 
+        if NUMBA_AVAILABLE:
+            return self.calculate_ratios(returns, risk_free_rate)[0]
+
         excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free
-        mean_excess = np.mean(excess_returns)
-        std_excess = np.std(excess_returns)
+        mean_excess = float(np.mean(excess_returns))
+        std_excess = float(np.std(excess_returns))
 
         if std_excess == 0:
             return 0.0
 
-        sharpe = mean_excess / std_excess * np.sqrt(252)  # Annualized
+        sharpe = mean_excess / std_excess * math.sqrt(252)  # Annualized
 
         return sharpe
 
@@ -301,26 +515,29 @@ class PortfolioRiskAnalyzer:
         if len(returns) < 2:
             return 0.0
 
+        if NUMBA_AVAILABLE:
+            return self.calculate_ratios(returns, risk_free_rate)[1]
+
         excess_returns = returns - (risk_free_rate / 252)
-        mean_excess = np.mean(excess_returns)
+        mean_excess = float(np.mean(excess_returns))
 
         # Downside deviation (only negative returns)
         downside_returns = excess_returns[excess_returns < 0]
         if len(downside_returns) == 0:
             return float("inf")
 
-        downside_std = np.std(downside_returns)
+        downside_std = float(np.std(downside_returns))
 
         if downside_std == 0:
             return 0.0
 
-        sortino = mean_excess / downside_std * np.sqrt(252)
+        sortino = mean_excess / downside_std * math.sqrt(252)
 
         return sortino
 
     def calculate_portfolio_heat(
         self,
-        positions: List[Dict],
+        positions: Union[PositionArray, List[Dict]],
         account_balance: float,
     ) -> Dict[str, float]:
         """
@@ -329,7 +546,8 @@ class PortfolioRiskAnalyzer:
         Portfolio heat = sum of all position risks (entry to stop-loss distance)
 
         Args:
-            positions: List of open positions with entry_price, stop_loss, size
+            positions: PositionArray or list of open positions with entry_price,
+                stop_loss, size_usd
             account_balance: Current account balance in USDT
 
         Returns:
@@ -340,7 +558,7 @@ class PortfolioRiskAnalyzer:
                 - max_heat_allowed: Maximum allowed heat (6% of balance)
                 - heat_available: Remaining heat capacity
         """
-        if not positions or account_balance <= 0:
+        if not len(positions) or account_balance <= 0:
             return {
                 "total_heat_usd": 0.0,
                 "total_heat_pct": 0.0,
@@ -349,41 +567,34 @@ class PortfolioRiskAnalyzer:
                 "heat_available": account_balance * 0.06,
             }
 
+        arr = _as_position_array(positions)
+        entries, stops, sizes = arr.entries, arr.stops, arr.sizes
+        valid = (entries > 0) & (stops > 0) & (sizes > 0)
+
+        # Risk is the entry-to-stop distance; positions without a stop-loss
+        # are assumed to risk 5% (conservative)
+        safe_entries = np.where(entries > 0, entries, 1.0)
+        risk_pct = np.where(valid, np.abs((stops - entries) / safe_entries), 0.05)
+        heat_usd = sizes * risk_pct
+        total_heat_usd = float(heat_usd.sum())
+
         per_position_heat = []
-        total_heat_usd = 0.0
-
-        for pos in positions:
-            entry_price = pos.get("entry_price", 0)
-            stop_loss = pos.get("stop_loss", 0)
-            position_size_usd = pos.get("size_usd", 0)
-            symbol = pos.get("symbol", "UNKNOWN")
-
-            if entry_price > 0 and stop_loss > 0 and position_size_usd > 0:
-                # Calculate risk percentage (distance from entry to SL)
-                risk_pct = abs((stop_loss - entry_price) / entry_price)
-
-                # Calculate dollar risk for this position
-                position_heat_usd = position_size_usd * risk_pct
-
-                per_position_heat.append({
-                    "symbol": symbol,
-                    "position_size_usd": position_size_usd,
-                    "risk_pct": risk_pct,
-                    "heat_usd": position_heat_usd,
-                })
-
-                total_heat_usd += position_heat_usd
-            else:
-                # Position without stop-loss - assume 5% risk (conservative)
-                position_heat_usd = position_size_usd * 0.05
-                per_position_heat.append({
-                    "symbol": symbol,
-                    "position_size_usd": position_size_usd,
-                    "risk_pct": 0.05,
-                    "heat_usd": position_heat_usd,
-                    "warning": "No stop-loss set"
-                })
-                total_heat_usd += position_heat_usd
+        for symbol, size_usd, pos_risk_pct, pos_heat_usd, has_stop in zip(
+            arr.symbols.tolist(),
+            sizes.tolist(),
+            risk_pct.tolist(),
+            heat_usd.tolist(),
+            valid.tolist(),
+        ):
+            item = {
+                "symbol": symbol,
+                "position_size_usd": size_usd,
+                "risk_pct": pos_risk_pct,
+                "heat_usd": pos_heat_usd,
+            }
+            if not has_stop:
+                item["warning"] = "No stop-loss set"
+            per_position_heat.append(item)
 
         total_heat_pct = (total_heat_usd / account_balance) if account_balance > 0 else 0.0
         max_heat_allowed = account_balance * 0.06  # 6% maximum portfolio heat
@@ -427,7 +638,9 @@ class TradeValidator:
         reward_risk_ratio: float,
         current_portfolio_risk: float,
         account_balance: float,
-        existing_positions: List[Dict] = None,
+        existing_positions: Optional[
+            Union[PositionArray, Iterable[ActivePosition], Iterable[Dict]]
+        ] = None,
     ) -> TradeRiskAssessment:
         """
         Validate if trade should be approved
@@ -440,7 +653,9 @@ class TradeValidator:
             reward_risk_ratio: Expected R/R ratio
             current_portfolio_risk: Current portfolio risk %
             account_balance: Account balance
-            existing_positions: List of existing positions
+            existing_positions: Existing positions as a PositionArray, or an
+                iterable of ActivePosition or position dicts (list or dict
+                values view)
 
         Returns:
             TradeRiskAssessment
@@ -482,11 +697,11 @@ class TradeValidator:
         if existing_positions:
             # Simple check: count positions in same asset class
             # TODO: Implement proper correlation analysis
-            same_class_exposure = sum(
-                p["size_usd"]
-                for p in existing_positions
-                if p["symbol"].split("/")[0]
-                == symbol.split("/")[0]  # Same base currency
+            existing_positions = _as_position_array(existing_positions)
+            same_class_exposure = float(
+                existing_positions.sizes[
+                    existing_positions.bases == _base(symbol)  # Same base currency
+                ].sum()
             )
             correlation_pct = same_class_exposure / account_balance
 
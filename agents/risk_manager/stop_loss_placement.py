@@ -3,11 +3,15 @@ Stop-Loss and Take-Profit Placement Module
 Dynamic stop-loss and take-profit calculation based on market conditions.
 """
 
-from typing import Dict, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+import math
 import numpy as np
 
+from core.jit import njit
+
 
 class StopLossMethod(str, Enum):
     """Stop-loss placement methods"""
@@ -19,7 +23,144 @@ class StopLossMethod(str, Enum):
     TRAILING = "trailing"  # Trailing stop
 
 
-@dataclass
+# Scalar stop kernels. side_sign is +1 for BUY and -1 for SELL. No fastmath,
+# so compiled results match the interpreted arithmetic bit for bit.
+# Explicit float64/int8 signatures compile (or load from cache) at import,
+# keeping compilation out of the first trade.
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, i1)", cache=True)
+def _atr_stops(
+    price: float, atr: float, multiplier: float, rr_ratio: float, side_sign: int
+) -> Tuple[float, float]:
+    """(stop_loss, take_profit) at multiplier x ATR from price"""
+    stop_distance = atr * multiplier
+    stop_loss = price - side_sign * stop_distance
+    take_profit = price + side_sign * stop_distance * rr_ratio
+    return stop_loss, take_profit
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, i1)", cache=True)
+def _pct_stops(
+    price: float, stop_pct: float, rr_ratio: float, side_sign: int
+) -> Tuple[float, float]:
+    """(stop_loss, take_profit) at a fixed percentage from price"""
+    stop_loss = price * (1 - side_sign * stop_pct)
+    take_profit = price * (1 + side_sign * (stop_pct * rr_ratio))
+    return stop_loss, take_profit
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, i1)", cache=True)
+def _vol_stops(
+    price: float, price_std: float, multiplier: float, rr_ratio: float, side_sign: int
+) -> Tuple[float, float]:
+    """(stop_loss, take_profit) at multiplier x standard deviation from price"""
+    stop_distance = price_std * multiplier
+    stop_loss = price - side_sign * stop_distance
+    take_profit = price + side_sign * stop_distance * rr_ratio
+    return stop_loss, take_profit
+
+
+@njit("UniTuple(f8, 2)(f8, f8, f8, f8, f8, i1)", cache=True)
+def _sr_stops(
+    price: float,
+    support: float,
+    resistance: float,
+    buffer_pct: float,
+    rr_ratio: float,
+    side_sign: int,
+) -> Tuple[float, float]:
+    """(stop_loss, take_profit) placed beyond support/resistance levels"""
+    # BUY: stop below support, target resistance. SELL: the mirror image
+    stop_level = support if side_sign > 0 else resistance
+    target_level = resistance if side_sign > 0 else support
+
+    stop_loss = stop_level * (1 - side_sign * buffer_pct)
+    risk = side_sign * (price - stop_loss)
+
+    # Take profit at the level or R/R ratio, whichever is further;
+    # sign * max(sign * a, sign * b) is max for BUY and min for SELL
+    tp_by_rr = price + side_sign * risk * rr_ratio
+    tp_by_level = target_level * (1 - side_sign * buffer_pct)
+    take_profit = side_sign * max(side_sign * tp_by_rr, side_sign * tp_by_level)
+
+    return stop_loss, take_profit
+
+
+@njit("f8(f8, f8, f8, f8, f8, i1)", cache=True)
+def _trailing_stop(
+    price: float,
+    current_stop: float,
+    entry_price: float,
+    trail_pct: float,
+    activation_pct: float,
+    side_sign: int,
+) -> float:
+    """Trailing stop that only ever moves in the position's favour"""
+    activation_price = entry_price * (1 + side_sign * activation_pct)
+    if side_sign * price < side_sign * activation_price:
+        return current_stop
+
+    # Only move the stop towards profit: up for BUY, down for SELL
+    new_stop = price * (1 - side_sign * trail_pct)
+    return side_sign * max(side_sign * current_stop, side_sign * new_stop)
+
+
+def _side_signs(sides: Sequence) -> np.ndarray:
+    """+1/-1 int8 signs from 'BUY'/'SELL' strings or signed numbers"""
+    sides = np.asarray(sides)
+    if sides.dtype.kind in "iuf":
+        return np.where(sides > 0, 1, -1).astype(np.int8)
+    return np.where(sides == "BUY", 1, -1).astype(np.int8)
+
+
+# Stops are rounded half-up to the cent by both calculate_stops and
+# calculate_stops_batch; non-finite values pass through unchanged
+
+
+def _round_cents(value: float) -> float:
+    """value rounded half-up to the cent"""
+    scaled = value * 100 + 0.5
+    return math.floor(scaled) / 100 if math.isfinite(scaled) else value
+
+
+def _round_cents_array(values: np.ndarray) -> np.ndarray:
+    """_round_cents for every element, in place"""
+    scaled = values * 100 + 0.5
+    finite = np.isfinite(scaled)
+    np.floor(scaled, out=scaled)
+    scaled /= 100
+    np.copyto(values, scaled, where=finite)
+    return values
+
+
+# Distinct (price, ATR/std, side) inputs remembered by the stop caches
+STOP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=STOP_CACHE_SIZE)
+def _cached_atr_stops(
+    price: float, atr: float, multiplier: float, rr_ratio: float, side_sign: int
+) -> Tuple[float, float]:
+    """Memoized _atr_stops for prices and ATRs repeated within a tick"""
+    return _atr_stops(price, atr, multiplier, rr_ratio, side_sign)
+
+
+@lru_cache(maxsize=STOP_CACHE_SIZE)
+def _cached_vol_stops(
+    price: float, price_std: float, multiplier: float, rr_ratio: float, side_sign: int
+) -> Tuple[float, float]:
+    """Memoized _vol_stops for prices and deviations repeated within a tick"""
+    return _vol_stops(price, price_std, multiplier, rr_ratio, side_sign)
+
+
+# Keys of StopLossLevels metadata, in the order of StopLossLevels.inputs
+STOP_LEVEL_INPUT_KEYS = (
+    "symbol", "current_price", "side", "atr", "price_std", "support", "resistance"
+)
+
+
+@dataclass(slots=True)
 class StopLossLevels:
     """Stop-loss and take-profit levels"""
 
@@ -29,8 +170,77 @@ class StopLossLevels:
     take_profit_pct: float
     reward_risk_ratio: float
     method: str
-    reasoning: str
-    metadata: Dict
+    metadata: Optional[Dict] = None
+    # Raw calculation inputs (see STOP_LEVEL_INPUT_KEYS); metadata is built
+    # from them on demand
+    inputs: Optional[Tuple] = field(default=None, repr=False, compare=False)
+
+    def get_metadata(self) -> Dict:
+        """Calculation inputs as a dict, built on first request"""
+        if self.metadata is None:
+            self.metadata = dict(zip(STOP_LEVEL_INPUT_KEYS, self.inputs or ()))
+        return self.metadata
+
+    @property
+    def reasoning(self) -> str:
+        """Human-readable summary, formatted only when requested"""
+        return (
+            f"Stop: ${self.stop_loss:,.2f} ({self.stop_loss_pct:.1%}) | "
+            f"TP: ${self.take_profit:,.2f} ({self.take_profit_pct:.1%}) | "
+            f"R/R: {self.reward_risk_ratio:.2f}:1 | "
+            f"Method: {self.method}"
+        )
+
+    def __str__(self) -> str:
+        return self.reasoning
+
+
+@dataclass
+class StopLossBatch:
+    """
+    Stop-loss and take-profit levels for many symbols as column arrays
+
+    Per-symbol StopLossLevels objects are only built when indexed.
+    """
+
+    symbols: List[str]
+    current_price: np.ndarray
+    side_sign: np.ndarray  # int8: +1 BUY, -1 SELL
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+    stop_loss_pct: np.ndarray
+    take_profit_pct: np.ndarray
+    reward_risk_ratio: np.ndarray
+    methods: np.ndarray  # object: method name per symbol
+    atr: Optional[np.ndarray] = None
+    price_std: Optional[np.ndarray] = None
+    support: Optional[np.ndarray] = None
+    resistance: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, index: int) -> StopLossLevels:
+        def column(values: Optional[np.ndarray]) -> Optional[float]:
+            return None if values is None else float(values[index])
+
+        return StopLossLevels(
+            stop_loss=float(self.stop_loss[index]),
+            take_profit=float(self.take_profit[index]),
+            stop_loss_pct=float(self.stop_loss_pct[index]),
+            take_profit_pct=float(self.take_profit_pct[index]),
+            reward_risk_ratio=float(self.reward_risk_ratio[index]),
+            method=self.methods[index],
+            inputs=(
+                self.symbols[index],
+                float(self.current_price[index]),
+                "BUY" if self.side_sign[index] > 0 else "SELL",
+                column(self.atr),
+                column(self.price_std),
+                column(self.support),
+                column(self.resistance),
+            ),
+        )
 
 
 class ATRStopLoss:
@@ -61,16 +271,13 @@ class ATRStopLoss:
         Returns:
             (stop_loss, take_profit)
         """
-        stop_distance = atr * self.atr_multiplier
-
-        if side == "BUY":
-            stop_loss = current_price - stop_distance
-            take_profit = current_price + (stop_distance * self.rr_ratio)
-        else:  # SELL
-            stop_loss = current_price + stop_distance
-            take_profit = current_price - (stop_distance * self.rr_ratio)
-
-        return stop_loss, take_profit
+        return _atr_stops(
+            current_price,
+            atr,
+            self.atr_multiplier,
+            self.rr_ratio,
+            1 if side == "BUY" else -1,
+        )
 
 
 class PercentageStopLoss:
@@ -100,18 +307,9 @@ class PercentageStopLoss:
         Returns:
             (stop_loss, take_profit)
         """
-        if side == "BUY":
-            stop_loss = current_price * (1 - self.stop_pct)
-            take_profit = current_price * (
-                1 + (self.stop_pct * self.rr_ratio)
-            )
-        else:  # SELL
-            stop_loss = current_price * (1 + self.stop_pct)
-            take_profit = current_price * (
-                1 - (self.stop_pct * self.rr_ratio)
-            )
-
-        return stop_loss, take_profit
+        return _pct_stops(
+            current_price, self.stop_pct, self.rr_ratio, 1 if side == "BUY" else -1
+        )
 
 
 class VolatilityStopLoss:
@@ -141,16 +339,13 @@ class VolatilityStopLoss:
         Returns:
             (stop_loss, take_profit)
         """
-        stop_distance = price_std * self.std_multiplier
-
-        if side == "BUY":
-            stop_loss = current_price - stop_distance
-            take_profit = current_price + (stop_distance * self.rr_ratio)
-        else:  # SELL
-            stop_loss = current_price + stop_distance
-            take_profit = current_price - (stop_distance * self.rr_ratio)
-
-        return stop_loss, take_profit
+        return _vol_stops(
+            current_price,
+            price_std,
+            self.std_multiplier,
+            self.rr_ratio,
+            1 if side == "BUY" else -1,
+        )
 
 
 class SupportResistanceStopLoss:
@@ -186,33 +381,14 @@ class SupportResistanceStopLoss:
         Returns:
             (stop_loss, take_profit)
         """
-        if side == "BUY":
-            # Place stop below support
-            stop_loss = support_level * (1 - self.buffer_pct)
-
-            # Calculate risk
-            risk = current_price - stop_loss
-
-            # Take profit at resistance or R/R ratio, whichever is further
-            tp_by_rr = current_price + (risk * self.rr_ratio)
-            tp_by_resistance = resistance_level * (1 - self.buffer_pct)
-
-            take_profit = max(tp_by_rr, tp_by_resistance)
-
-        else:  # SELL
-            # Place stop above resistance
-            stop_loss = resistance_level * (1 + self.buffer_pct)
-
-            # Calculate risk
-            risk = stop_loss - current_price
-
-            # Take profit at support or R/R ratio
-            tp_by_rr = current_price - (risk * self.rr_ratio)
-            tp_by_support = support_level * (1 + self.buffer_pct)
-
-            take_profit = min(tp_by_rr, tp_by_support)
-
-        return stop_loss, take_profit
+        return _sr_stops(
+            current_price,
+            support_level,
+            resistance_level,
+            self.buffer_pct,
+            self.rr_ratio,
+            1 if side == "BUY" else -1,
+        )
 
 
 class TrailingStopLoss:
@@ -241,12 +417,9 @@ class TrailingStopLoss:
         Returns:
             (stop_loss, activation_price)
         """
-        if side == "BUY":
-            stop_loss = entry_price * (1 - self.trail_pct)
-            activation_price = entry_price * (1 + self.activation_pct)
-        else:  # SELL
-            stop_loss = entry_price * (1 + self.trail_pct)
-            activation_price = entry_price * (1 - self.activation_pct)
+        side_sign = 1 if side == "BUY" else -1
+        stop_loss = entry_price * (1 - side_sign * self.trail_pct)
+        activation_price = entry_price * (1 + side_sign * self.activation_pct)
 
         return stop_loss, activation_price
 
@@ -269,25 +442,59 @@ class TrailingStopLoss:
         Returns:
             Updated stop-loss level
         """
-        if side == "BUY":
-            # Check if we've reached activation
-            if current_price >= entry_price * (1 + self.activation_pct):
-                # Calculate new trailing stop
-                new_stop = current_price * (1 - self.trail_pct)
+        return _trailing_stop(
+            current_price,
+            current_stop,
+            entry_price,
+            self.trail_pct,
+            self.activation_pct,
+            1 if side == "BUY" else -1,
+        )
+
+    def update_trailing_stop_batch(
+        self,
+        current_prices: Sequence[float],
+        current_stops: Sequence[float],
+        entry_prices: Sequence[float],
+        sides: Sequence,
+    ) -> np.ndarray:
+        """
+        Update trailing stops of many positions at once
 
-                # Only move stop up, never down
-                return max(current_stop, new_stop)
+        Same rule as update_trailing_stop, expressed with np.where/np.maximum
+        so a whole portfolio is updated in a handful of array operations.
 
-        else:  # SELL
-            # Check if we've reached activation
-            if current_price <= entry_price * (1 - self.activation_pct):
-                # Calculate new trailing stop
-                new_stop = current_price * (1 + self.trail_pct)
+        Args:
+            current_prices: Current market price per position
+            current_stops: Current stop-loss level per position
+            entry_prices: Original entry price per position
+            sides: 'BUY'/'SELL' strings or +1/-1 signs
 
-                # Only move stop down, never up
-                return min(current_stop, new_stop)
+        Returns:
+            Updated stop-loss levels
+        """
+        prices = np.asarray(current_prices, dtype=np.float64)
+        stops = np.asarray(current_stops, dtype=np.float64)
+        entries = np.asarray(entry_prices, dtype=np.float64)
+        sign = _side_signs(sides)
+
+        activation_price = entries * (1 + sign * self.activation_pct)
+        active = sign * prices >= sign * activation_price
+
+        # Only move the stop towards profit: up for BUY, down for SELL
+        new_stops = prices * (1 - sign * self.trail_pct)
+        return np.where(
+            active, sign * np.maximum(sign * stops, sign * new_stops), stops
+        )
 
-        return current_stop
+
+# Default stop strategies, shared by every StopLossManager that does not
+# override them. Treat them as read-only configuration.
+_DEFAULT_ATR_STOP = ATRStopLoss(atr_multiplier=2.0, rr_ratio=2.0)
+_DEFAULT_PCT_STOP = PercentageStopLoss(stop_pct=0.05, rr_ratio=2.0)
+_DEFAULT_VOL_STOP = VolatilityStopLoss(std_multiplier=2.0, rr_ratio=2.0)
+_DEFAULT_SR_STOP = SupportResistanceStopLoss(buffer_pct=0.01, rr_ratio=2.0)
+_DEFAULT_TRAILING_STOP = TrailingStopLoss(trail_pct=0.03, activation_pct=0.05)
 
 
 class StopLossManager:
@@ -300,20 +507,21 @@ class StopLossManager:
         self,
         default_method: StopLossMethod = StopLossMethod.ATR,
         default_rr_ratio: float = 2.0,
+        atr_stop: Optional[ATRStopLoss] = None,
+        pct_stop: Optional[PercentageStopLoss] = None,
+        vol_stop: Optional[VolatilityStopLoss] = None,
+        sr_stop: Optional[SupportResistanceStopLoss] = None,
+        trailing_stop: Optional[TrailingStopLoss] = None,
     ):
         self.default_method = default_method
         self.default_rr_ratio = default_rr_ratio
 
-        # Initialize all methods
-        self.atr_stop = ATRStopLoss(atr_multiplier=2.0, rr_ratio=2.0)
-        self.pct_stop = PercentageStopLoss(stop_pct=0.05, rr_ratio=2.0)
-        self.vol_stop = VolatilityStopLoss(std_multiplier=2.0, rr_ratio=2.0)
-        self.sr_stop = SupportResistanceStopLoss(
-            buffer_pct=0.01, rr_ratio=2.0
-        )
-        self.trailing_stop = TrailingStopLoss(
-            trail_pct=0.03, activation_pct=0.05
-        )
+        # Use the shared default methods unless overridden
+        self.atr_stop = atr_stop or _DEFAULT_ATR_STOP
+        self.pct_stop = pct_stop or _DEFAULT_PCT_STOP
+        self.vol_stop = vol_stop or _DEFAULT_VOL_STOP
+        self.sr_stop = sr_stop or _DEFAULT_SR_STOP
+        self.trailing_stop = trailing_stop or _DEFAULT_TRAILING_STOP
 
     def calculate_stops(
         self,
@@ -356,15 +564,24 @@ class StopLossManager:
         else:
             method = method or self.default_method
 
-            if method == StopLossMethod.ATR and atr:
-                stop_loss, take_profit = self.atr_stop.calculate(
-                    current_price, atr, side
+            # Missing, zero or NaN inputs fall back to percentage stops
+            if method == StopLossMethod.ATR and atr and atr > 0:
+                stop_loss, take_profit = _cached_atr_stops(
+                    current_price,
+                    atr,
+                    self.atr_stop.atr_multiplier,
+                    self.atr_stop.rr_ratio,
+                    1 if side == "BUY" else -1,
                 )
                 method_name = "ATR-based"
 
-            elif method == StopLossMethod.VOLATILITY and price_std:
-                stop_loss, take_profit = self.vol_stop.calculate(
-                    current_price, price_std, side
+            elif method == StopLossMethod.VOLATILITY and price_std and price_std > 0:
+                stop_loss, take_profit = _cached_vol_stops(
+                    current_price,
+                    price_std,
+                    self.vol_stop.std_multiplier,
+                    self.vol_stop.rr_ratio,
+                    1 if side == "BUY" else -1,
                 )
                 method_name = "Volatility-based"
 
@@ -372,6 +589,8 @@ class StopLossManager:
                 method == StopLossMethod.SUPPORT_RESISTANCE
                 and support
                 and resistance
+                and support > 0
+                and resistance > 0
             ):
                 stop_loss, take_profit = self.sr_stop.calculate(
                     current_price, support, resistance, side
@@ -385,28 +604,16 @@ class StopLossManager:
                 )
                 method_name = "Fixed Percentage"
 
-        # Calculate percentages
-        if side == "BUY":
-            stop_loss_pct = abs(current_price - stop_loss) / current_price
-            take_profit_pct = abs(take_profit - current_price) / current_price
-        else:  # SELL
-            stop_loss_pct = abs(stop_loss - current_price) / current_price
-            take_profit_pct = abs(current_price - take_profit) / current_price
+        # Calculate percentages (distances are symmetric in side)
+        stop_loss_pct = abs(current_price - stop_loss) / current_price
+        take_profit_pct = abs(take_profit - current_price) / current_price
 
         # Calculate R/R ratio
         reward_risk_ratio = take_profit_pct / stop_loss_pct if stop_loss_pct > 0 else 1.0
 
         # Round to reasonable precision
-        stop_loss = round(stop_loss, 2)
-        take_profit = round(take_profit, 2)
-
-        # Build reasoning
-        reasoning = (
-            f"Stop: ${stop_loss:,.2f} ({stop_loss_pct:.1%}) | "
-            f"TP: ${take_profit:,.2f} ({take_profit_pct:.1%}) | "
-            f"R/R: {reward_risk_ratio:.2f}:1 | "
-            f"Method: {method_name}"
-        )
+        stop_loss = _round_cents(stop_loss)
+        take_profit = _round_cents(take_profit)
 
         return StopLossLevels(
             stop_loss=stop_loss,
@@ -415,14 +622,129 @@ class StopLossManager:
             take_profit_pct=take_profit_pct,
             reward_risk_ratio=reward_risk_ratio,
             method=method_name,
-            reasoning=reasoning,
-            metadata={
-                "symbol": symbol,
-                "current_price": current_price,
-                "side": side,
-                "atr": atr,
-                "price_std": price_std,
-                "support": support,
-                "resistance": resistance,
-            },
+            inputs=(
+                symbol, current_price, side, atr, price_std, support, resistance
+            ),
+        )
+
+    def calculate_stops_batch(
+        self,
+        symbols: List[str],
+        current_prices: Sequence[float],
+        sides: Sequence,
+        method: Optional[StopLossMethod] = None,
+        atrs: Optional[Sequence[float]] = None,
+        price_stds: Optional[Sequence[float]] = None,
+        supports: Optional[Sequence[float]] = None,
+        resistances: Optional[Sequence[float]] = None,
+    ) -> StopLossBatch:
+        """
+        Calculate stop-loss and take-profit levels for many symbols at once
+
+        Mirrors calculate_stops row by row: symbols lacking the inputs of the
+        requested method (missing, zero or NaN) fall back to fixed percentage.
+
+        Args:
+            symbols: Trading symbols
+            current_prices: Current market prices
+            sides: 'BUY'/'SELL' strings or +1/-1 signs
+            method: Stop-loss method to use for every symbol
+            atrs: Average True Range per symbol
+            price_stds: Price standard deviation per symbol
+            supports: Support level per symbol
+            resistances: Resistance level per symbol
+
+        Returns:
+            StopLossBatch with one row per symbol
+        """
+        method = method or self.default_method
+        prices = np.asarray(current_prices, dtype=np.float64)
+
+        sign = _side_signs(sides)
+
+        def column(values: Optional[Sequence[float]]) -> Optional[np.ndarray]:
+            return None if values is None else np.asarray(values, dtype=np.float64)
+
+        atr = column(atrs)
+        price_std = column(price_stds)
+        support = column(supports)
+        resistance = column(resistances)
+
+        # Fixed percentage is the fallback for every row
+        pct, pct_rr = self.pct_stop.stop_pct, self.pct_stop.rr_ratio
+        stop_loss = prices * (1 - sign * pct)
+        take_profit = prices * (1 + sign * (pct * pct_rr))
+        methods = np.full(len(prices), "Fixed Percentage", dtype=object)
+
+        if method == StopLossMethod.ATR and atr is not None:
+            use = atr > 0
+            distance = atr * self.atr_stop.atr_multiplier
+            stop_loss = np.where(use, prices - sign * distance, stop_loss)
+            take_profit = np.where(
+                use, prices + sign * distance * self.atr_stop.rr_ratio, take_profit
+            )
+            methods[use] = "ATR-based"
+
+        elif method == StopLossMethod.VOLATILITY and price_std is not None:
+            use = price_std > 0
+            distance = price_std * self.vol_stop.std_multiplier
+            stop_loss = np.where(use, prices - sign * distance, stop_loss)
+            take_profit = np.where(
+                use, prices + sign * distance * self.vol_stop.rr_ratio, take_profit
+            )
+            methods[use] = "Volatility-based"
+
+        elif (
+            method == StopLossMethod.SUPPORT_RESISTANCE
+            and support is not None
+            and resistance is not None
+        ):
+            use = (support > 0) & (resistance > 0)
+            buffer, sr_rr = self.sr_stop.buffer_pct, self.sr_stop.rr_ratio
+            buy = sign > 0
+
+            # Stop beyond the level on the losing side, take profit at the
+            # opposite level or the R/R target, whichever is further
+            sr_stop = np.where(
+                buy, support * (1 - buffer), resistance * (1 + buffer)
+            )
+            # Signed risk as in _sr_stops: negative when price is already
+            # beyond the stop level, which pulls the R/R target inwards
+            risk = sign * (prices - sr_stop)
+            tp_by_rr = prices + sign * risk * sr_rr
+            sr_tp = np.where(
+                buy,
+                np.maximum(tp_by_rr, resistance * (1 - buffer)),
+                np.minimum(tp_by_rr, support * (1 + buffer)),
+            )
+            stop_loss = np.where(use, sr_stop, stop_loss)
+            take_profit = np.where(use, sr_tp, take_profit)
+            methods[use] = "Support/Resistance"
+
+        # Calculate percentages and R/R ratio
+        stop_loss_pct = np.abs(prices - stop_loss) / prices
+        take_profit_pct = np.abs(take_profit - prices) / prices
+        has_risk = stop_loss_pct > 0
+        reward_risk_ratio = np.where(
+            has_risk, take_profit_pct / np.where(has_risk, stop_loss_pct, 1.0), 1.0
+        )
+
+        # Round to reasonable precision in place; both arrays are fresh
+        _round_cents_array(stop_loss)
+        _round_cents_array(take_profit)
+
+        return StopLossBatch(
+            symbols=list(symbols),
+            current_price=prices,
+            side_sign=sign,
+            stop_loss=stop_loss,
+            take_profit=take_profit,
+            stop_loss_pct=stop_loss_pct,
+            take_profit_pct=take_profit_pct,
+            reward_risk_ratio=reward_risk_ratio,
+            methods=methods,
+            atr=atr,
+            price_std=price_std,
+            support=support,
+            resistance=resistance,
         )
@@ -0,0 +1,169 @@
+"""
+VaR Kernels Module
+Compiled numeric kernels backing VaRCalculator and PortfolioRiskAnalyzer.
+
+Kernels are written in the NumPy subset supported by Numba. When Numba is
+not installed they run as plain NumPy functions with identical results.
+"""
+
+from typing import Tuple
+import numpy as np
+
+from core.jit import njit, NUMBA_AVAILABLE
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _lower_tail_mean(partitioned: np.ndarray, k: int) -> float:
+        """Mean of the first k elements, accumulated in one compiled loop"""
+        total = 0.0
+        for i in range(k):
+            total += partitioned[i]
+        return total / k
+
+else:
+
+    def _lower_tail_mean(partitioned: np.ndarray, k: int) -> float:
+        """Mean of the first k elements"""
+        return np.mean(partitioned[:k])
+
+
+@njit(cache=True, fastmath=True)
+def var_cvar_kernel(returns: np.ndarray, k: int) -> Tuple[float, float]:
+    """
+    k-th smallest return and the mean of the k returns below it.
+
+    One partition around k serves both VaR (the k-th value) and CVaR
+    (mean of the lower tail).
+    """
+    partitioned = np.partition(returns, k)
+    return partitioned[k], _lower_tail_mean(partitioned, k)
+
+
+@njit(cache=True, fastmath=True)
+def historical_tail_kernel(
+    returns: np.ndarray, position_value: float
+) -> Tuple[float, float, float]:
+    """
+    Historical (var_95, var_99, cvar_95) from one partial sort.
+
+    np.partition places the k smallest returns before index k, which is
+    all that both VaR (k-th value) and CVaR (mean below k) need.
+    """
+    n = len(returns)
+    k_99 = int(n * 0.01)
+    k_95 = int(n * 0.05)
+    partitioned = np.partition(returns, np.array([k_99, k_95]))
+
+    var_95 = abs(partitioned[k_95] * position_value)
+    var_99 = abs(partitioned[k_99] * position_value)
+    cvar_95 = abs(_lower_tail_mean(partitioned, k_95) * position_value)
+
+    return var_95, var_99, cvar_95
+
+
+@njit(cache=True, fastmath=True)
+def historical_var_kernel(
+    returns: np.ndarray, position_value: float
+) -> Tuple[float, float]:
+    """Historical (var_95, var_99) from the empirical return distribution"""
+    var_95, var_99, _ = historical_tail_kernel(returns, position_value)
+    return var_95, var_99
+
+
+@njit(cache=True, fastmath=True)
+def parametric_var_kernel(
+    returns: np.ndarray, position_value: float, z_95: float, z_99: float
+) -> Tuple[float, float]:
+    """Parametric (var_95, var_99) assuming normally distributed returns"""
+    mean_return = np.mean(returns)
+    std_return = np.std(returns)
+
+    var_95 = abs((mean_return + z_95 * std_return) * position_value)
+    var_99 = abs((mean_return + z_99 * std_return) * position_value)
+
+    return var_95, var_99
+
+
+@njit(cache=True, fastmath=True)
+def conditional_var_kernel(returns: np.ndarray, position_value: float) -> float:
+    """Expected shortfall: mean loss of the worst 5% of returns"""
+    _, tail_mean = var_cvar_kernel(returns, int(len(returns) * 0.05))
+    return abs(tail_mean * position_value)
+
+
+@njit(cache=True, fastmath=True)
+def max_drawdown_kernel(equity_curve: np.ndarray) -> float:
+    """Maximum peak-to-trough drawdown in a single pass without temporaries"""
+    peak = equity_curve[0]
+    max_dd = 0.0
+    for value in equity_curve:
+        if value > peak:
+            peak = value
+        drawdown = (peak - value) / peak
+        if drawdown > max_dd:
+            max_dd = drawdown
+    return max_dd
+
+
+# No fastmath: the kernel returns inf when there are no losing returns
+@njit(cache=True)
+def sharpe_sortino_kernel(
+    returns: np.ndarray, daily_risk_free: float
+) -> Tuple[float, float]:
+    """
+    Annualized (sharpe, sortino) from one pass over the returns.
+
+    Welford updates track mean and variance of all excess returns and of the
+    negative ones, matching np.mean/np.std without extra passes or masks.
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    neg_n = 0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+
+    for r in returns:
+        excess = r - daily_risk_free
+
+        n += 1
+        delta = excess - mean
+        mean += delta / n
+        m2 += delta * (excess - mean)
+
+        if excess < 0:
+            neg_n += 1
+            neg_delta = excess - neg_mean
+            neg_mean += neg_delta / neg_n
+            neg_m2 += neg_delta * (excess - neg_mean)
+
+    annualize = np.sqrt(252.0)
+
+    std = np.sqrt(m2 / n)
+    sharpe = 0.0 if std == 0 else mean / std * annualize
+
+    if neg_n == 0:
+        sortino = np.inf
+    else:
+        downside_std = np.sqrt(neg_m2 / neg_n)
+        sortino = 0.0 if downside_std == 0 else mean / downside_std * annualize
+
+    return sharpe, sortino
+
+
+def _warm_up() -> None:
+    """Compile (or load from cache) every kernel for float64 input"""
+    returns = np.linspace(-0.05, 0.05, 100)
+    var_cvar_kernel(returns, 5)
+    historical_tail_kernel(returns, 1.0)
+    historical_var_kernel(returns, 1.0)
+    parametric_var_kernel(returns, 1.0, -1.645, -2.326)
+    conditional_var_kernel(returns, 1.0)
+    max_drawdown_kernel(np.cumprod(1.0 + returns))
+    sharpe_sortino_kernel(returns, 0.0)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
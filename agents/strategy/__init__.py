@@ -9,8 +9,11 @@ from agents.strategy.signal_fusion import (
     ConsensusStrategy,
     TimeDecayFusion,
     HybridFusion,
+    FusionBatch,
+    LazyReasoning,
     Signal,
     SignalType,
+    resolve_reasoning,
 )
 
 __all__ = [
@@ -19,6 +22,9 @@ __all__ = [
     "ConsensusStrategy",
     "TimeDecayFusion",
     "HybridFusion",
+    "FusionBatch",
+    "LazyReasoning",
     "Signal",
     "SignalType",
+    "resolve_reasoning",
 ]
@@ -5,10 +5,12 @@ Combines signals from multiple analysis agents and generates trading decisions.
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
 import asyncio
+import time
 from collections import defaultdict
-import json
+
+import numpy as np
+import orjson
 
 from agents.base.agent import BaseAgent
 from agents.base.protocol import (
@@ -23,19 +25,85 @@ from agents.strategy.signal_fusion import (
     ConsensusStrategy,
     TimeDecayFusion,
     HybridFusion,
+    SIGNAL_CODES,
     Signal as FusionSignal,
+    resolve_reasoning,
 )
-from infrastructure.database.postgresql import get_db, PostgreSQLDatabase
+from infrastructure.database.postgresql import get_db, BatchWriter, PostgreSQLDatabase
 from core.config.settings import settings
 
+# Fusion result keys stored in their own columns rather than fusion_details
+FUSION_SUMMARY_KEYS = frozenset({"signal", "confidence", "reasoning"})
+
+# Decision persistence is batched: flush when full or when the window closes
+DECISION_BATCH_SIZE = 64
+DECISION_FLUSH_INTERVAL = 0.5  # seconds
+
+INSERT_STRATEGY_DECISION_QUERY = """
+    INSERT INTO strategy_decisions (
+        symbol, signal_type, confidence, fusion_strategy,
+        num_signals, reasoning, fusion_details,
+        price_target, stop_loss, take_profit, metadata
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+"""
+
+
+# Initial per-symbol signal buffer capacity; grows by doubling
+SIGNAL_BUFFER_CAPACITY = 16
+
 
-@dataclass
 class SignalBuffer:
-    """Buffer for collecting signals by symbol"""
+    """
+    Buffer for collecting signals by symbol
 
-    signals: List[TradingSignal] = field(default_factory=list)
-    last_decision: Optional[datetime] = None
-    pending_count: int = 0
+    Expiry deadlines, confidences and signal types are kept in parallel
+    NumPy arrays so freshness checks are single vectorized comparisons;
+    the TradingSignal objects sit in a sidecar list at the same positions.
+    """
+
+    def __init__(self, capacity: int = SIGNAL_BUFFER_CAPACITY):
+        # time.monotonic() deadline of each buffered signal
+        self.expiries = np.empty(capacity, dtype=np.float64)
+        self.confidences = np.empty(capacity, dtype=np.float32)
+        self.signal_types = np.empty(capacity, dtype=np.int8)
+        self.signals: List[TradingSignal] = []
+        self.size = 0
+
+        self.last_decision: Optional[datetime] = None
+        self.pending_count = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(self, signal: TradingSignal, expiry: float) -> None:
+        """Add a signal with its monotonic expiry deadline"""
+        if self.size == len(self.expiries):
+            capacity = 2 * len(self.expiries)
+            self.expiries = np.resize(self.expiries, capacity)
+            self.confidences = np.resize(self.confidences, capacity)
+            self.signal_types = np.resize(self.signal_types, capacity)
+
+        i = self.size
+        self.expiries[i] = expiry
+        self.confidences[i] = signal.confidence
+        self.signal_types[i] = SIGNAL_CODES[signal.signal]
+        self.signals.append(signal)
+        self.size = i + 1
+
+    def recent_mask(self, now: float) -> np.ndarray:
+        """Boolean mask of signals that have not expired at monotonic time now"""
+        return self.expiries[: self.size] > now
+
+    def compact(self, keep: np.ndarray) -> None:
+        """Keep only the signals selected by a boolean mask, preserving order"""
+        idx = np.flatnonzero(keep)
+        n = len(idx)
+        self.expiries[:n] = self.expiries[idx]
+        self.confidences[:n] = self.confidences[idx]
+        self.signal_types[:n] = self.signal_types[idx]
+        self.signals = [self.signals[i] for i in idx.tolist()]
+        self.size = n
 
 
 class StrategyAgent(BaseAgent):
@@ -71,6 +139,7 @@ class StrategyAgent(BaseAgent):
         self.fusion_strategy = fusion_strategy
         self.min_signals = min_signals
         self.signal_timeout = timedelta(seconds=signal_timeout_seconds)
+        self._signal_timeout_s = float(signal_timeout_seconds)
         self.min_confidence = min_confidence
         self.decision_interval = decision_interval_seconds
 
@@ -86,18 +155,37 @@ class StrategyAgent(BaseAgent):
         self.time_decay_fusion = TimeDecayFusion(half_life_minutes=30)
         self.hybrid_fusion = HybridFusion()
 
+        # Fusion strategy dispatch table
+        self._fusion_dispatch = {
+            "bayesian": self.bayesian_fusion.fuse_signals,
+            "consensus": self.consensus_fusion.fuse_signals,
+            "time_decay": self.time_decay_fusion.fuse_signals,
+            "hybrid": self.hybrid_fusion.fuse_signals,
+        }
+
         # Database
         self._db: Optional[PostgreSQLDatabase] = None
 
         # State
         self._decision_task: Optional[asyncio.Task] = None
 
+        # Buffered strategy_decisions rows, written in the background
+        self._decision_writer: Optional[BatchWriter] = None
+
     async def initialize(self) -> None:
         """Initialize agent resources"""
         await super().initialize()
 
         # Connect to database
         self._db = await get_db()
+        self._decision_writer = BatchWriter(
+            self._db,
+            INSERT_STRATEGY_DECISION_QUERY,
+            name="strategy_decisions",
+            batch_size=DECISION_BATCH_SIZE,
+            flush_interval=DECISION_FLUSH_INTERVAL,
+        )
+        self._decision_writer.start()
 
         self.logger.info(
             "strategy_agent_initialized",
@@ -148,6 +236,9 @@ class StrategyAgent(BaseAgent):
             except asyncio.CancelledError:
                 pass
 
+        # Write any buffered decisions before closing the database
+        if self._decision_writer:
+            await self._decision_writer.stop()
         if self._db:
             await self._db.close()
 
@@ -170,8 +261,10 @@ class StrategyAgent(BaseAgent):
         symbol = signal.symbol
         buffer = self.signal_buffers[symbol]
 
-        # Add signal
-        buffer.signals.append(signal)
+        # Add signal; its age is measured once and turned into a monotonic
+        # deadline so expiry checks never touch datetimes
+        age = (datetime.utcnow() - signal.timestamp).total_seconds()
+        buffer.append(signal, time.monotonic() + self._signal_timeout_s - age)
         buffer.pending_count += 1
 
         self.logger.debug(
@@ -180,7 +273,7 @@ class StrategyAgent(BaseAgent):
             agent_type=signal.agent_type,
             signal_type=signal.signal.value,
             confidence=signal.confidence,
-            buffer_size=len(buffer.signals),
+            buffer_size=len(buffer),
         )
 
     async def _decision_loop(self) -> None:
@@ -189,10 +282,27 @@ class StrategyAgent(BaseAgent):
             try:
                 await asyncio.sleep(self.decision_interval)
 
-                # Process all symbols with pending signals
-                for symbol, buffer in list(self.signal_buffers.items()):
-                    if buffer.pending_count >= self.min_signals:
-                        await self._make_decision(symbol, buffer)
+                # Process all symbols with pending signals concurrently so
+                # their DB writes and publishes overlap
+                eligible = [
+                    (symbol, buffer)
+                    for symbol, buffer in self.signal_buffers.items()
+                    if buffer.pending_count >= self.min_signals
+                ]
+                results = await asyncio.gather(
+                    *(self._make_decision(symbol, buffer) for symbol, buffer in eligible),
+                    return_exceptions=True,
+                )
+
+                for (symbol, buffer), result in zip(eligible, results):
+                    if isinstance(result, Exception):
+                        self.logger.error(
+                            "decision_error",
+                            symbol=symbol,
+                            error=str(result),
+                            exc_info=result,
+                        )
+                    else:
                         buffer.pending_count = 0
 
                 # Cleanup old signals
@@ -205,32 +315,35 @@ class StrategyAgent(BaseAgent):
 
     async def _make_decision(self, symbol: str, buffer: SignalBuffer) -> None:
         """Make trading decision for a symbol"""
-        # Filter recent signals
-        now = datetime.utcnow()
-        recent_signals = [
-            s for s in buffer.signals
-            if now - s.timestamp < self.signal_timeout
-        ]
+        # Gate on the number of fresh signals before touching any objects
+        recent = buffer.recent_mask(time.monotonic())
+        num_recent = int(np.count_nonzero(recent))
 
-        if len(recent_signals) < self.min_signals:
+        if num_recent < self.min_signals:
             self.logger.debug(
                 "insufficient_signals",
                 symbol=symbol,
                 required=self.min_signals,
-                available=len(recent_signals),
+                available=num_recent,
             )
             return
 
-        # Convert to fusion signal format
+        # Drop expired signals; the rest of the buffer is recent
+        if num_recent < len(buffer):
+            buffer.compact(recent)
+        recent_signals = list(buffer.signals)
+
+        # Convert to fusion signal format (positional: agent_type, symbol,
+        # signal, confidence, timestamp, reasoning, metadata)
         fusion_signals = [
             FusionSignal(
-                agent_type=s.agent_type,
-                symbol=s.symbol,
-                signal=s.signal,
-                confidence=s.confidence,
-                timestamp=s.timestamp,
-                reasoning=s.reasoning or "",
-                metadata=s.indicators,
+                s.agent_type,
+                s.symbol,
+                s.signal,
+                s.confidence,
+                s.timestamp,
+                s.reasoning or "",
+                s.indicators,
             )
             for s in recent_signals
         ]
@@ -250,7 +363,7 @@ class StrategyAgent(BaseAgent):
             return
 
         # Don't create trade intent for HOLD signals
-        if fusion_result["signal"].value == "HOLD":
+        if fusion_result["signal"] == "HOLD":
             self.logger.info(
                 "hold_signal_decision",
                 symbol=symbol,
@@ -259,7 +372,9 @@ class StrategyAgent(BaseAgent):
             )
             return
 
-        # Generate trade intent
+        # Generate trade intent. Stop/take-profit levels and reasoning are
+        # only derived here, past the confidence and HOLD gates above
+        resolve_reasoning(fusion_result)
         trade_intent = await self._generate_trade_intent(
             symbol, recent_signals, fusion_result
         )
@@ -271,7 +386,7 @@ class StrategyAgent(BaseAgent):
         await self._store_decision(symbol, fusion_result, trade_intent)
 
         # Update buffer
-        buffer.last_decision = now
+        buffer.last_decision = datetime.utcnow()
 
         self.logger.info(
             "decision_made",
@@ -286,16 +401,11 @@ class StrategyAgent(BaseAgent):
         self, signals: List[FusionSignal]
     ) -> Dict[str, Any]:
         """Apply selected fusion strategy"""
-        if self.fusion_strategy == "bayesian":
-            return self.bayesian_fusion.fuse_signals(signals)
-        elif self.fusion_strategy == "consensus":
-            return self.consensus_fusion.fuse_signals(signals)
-        elif self.fusion_strategy == "time_decay":
-            return self.time_decay_fusion.fuse_signals(signals)
-        elif self.fusion_strategy == "hybrid":
-            return self.hybrid_fusion.fuse_signals(signals)
-        else:
-            raise ValueError(f"Unknown fusion strategy: {self.fusion_strategy}")
+        try:
+            fuse = self._fusion_dispatch[self.fusion_strategy]
+        except KeyError:
+            raise ValueError(f"Unknown fusion strategy: {self.fusion_strategy}") from None
+        return fuse(signals)
 
     async def _generate_trade_intent(
         self,
@@ -304,15 +414,26 @@ class StrategyAgent(BaseAgent):
         fusion_result: Dict[str, Any],
     ) -> TradeIntent:
         """Generate trade intent from fused signals"""
-        # Calculate price targets from signals
-        price_targets = [s.price_target for s in signals if s.price_target]
-        stop_losses = [s.stop_loss for s in signals if s.stop_loss]
-        take_profits = [s.take_profit for s in signals if s.take_profit]
+        # Accumulate price targets and contributing agents in a single pass
+        pt_sum = sl_sum = tp_sum = 0.0
+        pt_n = sl_n = tp_n = 0
+        signal_agents = [None] * len(signals)
+        for i, s in enumerate(signals):
+            signal_agents[i] = s.agent_type
+            if s.price_target:
+                pt_sum += s.price_target
+                pt_n += 1
+            if s.stop_loss:
+                sl_sum += s.stop_loss
+                sl_n += 1
+            if s.take_profit:
+                tp_sum += s.take_profit
+                tp_n += 1
 
         # Average targets if available
-        avg_price_target = sum(price_targets) / len(price_targets) if price_targets else None
-        avg_stop_loss = sum(stop_losses) / len(stop_losses) if stop_losses else None
-        avg_take_profit = sum(take_profits) / len(take_profits) if take_profits else None
+        avg_price_target = pt_sum / pt_n if pt_n else None
+        avg_stop_loss = sl_sum / sl_n if sl_n else None
+        avg_take_profit = tp_sum / tp_n if tp_n else None
 
         # Create reasoning
         reasoning_parts = fusion_result.get("reasoning", [])
@@ -324,6 +445,11 @@ class StrategyAgent(BaseAgent):
         # Normalize confidence to [0.0, 1.0] range
         normalized_confidence = min(fusion_result["confidence"], 1.0)
 
+        # Strategy-specific fusion output, serialized again by _store_decision
+        fusion_details = {
+            k: v for k, v in fusion_result.items() if k not in FUSION_SUMMARY_KEYS
+        }
+
         # Get current market price from latest signal
         latest_signal = signals[-1]
         expected_price = latest_signal.price_target or 0.0
@@ -342,14 +468,11 @@ class StrategyAgent(BaseAgent):
             metadata={
                 "fusion_strategy": self.fusion_strategy,
                 "num_signals": len(signals),
-                "signal_agents": [s.agent_type for s in signals],
+                "signal_agents": signal_agents,
                 "raw_confidence": fusion_result["confidence"],
                 "stop_loss": avg_stop_loss,
                 "take_profit": avg_take_profit,
-                "fusion_details": {
-                    k: v for k, v in fusion_result.items()
-                    if k not in ["signal", "confidence", "reasoning"]
-                },
+                "fusion_details": fusion_details,
             },
         )
 
@@ -361,40 +484,30 @@ class StrategyAgent(BaseAgent):
         fusion_result: Dict[str, Any],
         trade_intent: TradeIntent,
     ) -> None:
-        """Store decision in database"""
+        """Queue decision for batched insertion into the database"""
         try:
-            query = """
-                INSERT INTO strategy_decisions (
-                    symbol, signal_type, confidence, fusion_strategy,
-                    num_signals, reasoning, fusion_details,
-                    price_target, stop_loss, take_profit, metadata
-                )
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            """
-
             # Extract price targets from metadata
             metadata = trade_intent.metadata or {}
             price_target = metadata.get("price_target")
             stop_loss = metadata.get("stop_loss")
             take_profit = metadata.get("take_profit")
 
-            await self._db.execute(
-                query,
+            self._decision_writer.put((
                 symbol,
                 fusion_result["signal"].value,
                 fusion_result["confidence"],
                 self.fusion_strategy,
                 fusion_result.get("num_signals", 0),
                 fusion_result.get("reasoning", ""),
-                json.dumps({
-                    k: v for k, v in fusion_result.items()
-                    if k not in ["signal", "confidence", "reasoning"]
-                }),
+                orjson.dumps(
+                    metadata.get("fusion_details", {}),
+                    option=orjson.OPT_SERIALIZE_NUMPY,
+                ).decode(),
                 price_target,
                 stop_loss,
                 take_profit,
-                json.dumps(metadata),
-            )
+                orjson.dumps(metadata, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+            ))
 
         except Exception as e:
             self.logger.error(
@@ -406,17 +519,15 @@ class StrategyAgent(BaseAgent):
 
     async def _cleanup_old_signals(self) -> None:
         """Remove signals older than timeout"""
-        now = datetime.utcnow()
+        now = time.monotonic()
 
         for symbol, buffer in list(self.signal_buffers.items()):
-            # Filter recent signals
-            buffer.signals = [
-                s for s in buffer.signals
-                if now - s.timestamp < self.signal_timeout
-            ]
+            recent = buffer.recent_mask(now)
+            if not recent.all():
+                buffer.compact(recent)
 
             # Remove empty buffers
-            if not buffer.signals and buffer.pending_count == 0:
+            if not len(buffer) and buffer.pending_count == 0:
                 del self.signal_buffers[symbol]
 
     async def update_agent_performance(
@@ -3,11 +3,14 @@ Signal Fusion Module
 Combines signals from multiple agents using Bayesian averaging and weighted fusion.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
+from collections.abc import Sequence
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 import numpy as np
+
+from core.jit import njit, NUMBA_AVAILABLE
 from core.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,7 +23,17 @@ class SignalType(str, Enum):
     HOLD = "HOLD"
 
 
-@dataclass
+# Module-level aliases: SignalType.X is a comparatively slow enum class
+# attribute lookup, these are plain global loads
+_BUY = SignalType.BUY
+_SELL = SignalType.SELL
+_HOLD = SignalType.HOLD
+
+# int8 codes for signal type arrays
+SIGNAL_CODES = {_BUY: 1, _SELL: -1, _HOLD: 0}
+
+
+@dataclass(slots=True, frozen=True)
 class Signal:
     """Unified signal structure"""
     agent_type: str
@@ -32,6 +45,151 @@ class Signal:
     metadata: Dict[str, Any]
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _vote_scores(weights: np.ndarray, code: np.ndarray) -> Tuple[float, float, float]:
+        """(buy, sell, total) weight sums in one compiled pass"""
+        buy = 0.0
+        sell = 0.0
+        total = 0.0
+        for i in range(weights.shape[0]):
+            w = weights[i]
+            total += w
+            if code[i] == 1:
+                buy += w
+            elif code[i] == -1:
+                sell += w
+        return buy, sell, total
+
+else:
+
+    def _vote_scores(weights: np.ndarray, code: np.ndarray) -> Tuple[float, float, float]:
+        """(buy, sell, total) weight sums"""
+        return (
+            float(weights[code == 1].sum()),
+            float(weights[code == -1].sum()),
+            float(weights.sum()),
+        )
+
+
+@dataclass(slots=True)
+class FusionBatch:
+    """
+    Signals decoded once into parallel arrays
+
+    HybridFusion builds one batch and hands it to every sub-strategy, so
+    the signal objects are only walked once per fusion.
+    """
+    signals: List[Signal]
+    conf: np.ndarray  # float64 confidences
+    code: np.ndarray  # int8 SIGNAL_CODES
+    timestamps: np.ndarray  # datetime64[us], naive UTC like Signal.timestamp
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    @classmethod
+    def from_signals(cls, signals: List[Signal]) -> "FusionBatch":
+        """Decode a list of signals into arrays"""
+        n = len(signals)
+        return cls(
+            signals=signals,
+            conf=np.fromiter((s.confidence for s in signals), dtype=np.float64, count=n),
+            code=np.fromiter((SIGNAL_CODES[s.signal] for s in signals), dtype=np.int8, count=n),
+            timestamps=np.array([s.timestamp for s in signals], dtype="datetime64[us]"),
+        )
+
+
+def _as_batch(signals: Union[List[Signal], FusionBatch]) -> FusionBatch:
+    """Accept either a signal list or an already decoded FusionBatch"""
+    if isinstance(signals, FusionBatch):
+        return signals
+    return FusionBatch.from_signals(signals)
+
+
+class LazyReasoning(Sequence):
+    """
+    Reasoning lines formatted on first access
+
+    Fusion results that fail the decision gates are discarded without their
+    per-signal reasoning ever being formatted. Call resolve_reasoning()
+    before serializing a result.
+    """
+
+    __slots__ = ("_build", "_lines")
+
+    def __init__(self, build: Callable[[], List[str]]):
+        self._build = build
+        self._lines: Optional[List[str]] = None
+
+    def materialize(self) -> List[str]:
+        """Build (once) and return the reasoning lines"""
+        if self._lines is None:
+            self._lines = self._build()
+            self._build = None
+        return self._lines
+
+    def __getitem__(self, index):
+        return self.materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+
+def resolve_reasoning(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace lazy reasoning in a fusion result and its sub-results with lists"""
+    reasoning = result.get("reasoning")
+    if isinstance(reasoning, LazyReasoning):
+        result["reasoning"] = reasoning.materialize()
+    for sub_result in result.get("strategies", {}).values():
+        resolve_reasoning(sub_result)
+    return result
+
+
+class PerformanceHistory:
+    """
+    Fixed-size ring buffer of an agent's accuracy history
+
+    Once full, each append overwrites the oldest entry, so updates are O(1)
+    regardless of the window size.
+    """
+
+    def __init__(self, window: int):
+        self.buffer = np.empty(window, dtype=np.float64)
+        self.write_idx = 0  # Position of the next write (oldest entry once full)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, accuracy: float) -> None:
+        """Record an accuracy, dropping the oldest one when full"""
+        self.buffer[self.write_idx] = accuracy
+        self.write_idx = (self.write_idx + 1) % len(self.buffer)
+        if self.count < len(self.buffer):
+            self.count += 1
+
+    def weighted_sum(self, weights: np.ndarray) -> float:
+        """Dot product of the history in chronological order with weights"""
+        if self.count < len(self.buffer):
+            return float(np.dot(self.buffer[: self.count], weights))
+
+        # Full: oldest entries start at write_idx, so split the dot product
+        # at the wrap point instead of reordering the buffer
+        split = len(self.buffer) - self.write_idx
+        return float(
+            np.dot(self.buffer[self.write_idx :], weights[:split])
+            + np.dot(self.buffer[: self.write_idx], weights[split:])
+        )
+
+
 class BayesianFusion:
     """
     Bayesian signal fusion using agent performance history.
@@ -44,18 +202,40 @@ class BayesianFusion:
 
     def __init__(self, history_window: int = 100):
         self.history_window = history_window
-        self.agent_performance: Dict[str, List[float]] = {}
+        self.agent_performance: Dict[str, PerformanceHistory] = {}
+        # Normalized decay weights keyed by history length
+        self._weight_cache: Dict[int, np.ndarray] = {}
+
+        # Interned agent types: fusion works on small integer ids, with each
+        # agent's base weight cached at its id and refreshed on updates
+        self._agent_ids: Dict[str, int] = {}
+        self._agent_types: List[str] = []
+        self._base_weights = np.empty(0, dtype=np.float64)
+
+    def _intern(self, agent_type: str) -> int:
+        """Integer id of an agent type, assigned on first sight"""
+        agent_id = self._agent_ids.get(agent_type)
+        if agent_id is None:
+            agent_id = len(self._agent_types)
+            self._agent_ids[agent_type] = agent_id
+            self._agent_types.append(agent_type)
+            self._base_weights = np.append(
+                self._base_weights, self.get_agent_weight(agent_type)
+            )
+        return agent_id
 
     def update_performance(self, agent_type: str, accuracy: float) -> None:
         """Update agent performance history"""
-        if agent_type not in self.agent_performance:
-            self.agent_performance[agent_type] = []
+        history = self.agent_performance.get(agent_type)
+        if history is None:
+            history = PerformanceHistory(self.history_window)
+            self.agent_performance[agent_type] = history
 
-        self.agent_performance[agent_type].append(accuracy)
+        # Keeps only the most recent history_window entries
+        history.append(accuracy)
 
-        # Keep only recent history
-        if len(self.agent_performance[agent_type]) > self.history_window:
-            self.agent_performance[agent_type].pop(0)
+        agent_id = self._intern(agent_type)
+        self._base_weights[agent_id] = self.get_agent_weight(agent_type)
 
     def get_agent_weight(self, agent_type: str, base_confidence: float = 0.5) -> float:
         """
@@ -71,13 +251,16 @@ class BayesianFusion:
             return base_confidence
 
         # Recent performance is more important (exponential decay)
-        weights = np.exp(np.linspace(-1, 0, len(history)))
-        weights /= weights.sum()
+        n = len(history)
+        weights = self._weight_cache.get(n)
+        if weights is None:
+            weights = np.exp(np.linspace(-1, 0, n))
+            weights /= weights.sum()
+            self._weight_cache[n] = weights
 
-        weighted_accuracy = np.average(history, weights=weights)
-        return float(weighted_accuracy)
+        return history.weighted_sum(weights)
 
-    def fuse_signals(self, signals: List[Signal]) -> Dict[str, Any]:
+    def fuse_signals(self, signals: Union[List[Signal], FusionBatch]) -> Dict[str, Any]:
         """
         Fuse multiple signals using Bayesian averaging.
 
@@ -86,56 +269,57 @@ class BayesianFusion:
                 "signal": "BUY" | "SELL" | "HOLD",
                 "confidence": float,
                 "weights": Dict[str, float],
-                "reasoning": List[str]
+                "reasoning": LazyReasoning (list of str once resolved)
             }
         """
         if not signals:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "weights": {},
                 "reasoning": ["No signals available"],
             }
 
-        # Calculate weights for each agent
-        agent_weights = {}
-        for sig in signals:
-            base_weight = self.get_agent_weight(sig.agent_type)
-            # Combine with signal confidence
-            agent_weights[sig.agent_type] = base_weight * sig.confidence
+        batch = _as_batch(signals)
+        signals = batch.signals
+
+        # Calculate weights for each agent, combined with signal confidence;
+        # an agent with several signals is weighted by its last one
+        agent_ids = np.fromiter(
+            (self._intern(sig.agent_type) for sig in signals),
+            dtype=np.intp,
+            count=len(signals),
+        )
+        per_agent = np.zeros(len(self._agent_types), dtype=np.float64)
+        per_agent[agent_ids] = self._base_weights[agent_ids] * batch.conf
 
         # Normalize weights
-        total_weight = sum(agent_weights.values())
+        total_weight = per_agent.sum()
         if total_weight > 0:
-            agent_weights = {k: v / total_weight for k, v in agent_weights.items()}
+            per_agent /= total_weight
 
         # Calculate weighted vote
-        buy_score = 0.0
-        sell_score = 0.0
-
-        for sig in signals:
-            weight = agent_weights.get(sig.agent_type, 0.0)
-            if sig.signal == SignalType.BUY:
-                buy_score += weight
-            elif sig.signal == SignalType.SELL:
-                sell_score += weight
+        weights = per_agent[agent_ids]
+        buy_score, sell_score, _ = _vote_scores(weights, batch.code)
 
         # Determine final signal
         if buy_score > sell_score and buy_score > 0.3:
-            final_signal = SignalType.BUY
+            final_signal = _BUY
             confidence = buy_score
         elif sell_score > buy_score and sell_score > 0.3:
-            final_signal = SignalType.SELL
+            final_signal = _SELL
             confidence = sell_score
         else:
-            final_signal = SignalType.HOLD
+            final_signal = _HOLD
             confidence = max(buy_score, sell_score)
 
-        # Collect reasoning
-        reasoning = [
-            f"{sig.agent_type}: {sig.signal.value} ({sig.confidence:.2%}) - {sig.reasoning}"
-            for sig in signals
-        ]
+        # Collect reasoning, formatted only if the result is used
+        reasoning = LazyReasoning(
+            lambda: [
+                f"{sig.agent_type}: {sig.signal.value} ({sig.confidence:.2%}) - {sig.reasoning}"
+                for sig in signals
+            ]
+        )
 
         logger.info(
             "signals_fused",
@@ -151,7 +335,10 @@ class BayesianFusion:
             "confidence": confidence,
             "buy_score": buy_score,
             "sell_score": sell_score,
-            "weights": agent_weights,
+            "weights": {
+                self._agent_types[agent_id]: float(per_agent[agent_id])
+                for agent_id in dict.fromkeys(agent_ids.tolist())
+            },
             "reasoning": reasoning,
             "num_signals": len(signals),
         }
@@ -167,7 +354,7 @@ class ConsensusStrategy:
         self.min_confidence = min_confidence
         self.min_agreement = min_agreement
 
-    def fuse_signals(self, signals: List[Signal]) -> Dict[str, Any]:
+    def fuse_signals(self, signals: Union[List[Signal], FusionBatch]) -> Dict[str, Any]:
         """
         Fuse signals based on consensus.
 
@@ -177,49 +364,50 @@ class ConsensusStrategy:
         """
         if not signals:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "reasoning": ["No signals"],
             }
 
+        batch = _as_batch(signals)
+        signals, conf, code = batch.signals, batch.conf, batch.code
+
         # Filter high-confidence signals
-        strong_signals = [s for s in signals if s.confidence >= self.min_confidence]
+        strong = conf >= self.min_confidence
+        total = int(np.count_nonzero(strong))
 
-        if not strong_signals:
+        if not total:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "reasoning": ["No strong signals"],
             }
 
         # Count votes
-        buy_count = sum(1 for s in strong_signals if s.signal == SignalType.BUY)
-        sell_count = sum(1 for s in strong_signals if s.signal == SignalType.SELL)
-        total = len(strong_signals)
+        buy = strong & (code == 1)
+        sell = strong & (code == -1)
 
-        buy_agreement = buy_count / total
-        sell_agreement = sell_count / total
+        buy_agreement = int(np.count_nonzero(buy)) / total
+        sell_agreement = int(np.count_nonzero(sell)) / total
 
-        # Check for consensus
+        # Check for consensus; reasoning is only collected for the winner
         if buy_agreement >= self.min_agreement:
-            avg_confidence = np.mean([s.confidence for s in strong_signals if s.signal == SignalType.BUY])
             return {
-                "signal": SignalType.BUY,
-                "confidence": float(avg_confidence),
+                "signal": _BUY,
+                "confidence": float(conf[buy].mean()),
                 "agreement": buy_agreement,
-                "reasoning": [s.reasoning for s in strong_signals if s.signal == SignalType.BUY],
+                "reasoning": [signals[i].reasoning for i in np.flatnonzero(buy).tolist()],
             }
         elif sell_agreement >= self.min_agreement:
-            avg_confidence = np.mean([s.confidence for s in strong_signals if s.signal == SignalType.SELL])
             return {
-                "signal": SignalType.SELL,
-                "confidence": float(avg_confidence),
+                "signal": _SELL,
+                "confidence": float(conf[sell].mean()),
                 "agreement": sell_agreement,
-                "reasoning": [s.reasoning for s in strong_signals if s.signal == SignalType.SELL],
+                "reasoning": [signals[i].reasoning for i in np.flatnonzero(sell).tolist()],
             }
         else:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "agreement": 0.0,
                 "reasoning": ["No consensus reached"],
@@ -235,39 +423,48 @@ class TimeDecayFusion:
     def __init__(self, half_life_minutes: int = 30):
         self.half_life_minutes = half_life_minutes
 
-    def calculate_time_weight(self, signal_time: datetime) -> float:
-        """Calculate exponential decay weight based on signal age"""
-        now = datetime.utcnow()
+    def calculate_time_weight(
+        self, signal_time: datetime, now: Optional[datetime] = None
+    ) -> float:
+        """
+        Calculate exponential decay weight based on signal age
+
+        Single-signal helper; fuse_signals computes the weights of a whole
+        batch with one vectorized np.exp2 instead of calling this per signal.
+
+        Args:
+            signal_time: Signal timestamp (naive UTC)
+            now: Reference time, so callers weighting several signals read
+                the clock once; defaults to the current time
+        """
+        if now is None:
+            now = datetime.utcnow()
         age_minutes = (now - signal_time).total_seconds() / 60
 
         # Exponential decay: weight = 0.5^(age/half_life)
         weight = 0.5 ** (age_minutes / self.half_life_minutes)
         return weight
 
-    def fuse_signals(self, signals: List[Signal]) -> Dict[str, Any]:
+    def fuse_signals(self, signals: Union[List[Signal], FusionBatch]) -> Dict[str, Any]:
         """Fuse signals with time decay weighting"""
         if not signals:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "reasoning": ["No signals"],
             }
 
-        # Calculate time-weighted scores
-        buy_score = 0.0
-        sell_score = 0.0
-        total_weight = 0.0
+        batch = _as_batch(signals)
+        signals, conf, code = batch.signals, batch.conf, batch.code
 
-        for sig in signals:
-            time_weight = self.calculate_time_weight(sig.timestamp)
-            signal_weight = time_weight * sig.confidence
+        # Signal ages in minutes from one clock reading, as datetime64 math
+        now = np.datetime64(datetime.utcnow(), "us")
+        age_minutes = (now - batch.timestamps) / np.timedelta64(60, "s")
 
-            total_weight += signal_weight
+        # Calculate time-weighted scores; weight = 0.5^(age/half_life)
+        signal_weights = np.exp2(-age_minutes / self.half_life_minutes) * conf
 
-            if sig.signal == SignalType.BUY:
-                buy_score += signal_weight
-            elif sig.signal == SignalType.SELL:
-                sell_score += signal_weight
+        buy_score, sell_score, total_weight = _vote_scores(signal_weights, code)
 
         # Normalize
         if total_weight > 0:
@@ -276,13 +473,13 @@ class TimeDecayFusion:
 
         # Determine final signal
         if buy_score > sell_score and buy_score > 0.3:
-            final_signal = SignalType.BUY
+            final_signal = _BUY
             confidence = buy_score
         elif sell_score > buy_score and sell_score > 0.3:
-            final_signal = SignalType.SELL
+            final_signal = _SELL
             confidence = sell_score
         else:
-            final_signal = SignalType.HOLD
+            final_signal = _HOLD
             confidence = max(buy_score, sell_score)
 
         return {
@@ -304,7 +501,7 @@ class HybridFusion:
         self.consensus = ConsensusStrategy()
         self.time_decay = TimeDecayFusion()
 
-    def fuse_signals(self, signals: List[Signal]) -> Dict[str, Any]:
+    def fuse_signals(self, signals: Union[List[Signal], FusionBatch]) -> Dict[str, Any]:
         """
         Multi-strategy fusion with voting.
 
@@ -312,33 +509,37 @@ class HybridFusion:
         """
         if not signals:
             return {
-                "signal": SignalType.HOLD,
+                "signal": _HOLD,
                 "confidence": 0.0,
                 "method": "none",
                 "reasoning": ["No signals"],
             }
 
-        # Get results from all strategies
-        bayesian_result = self.bayesian.fuse_signals(signals)
-        consensus_result = self.consensus.fuse_signals(signals)
-        time_decay_result = self.time_decay.fuse_signals(signals)
-
-        # Collect votes
-        votes = [
-            (bayesian_result["signal"], bayesian_result["confidence"]),
-            (consensus_result["signal"], consensus_result["confidence"]),
-            (time_decay_result["signal"], time_decay_result["confidence"]),
-        ]
+        # Get results from all strategies, decoding the signals only once
+        batch = _as_batch(signals)
+        bayesian_result = self.bayesian.fuse_signals(batch)
+        consensus_result = self.consensus.fuse_signals(batch)
+        time_decay_result = self.time_decay.fuse_signals(batch)
 
         # Majority vote with confidence weighting
-        signal_scores = {SignalType.BUY: 0.0, SignalType.SELL: 0.0, SignalType.HOLD: 0.0}
-
-        for signal, conf in votes:
-            signal_scores[signal] += conf
-
-        # Final signal is the one with highest score
-        final_signal = max(signal_scores, key=signal_scores.get)
-        final_confidence = signal_scores[final_signal] / 3  # Average
+        buy_score = sell_score = hold_score = 0.0
+        for result in (bayesian_result, consensus_result, time_decay_result):
+            signal = result["signal"]
+            if signal is _BUY:
+                buy_score += result["confidence"]
+            elif signal is _SELL:
+                sell_score += result["confidence"]
+            else:
+                hold_score += result["confidence"]
+
+        # Final signal is the one with highest score; ties go to BUY, then SELL
+        if buy_score >= sell_score and buy_score >= hold_score:
+            final_signal, final_score = _BUY, buy_score
+        elif sell_score >= hold_score:
+            final_signal, final_score = _SELL, sell_score
+        else:
+            final_signal, final_score = _HOLD, hold_score
+        final_confidence = final_score / 3  # Average
 
         logger.info(
             "hybrid_fusion_complete",
@@ -360,3 +561,8 @@ class HybridFusion:
             },
             "reasoning": bayesian_result["reasoning"],
         }
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) the vote kernel for float64/int8 input
+    _vote_scores(np.ones(1), np.ones(1, dtype=np.int8))
@@ -4,10 +4,11 @@ Analyzes market data and generates trading signals using technical indicators.
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
-import pandas as pd
 import numpy as np
+import orjson
 
 from agents.base.agent import PeriodicAgent
 from agents.base.protocol import (
@@ -17,11 +18,41 @@ from agents.base.protocol import (
     MessageType,
 )
 from agents.technical_analysis.indicators import (
+    OHLCV_COLUMNS,
+    IndicatorState,
+    LatestIndicators,
+    OHLCVArrays,
     TechnicalIndicators,
     SignalGenerator,
 )
 from infrastructure.database.influxdb import get_influx, InfluxDBManager
-from infrastructure.database.postgresql import get_db, PostgreSQLDatabase
+from infrastructure.database.postgresql import get_db, BatchWriter, PostgreSQLDatabase
+
+# Bars analyzed by the agent
+OHLCV_EXCHANGE = "binance"
+OHLCV_INTERVAL = "1m"
+OHLCV_BAR_SECONDS = 60.0
+
+# Incremental indicator state is trusted only while candles keep arriving;
+# after this long without one the next analysis refetches from InfluxDB
+INDICATOR_STATE_MAX_AGE_S = 180.0
+
+# Symbols analyzed at once, to avoid a burst of InfluxDB queries
+ANALYSIS_CONCURRENCY = 8
+
+# Prefetched bars of a symbol and their indicators (None until calculated)
+PreparedBars = Tuple[Optional[OHLCVArrays], Optional[Dict[str, Any]]]
+
+# Signal persistence is batched: flush when full or when the window closes
+SIGNAL_BATCH_SIZE = 64
+SIGNAL_FLUSH_INTERVAL = 0.5  # seconds
+
+INSERT_SIGNAL_QUERY = """
+    INSERT INTO signals (
+        agent_type, agent_name, symbol, signal_type, confidence, reasoning, indicators
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7)
+"""
 
 
 class TechnicalAnalysisAgent(PeriodicAgent):
@@ -56,11 +87,29 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         self._indicators = TechnicalIndicators()
         self._signal_gen = SignalGenerator()
 
+        # Per-symbol incremental indicators fed by streamed candles, and the
+        # monotonic time of each state's last candle
+        self._states: Dict[str, IndicatorState] = {}
+        self._state_updated: Dict[str, float] = {}
+
+        self._analysis_semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+
+        # Buffered signals rows, written in the background
+        self._signal_writer: Optional[BatchWriter] = None
+
     async def setup(self) -> None:
         """Initialize connections and subscriptions"""
         # Connect to databases
         self._influx = get_influx()
         self._db = await get_db()
+        self._signal_writer = BatchWriter(
+            self._db,
+            INSERT_SIGNAL_QUERY,
+            name="signals",
+            batch_size=SIGNAL_BATCH_SIZE,
+            flush_interval=SIGNAL_FLUSH_INTERVAL,
+        )
+        self._signal_writer.start()
 
         # Subscribe to market data
         await self.subscribe_topic("ticks.raw", self.handle_market_data)
@@ -72,15 +121,96 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         )
 
     async def execute(self) -> None:
-        """Periodic execution - analyze each symbol"""
-        for symbol in self.symbols:
-            try:
-                await self._analyze_symbol(symbol)
-            except Exception as e:
-                self.log_error(e, {"symbol": symbol, "phase": "analysis"})
+        """Periodic execution - analyze all symbols concurrently"""
+        # One InfluxDB request for every symbol needing a full recompute,
+        # and one batched indicator computation over the fetched bars
+        prefetched = await self._prefetch_ohlcv([
+            symbol
+            for symbol in self.symbols
+            if not self._state_is_live(symbol, self._states.get(symbol))
+        ])
+        prepared = await self._prepare_prefetched(prefetched)
+
+        results = await asyncio.gather(
+            *(
+                self._analyze_symbol_limited(symbol, prepared.get(symbol))
+                for symbol in self.symbols
+            ),
+            return_exceptions=True,
+        )
+
+        for symbol, result in zip(self.symbols, results):
+            if isinstance(result, Exception):
+                self.log_error(result, {"symbol": symbol, "phase": "analysis"})
+
+    async def _analyze_symbol_limited(
+        self, symbol: str, prepared: Optional[PreparedBars] = None
+    ) -> None:
+        """Analyze a symbol within the concurrency limit"""
+        async with self._analysis_semaphore:
+            await self._analyze_symbol(symbol, prepared)
+
+    async def _prefetch_ohlcv(self, symbols: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch OHLCV rows for several symbols in one InfluxDB query
+
+        Returns an empty dict on failure, in which case each symbol falls
+        back to its own query.
+        """
+        if not symbols:
+            return {}
+
+        try:
+            return await asyncio.to_thread(
+                self._influx.query_ohlcv_multi,
+                symbols=symbols,
+                exchange=OHLCV_EXCHANGE,
+                start_time=datetime.utcnow() - timedelta(hours=24),
+                interval=OHLCV_INTERVAL,
+            )
+        except Exception as e:
+            self.log_error(e, {"symbols": symbols, "operation": "prefetch_ohlcv"})
+            return {}
+
+    async def _prepare_prefetched(
+        self, prefetched: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, PreparedBars]:
+        """
+        Convert prefetched rows to bars and calculate indicators in one batch
+
+        Symbols without enough bars, or all of them if the batch fails, are
+        left without indicators for _analyze_symbol to handle.
+        """
+        prepared: Dict[str, PreparedBars] = {}
+        for symbol, rows in prefetched.items():
+            prepared[symbol] = (await self._fetch_ohlcv_data(symbol, rows), None)
+
+        ready = [
+            symbol
+            for symbol, (bars, _) in prepared.items()
+            if bars is not None and len(bars) >= self.lookback_periods
+        ]
+        if not ready:
+            return prepared
+
+        try:
+            batch = self._indicators.calculate_all_indicators_batch(
+                [prepared[symbol][0].closed() for symbol in ready]
+            )
+        except Exception as e:
+            self.log_error(e, {"symbols": ready, "operation": "batch_indicators"})
+            return prepared
+
+        for symbol, indicators in zip(ready, batch):
+            prepared[symbol] = (prepared[symbol][0], indicators)
+        return prepared
 
     async def cleanup(self) -> None:
         """Cleanup resources"""
+        # Write any buffered signals
+        if self._signal_writer:
+            await self._signal_writer.stop()
+
         if self._influx:
             self._influx.disconnect()
 
@@ -92,16 +222,45 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         """
         Handle incoming market data messages
 
-        This is called in real-time when new data arrives
+        This is called in real-time when new data arrives. Candles of the
+        analyzed interval update the symbol's indicator state in O(1), so
+        periodic analysis does not have to recompute the whole lookback.
         """
-        # For now, we rely on periodic analysis
-        # Could add real-time incremental analysis here
-        pass
+        data = message.data
+        if data.get("type") != "ohlcv" or data.get("interval") != OHLCV_INTERVAL:
+            return
+        if message.exchange != OHLCV_EXCHANGE:
+            return
+
+        # Seeded from InfluxDB on the symbol's first analysis
+        state = self._states.get(message.symbol)
+        if state is None:
+            return
+
+        try:
+            state.on_candle(
+                data["timestamp"] / 1000,  # Exchange timestamps are in ms
+                float(data["open"]),
+                float(data["high"]),
+                float(data["low"]),
+                float(data["close"]),
+                float(data["volume"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return  # Incomplete candle
+        self._state_updated[message.symbol] = time.monotonic()
 
-    async def _analyze_symbol(self, symbol: str) -> None:
+    async def _analyze_symbol(
+        self, symbol: str, prepared: Optional[PreparedBars] = None
+    ) -> None:
         """
         Analyze a symbol and generate trading signals
 
+        Args:
+            symbol: Trading symbol
+            prepared: (bars, indicators) from the batched prefetch, if any;
+                indicators is None when they still have to be calculated
+
         Steps:
         1. Fetch historical OHLCV data
         2. Calculate technical indicators
@@ -111,26 +270,42 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         6. Store signal in database
         """
         try:
-            # 1. Fetch historical data
-            df = await self._fetch_ohlcv_data(symbol)
-
-            if df is None or len(df) < self.lookback_periods:
-                self.logger.warning(
-                    "insufficient_data",
-                    symbol=symbol,
-                    rows=len(df) if df is not None else 0,
-                    required=self.lookback_periods,
-                )
-                return
-
-            # 2. Calculate indicators
-            indicators = self._indicators.calculate_all_indicators(df)
-            latest_indicators = self._indicators.get_latest_values(indicators)
+            state = self._states.get(symbol)
+            if self._state_is_live(symbol, state):
+                # 1-2. Indicators are kept current by streamed candles
+                latest_indicators = state.snapshot()
+                current_price = state.last_close
+            else:
+                # 1. Fetch historical data
+                if prepared is not None:
+                    bars, indicators = prepared
+                else:
+                    bars, indicators = await self._fetch_ohlcv_data(symbol), None
+
+                if bars is None or len(bars) < self.lookback_periods:
+                    self.logger.warning(
+                        "insufficient_data",
+                        symbol=symbol,
+                        rows=len(bars) if bars is not None else 0,
+                        required=self.lookback_periods,
+                    )
+                    return
+
+                # 2. Calculate indicators over closed bars only, as the live
+                # state does; the forming bar only sets the current price
+                if indicators is None:
+                    indicators = self._indicators.calculate_all_indicators(bars.closed())
+                latest_indicators = self._indicators.get_latest_values(indicators)
+                current_price = float(bars.close[-1])
+
+                # (Re)seed the incremental state from the fetched bars
+                self._states[symbol] = IndicatorState.from_bars(bars, OHLCV_BAR_SECONDS)
+                self._state_updated[symbol] = time.monotonic()
 
             # 3. Generate individual signals
             signals = self._generate_individual_signals(
-                latest_indicators,
-                df["close"].iloc[-1],
+                LatestIndicators(**latest_indicators),
+                current_price,
             )
 
             # 4. Combine signals
@@ -164,54 +339,59 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         except Exception as e:
             self.log_error(e, {"symbol": symbol, "phase": "symbol_analysis"})
 
-    async def _fetch_ohlcv_data(self, symbol: str) -> Optional[pd.DataFrame]:
-        """Fetch OHLCV data from InfluxDB"""
+    def _state_is_live(self, symbol: str, state: Optional[IndicatorState]) -> bool:
+        """Whether a symbol's indicator state can stand in for a full recompute"""
+        if state is None or state.stale or state.bars < self.lookback_periods:
+            return False
+        age = time.monotonic() - self._state_updated.get(symbol, 0.0)
+        return age < INDICATOR_STATE_MAX_AGE_S
+
+    async def _fetch_ohlcv_data(
+        self, symbol: str, rows: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[OHLCVArrays]:
+        """Fetch OHLCV data from InfluxDB, unless the rows were prefetched"""
         try:
-            start_time = datetime.utcnow() - timedelta(hours=24)
-
-            data = self._influx.query_ohlcv(
-                symbol=symbol,
-                exchange="binance",
-                start_time=start_time,
-                interval="1m",
-            )
+            if rows is not None:
+                data = rows
+            else:
+                start_time = datetime.utcnow() - timedelta(hours=24)
+
+                # Blocking HTTP query; run it in a worker thread so other
+                # symbols' analyses proceed meanwhile
+                data = await asyncio.to_thread(
+                    self._influx.query_ohlcv,
+                    symbol=symbol,
+                    exchange=OHLCV_EXCHANGE,
+                    start_time=start_time,
+                    interval=OHLCV_INTERVAL,
+                )
 
             if not data:
                 return None
 
-            # Convert to DataFrame
-            df = pd.DataFrame(data)
-
             # Ensure we have required columns
-            required_cols = ["timestamp", "open", "high", "low", "close", "volume"]
-            if not all(col in df.columns for col in required_cols):
+            required_cols = ["timestamp", *OHLCV_COLUMNS]
+            if not all(col in data[0] for col in required_cols):
                 self.logger.error(
                     "missing_columns",
                     symbol=symbol,
-                    available=list(df.columns),
+                    available=list(data[0]),
                     required=required_cols,
                 )
                 return None
 
-            # Sort by timestamp
-            df = df.sort_values("timestamp").reset_index(drop=True)
-
-            # Convert to numeric
-            for col in ["open", "high", "low", "close", "volume"]:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            # Remove NaN rows
-            df = df.dropna()
+            # Sorted float64 columns without NaN rows, built in one pass
+            bars = OHLCVArrays.from_rows(data)
 
             self.logger.debug(
                 "ohlcv_fetched",
                 symbol=symbol,
-                rows=len(df),
-                start=df["timestamp"].iloc[0] if len(df) > 0 else None,
-                end=df["timestamp"].iloc[-1] if len(df) > 0 else None,
+                rows=len(bars),
+                start=datetime.utcfromtimestamp(bars.timestamp[0]) if len(bars) > 0 else None,
+                end=datetime.utcfromtimestamp(bars.timestamp[-1]) if len(bars) > 0 else None,
             )
 
-            return df
+            return bars
 
         except Exception as e:
             self.log_error(e, {"symbol": symbol, "operation": "fetch_ohlcv"})
@@ -219,45 +399,38 @@ class TechnicalAnalysisAgent(PeriodicAgent):
 
     def _generate_individual_signals(
         self,
-        indicators: Dict[str, float],
+        indicators: LatestIndicators,
         current_price: float,
     ) -> List[Dict[str, Any]]:
         """Generate signals from each indicator"""
+        li = indicators
         signals = []
 
         # RSI Signal
-        if indicators.get("rsi") is not None:
-            rsi_signal = self._signal_gen.analyze_rsi(indicators["rsi"])
-            signals.append(rsi_signal)
+        if li.rsi is not None:
+            signals.append(self._signal_gen.analyze_rsi(li.rsi))
 
         # MACD Signal
-        if all(indicators.get(k) is not None for k in ["macd", "macd_signal", "macd_hist"]):
-            macd_signal = self._signal_gen.analyze_macd(
-                indicators["macd"],
-                indicators["macd_signal"],
-                indicators["macd_hist"],
+        if li.macd is not None and li.macd_signal is not None and li.macd_hist is not None:
+            signals.append(
+                self._signal_gen.analyze_macd(li.macd, li.macd_signal, li.macd_hist)
             )
-            signals.append(macd_signal)
 
         # Bollinger Bands Signal
-        if all(indicators.get(k) is not None for k in ["bb_upper", "bb_lower", "bb_middle"]):
-            bb_signal = self._signal_gen.analyze_bollinger_bands(
-                current_price,
-                indicators["bb_upper"],
-                indicators["bb_lower"],
-                indicators["bb_middle"],
+        if li.bb_upper is not None and li.bb_lower is not None and li.bb_middle is not None:
+            signals.append(
+                self._signal_gen.analyze_bollinger_bands(
+                    current_price, li.bb_upper, li.bb_lower, li.bb_middle
+                )
             )
-            signals.append(bb_signal)
 
         # Moving Averages Signal
-        if all(indicators.get(k) is not None for k in ["sma_20", "sma_50", "ema_20"]):
-            ma_signal = self._signal_gen.analyze_moving_averages(
-                current_price,
-                indicators["sma_20"],
-                indicators["sma_50"],
-                indicators["ema_20"],
+        if li.sma_20 is not None and li.sma_50 is not None and li.ema_20 is not None:
+            signals.append(
+                self._signal_gen.analyze_moving_averages(
+                    current_price, li.sma_20, li.sma_50, li.ema_20
+                )
             )
-            signals.append(ma_signal)
 
         return signals
 
@@ -292,10 +465,8 @@ class TechnicalAnalysisAgent(PeriodicAgent):
             signal=signal_type,
             confidence=final_signal.get("confidence", 0.0),
             reasoning=reasoning,
-            indicators={
-                k: float(v) if v is not None else None
-                for k, v in indicators.items()
-            },
+            # Already plain floats (or None) from get_latest_values/snapshot
+            indicators=indicators,
         )
 
         return message
@@ -305,24 +476,17 @@ class TechnicalAnalysisAgent(PeriodicAgent):
         signal: TradingSignal,
         indicators: Dict[str, float],
     ) -> None:
-        """Store signal in PostgreSQL"""
+        """Queue signal for batched storage in PostgreSQL"""
         try:
-            await self._db.insert_signal(
-                agent_type=self.agent_type,
-                agent_name=self.name,
-                symbol=signal.symbol,
-                signal_type=signal.signal.value,
-                confidence=signal.confidence,
-                reasoning=signal.reasoning,
-                indicators=indicators,
-            )
-
-            self.logger.debug(
-                "signal_stored",
-                symbol=signal.symbol,
-                signal=signal.signal.value,
-                confidence=signal.confidence,
-            )
+            self._signal_writer.put((
+                self.agent_type,
+                self.name,
+                signal.symbol,
+                signal.signal.value,
+                signal.confidence,
+                signal.reasoning,
+                orjson.dumps(indicators, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+            ))
 
         except Exception as e:
             self.log_error(e, {"symbol": signal.symbol, "operation": "store_signal"})
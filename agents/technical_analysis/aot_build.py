@@ -0,0 +1,32 @@
+"""
+AOT Build Script
+Compiles the fused indicator kernel ahead of time into the ta_aot extension
+module, so workers compute indicators without a JIT compile on first use.
+
+Run once at image build time from the repository root:
+
+    python -m agents.technical_analysis.aot_build
+
+The module is written next to this file. fused_indicators picks it up when
+present and falls back to the JIT kernel otherwise. Array arguments are
+not shape-specialized, so one export serves every bar count.
+
+numba.pycc is pending deprecation upstream; if it is removed the build
+fails and the JIT kernel is used as before.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from agents.technical_analysis.fused_indicators import _fused_into
+
+cc = CC("ta_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# (high, low, close, volume, out): out is the NaN-filled (K, n) block
+cc.export("fused_into", "void(f8[:], f8[:], f8[:], f8[:], f8[:, :])")(_fused_into.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
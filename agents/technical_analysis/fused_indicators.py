@@ -0,0 +1,403 @@
+"""
+Fused Indicators Module
+Every indicator of TechnicalIndicators.calculate_all_indicators in one
+compiled pass over the OHLCV columns.
+
+Each indicator keeps its running state (window sums, EMA values, Wilder
+averages, monotonic high/low deques) and all of them advance together bar
+by bar, writing into rows of a single preallocated output block. Seeding,
+lookback and NaN prefixes follow TA-Lib's default parameters.
+
+aot_build.py can compile the single-symbol kernel ahead of time into the
+ta_aot module; fused_all_aot uses it so no JIT compile happens at runtime.
+"""
+
+import math
+import numpy as np
+
+from core.jit import njit, prange, NUMBA_AVAILABLE
+
+try:
+    # Only present when built at deploy time (python -m agents.technical_analysis.aot_build)
+    from agents.technical_analysis.ta_aot import fused_into as _aot_fused_into
+    AOT_AVAILABLE = True
+except ImportError:
+    AOT_AVAILABLE = False
+
+# Output rows of fused_all, in calculate_all_indicators key order
+FUSED_INDICATOR_KEYS = (
+    "sma_20",
+    "sma_50",
+    "sma_200",
+    "ema_20",
+    "ema_50",
+    "rsi",
+    "macd",
+    "macd_signal",
+    "macd_hist",
+    "bb_upper",
+    "bb_middle",
+    "bb_lower",
+    "atr",
+    "obv",
+    "stoch_k",
+    "stoch_d",
+    "adx",
+)
+
+_SMA_20 = 0
+_SMA_50 = 1
+_SMA_200 = 2
+_EMA_20 = 3
+_EMA_50 = 4
+_RSI = 5
+_MACD = 6
+_MACD_SIGNAL = 7
+_MACD_HIST = 8
+_BB_UPPER = 9
+_BB_MIDDLE = 10
+_BB_LOWER = 11
+_ATR = 12
+_OBV = 13
+_STOCH_K = 14
+_STOCH_D = 15
+_ADX = 16
+
+# Periods (TA-Lib defaults as used by calculate_all_indicators)
+_RSI_PERIOD = 14
+_MACD_FAST = 12
+_MACD_SLOW = 26
+_MACD_SIGNAL_PERIOD = 9
+_BB_STD = 2.0
+_ATR_PERIOD = 14
+_STOCH_FASTK = 14
+_STOCH_SLOW = 3
+_ADX_PERIOD = 14
+
+
+# Every division is by a constant or guarded against zero, so the
+# ZeroDivisionError checks of the default error model are dropped
+@njit(cache=True, error_model="numpy")
+def _fused_rows(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Write every indicator into the rows of a NaN-filled (K, n) block"""
+    n = len(close)
+    if n == 0:
+        return
+
+    # Moving averages and Bollinger Bands (the 20-bar window is shared)
+    sum_20 = 0.0
+    sum_sq_20 = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    ema_20 = 0.0
+    ema_50 = 0.0
+    k_20 = 2.0 / 21
+    k_50 = 2.0 / 51
+
+    # MACD: the fast EMA is seeded at the same bar as the slow one
+    macd_first = _MACD_SLOW - 1
+    macd_start = macd_first + _MACD_SIGNAL_PERIOD - 1
+    fast_seed = 0.0
+    slow_seed = 0.0
+    fast = 0.0
+    slow = 0.0
+    macd_seed = 0.0
+    signal = 0.0
+    k_fast = 2.0 / (_MACD_FAST + 1)
+    k_slow = 2.0 / (_MACD_SLOW + 1)
+    k_signal = 2.0 / (_MACD_SIGNAL_PERIOD + 1)
+
+    # RSI and ATR (Wilder averages)
+    gain = 0.0
+    loss = 0.0
+    tr_seed = 0.0
+    atr = 0.0
+
+    # ADX (Wilder running sums) starts once a full period of DX is summed
+    plus_dm = 0.0
+    minus_dm = 0.0
+    tr_sum = 0.0
+    dx_sum = 0.0
+    adx = 0.0
+    adx_start = 2 * _ADX_PERIOD - 1
+
+    # Stochastic: monotonic deques of bar indices for the rolling high/low
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = 0
+    max_tail = 0
+    min_head = 0
+    min_tail = 0
+    fast_k = np.empty(n)
+    slow_k = np.empty(n)
+    stoch_k_first = _STOCH_FASTK - 1
+    stoch_start = stoch_k_first + 2 * (_STOCH_SLOW - 1)
+
+    obv = volume[0]
+    out[_OBV, 0] = obv
+
+    for i in range(n):
+        c = close[i]
+        h = high[i]
+        lo = low[i]
+
+        # SMA 20/50/200 and Bollinger Bands
+        sum_20 += c
+        sum_sq_20 += c * c
+        sum_50 += c
+        sum_200 += c
+        if i >= 19:
+            mean = sum_20 / 20
+            variance = sum_sq_20 / 20 - mean * mean
+            band = _BB_STD * math.sqrt(variance) if variance > 0 else 0.0
+            out[_SMA_20, i] = mean
+            out[_BB_MIDDLE, i] = mean
+            out[_BB_UPPER, i] = mean + band
+            out[_BB_LOWER, i] = mean - band
+            old = close[i - 19]
+            sum_20 -= old
+            sum_sq_20 -= old * old
+        if i >= 49:
+            out[_SMA_50, i] = sum_50 / 50
+            sum_50 -= close[i - 49]
+        if i >= 199:
+            out[_SMA_200, i] = sum_200 / 200
+            sum_200 -= close[i - 199]
+
+        # EMA 20/50, seeded with the SMA of their first period
+        if i == 19:
+            ema_20 = out[_SMA_20, i]
+        elif i > 19:
+            ema_20 = (c - ema_20) * k_20 + ema_20
+        if i >= 19:
+            out[_EMA_20, i] = ema_20
+        if i == 49:
+            ema_50 = out[_SMA_50, i]
+        elif i > 49:
+            ema_50 = (c - ema_50) * k_50 + ema_50
+        if i >= 49:
+            out[_EMA_50, i] = ema_50
+
+        # MACD
+        if i <= macd_first:
+            slow_seed += c
+            if i >= _MACD_SLOW - _MACD_FAST:
+                fast_seed += c
+            if i == macd_first:
+                fast = fast_seed / _MACD_FAST
+                slow = slow_seed / _MACD_SLOW
+        else:
+            fast = (c - fast) * k_fast + fast
+            slow = (c - slow) * k_slow + slow
+        if i >= macd_first:
+            macd = fast - slow
+            if i <= macd_start:
+                macd_seed += macd
+                if i == macd_start:
+                    signal = macd_seed / _MACD_SIGNAL_PERIOD
+            else:
+                signal = (macd - signal) * k_signal + signal
+            if i >= macd_start:
+                out[_MACD, i] = macd
+                out[_MACD_SIGNAL, i] = signal
+                out[_MACD_HIST, i] = macd - signal
+
+        # Stochastic (14, 3, 3): slow %K and %D are 3-bar SMAs
+        while max_tail > max_head and high[max_q[max_tail - 1]] <= h:
+            max_tail -= 1
+        max_q[max_tail] = i
+        max_tail += 1
+        if max_q[max_head] <= i - _STOCH_FASTK:
+            max_head += 1
+        while min_tail > min_head and low[min_q[min_tail - 1]] >= lo:
+            min_tail -= 1
+        min_q[min_tail] = i
+        min_tail += 1
+        if min_q[min_head] <= i - _STOCH_FASTK:
+            min_head += 1
+        if i >= stoch_k_first:
+            lowest = low[min_q[min_head]]
+            diff = (high[max_q[max_head]] - lowest) / 100.0
+            fast_k[i] = (c - lowest) / diff if diff != 0.0 else 0.0
+            if i >= stoch_k_first + _STOCH_SLOW - 1:
+                slow_k[i] = (fast_k[i - 2] + fast_k[i - 1] + fast_k[i]) / 3
+                if i >= stoch_start:
+                    out[_STOCH_K, i] = slow_k[i]
+                    out[_STOCH_D, i] = (slow_k[i - 2] + slow_k[i - 1] + slow_k[i]) / 3
+
+        if i == 0:
+            continue
+
+        prev_close = close[i - 1]
+        change = c - prev_close
+
+        # RSI
+        if i <= _RSI_PERIOD:
+            if change > 0:
+                gain += change
+            else:
+                loss -= change
+            if i == _RSI_PERIOD:
+                gain /= _RSI_PERIOD
+                loss /= _RSI_PERIOD
+        else:
+            gain *= _RSI_PERIOD - 1
+            loss *= _RSI_PERIOD - 1
+            if change > 0:
+                gain += change
+            else:
+                loss -= change
+            gain /= _RSI_PERIOD
+            loss /= _RSI_PERIOD
+        if i >= _RSI_PERIOD:
+            total = gain + loss
+            out[_RSI, i] = 0.0 if total == 0 else 100.0 * gain / total
+
+        # OBV
+        if change > 0:
+            obv += volume[i]
+        elif change < 0:
+            obv -= volume[i]
+        out[_OBV, i] = obv
+
+        # ATR
+        true_range = max(h - lo, abs(h - prev_close), abs(lo - prev_close))
+        if i <= _ATR_PERIOD:
+            tr_seed += true_range
+            if i == _ATR_PERIOD:
+                atr = tr_seed / _ATR_PERIOD
+        else:
+            atr = (atr * (_ATR_PERIOD - 1) + true_range) / _ATR_PERIOD
+        if i >= _ATR_PERIOD:
+            out[_ATR, i] = atr
+
+        # ADX
+        up = h - high[i - 1]
+        down = low[i - 1] - lo
+        if i >= _ADX_PERIOD:
+            plus_dm -= plus_dm / _ADX_PERIOD
+            minus_dm -= minus_dm / _ADX_PERIOD
+            tr_sum = tr_sum - tr_sum / _ADX_PERIOD + true_range
+        else:
+            tr_sum += true_range
+        if down > 0 and up < down:
+            minus_dm += down
+        elif up > 0 and up > down:
+            plus_dm += up
+        if i >= _ADX_PERIOD:
+            valid = False
+            dx = 0.0
+            if tr_sum != 0:
+                minus_di = 100.0 * (minus_dm / tr_sum)
+                plus_di = 100.0 * (plus_dm / tr_sum)
+                di_sum = minus_di + plus_di
+                if di_sum != 0:
+                    dx = 100.0 * (abs(minus_di - plus_di) / di_sum)
+                    valid = True
+            if i <= adx_start:
+                if valid:
+                    dx_sum += dx
+                if i == adx_start:
+                    adx = dx_sum / _ADX_PERIOD
+            elif valid:
+                adx = (adx * (_ADX_PERIOD - 1) + dx) / _ADX_PERIOD
+            if i >= adx_start:
+                out[_ADX, i] = adx
+
+
+@njit(cache=True)
+def _fused_into(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """
+    _fused_rows from the first bar with no NaN in any column
+
+    As in the TA-Lib wrapper, leading incomplete bars are skipped and stay
+    NaN; lookbacks count from the first complete bar.
+    """
+    n = len(close)
+    start = 0
+    while start < n and (
+        math.isnan(high[start])
+        or math.isnan(low[start])
+        or math.isnan(close[start])
+        or math.isnan(volume[start])
+    ):
+        start += 1
+    _fused_rows(high[start:], low[start:], close[start:], volume[start:], out[:, start:])
+
+
+@njit(cache=True)
+def fused_all(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """
+    All indicators as a (len(FUSED_INDICATOR_KEYS), n) float64 block
+
+    Rows are ordered as FUSED_INDICATOR_KEYS; bars before an indicator's
+    lookback are NaN.
+    """
+    out = np.full((len(FUSED_INDICATOR_KEYS), len(close)), np.nan)
+    _fused_into(high, low, close, volume, out)
+    return out
+
+
+def fused_all_aot(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """
+    fused_all through the ahead-of-time compiled kernel
+
+    Requires AOT_AVAILABLE. The compiled wrapper does not check argument
+    types, so inputs are coerced to float64 and validated here first.
+    """
+    if not AOT_AVAILABLE:
+        raise RuntimeError(
+            "ta_aot is not built; run python -m agents.technical_analysis.aot_build"
+        )
+    columns = [np.ascontiguousarray(a, dtype=np.float64) for a in (high, low, close, volume)]
+    n = len(columns[2])
+    if any(a.ndim != 1 or len(a) != n for a in columns):
+        raise ValueError("high, low, close and volume must be 1-D arrays of equal length")
+    out = np.full((len(FUSED_INDICATOR_KEYS), n), np.nan)
+    _aot_fused_into(*columns, out)
+    return out
+
+
+# pycc cannot export parallel kernels, so the batch path is always JIT
+@njit(cache=True, parallel=True)
+def fused_batch(
+    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray
+) -> np.ndarray:
+    """
+    fused_all for several symbols with equal bar counts at once
+
+    Inputs are (symbols, n) arrays; symbols are processed in parallel and
+    the result is a (symbols, len(FUSED_INDICATOR_KEYS), n) block.
+    """
+    n_symbols, n = closes.shape
+    out = np.full((n_symbols, len(FUSED_INDICATOR_KEYS), n), np.nan)
+    for s in prange(n_symbols):
+        _fused_into(highs[s], lows[s], closes[s], volumes[s], out[s])
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) the kernels for float64 input; the
+    # single-symbol one is not needed when the AOT module is built
+    _bars = np.linspace(100.0, 110.0, 64)
+    if not AOT_AVAILABLE:
+        fused_all(_bars + 1.0, _bars - 1.0, _bars, np.ones(64))
+    _bars = np.stack([_bars, _bars])
+    fused_batch(_bars + 1.0, _bars - 1.0, _bars, np.ones_like(_bars))
+    del _bars
@@ -3,7 +3,10 @@ Technical Indicators Module
 Wrapper around TA-Lib for calculating technical indicators.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import deque
+from dataclasses import dataclass
+import math
 import pandas as pd
 import numpy as np
 try:
@@ -13,10 +16,106 @@ except ImportError:
     TALIB_AVAILABLE = False
     print("⚠️  TA-Lib not installed. Install with: pip install TA-Lib")
 
+from agents.technical_analysis import indicators_kernels as kernels
+from agents.technical_analysis.fused_indicators import (
+    AOT_AVAILABLE,
+    FUSED_INDICATOR_KEYS,
+    fused_all,
+    fused_all_aot,
+    fused_batch,
+)
+from core.jit import NUMBA_AVAILABLE
 from core.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Numeric OHLCV fields, in storage order
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(slots=True)
+class OHLCVArrays:
+    """
+    OHLCV bars as contiguous float64 columns, oldest bar first
+
+    Column access by name (bars["close"]) mirrors a DataFrame, so indicator
+    code accepts either.
+    """
+
+    timestamp: np.ndarray  # Epoch seconds
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return getattr(self, column)
+
+    def closed(self) -> "OHLCVArrays":
+        """
+        All bars but the newest, which may still be forming
+
+        Matches what IndicatorState has committed after replaying the same
+        bars. Columns are views, not copies.
+        """
+        return OHLCVArrays(
+            *(getattr(self, column)[:-1] for column in ("timestamp",) + OHLCV_COLUMNS)
+        )
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict[str, Any]]) -> "OHLCVArrays":
+        """
+        Build from InfluxDB OHLCV rows
+
+        Sorts by timestamp and drops bars with a missing value in any numeric
+        column, copying each column once.
+        """
+        n = len(rows)
+        timestamp = np.fromiter(
+            (row["timestamp"].timestamp() for row in rows), dtype=np.float64, count=n
+        )
+        # None becomes NaN in a float64 array
+        columns = [
+            np.array([row[col] for row in rows], dtype=np.float64)
+            for col in OHLCV_COLUMNS
+        ]
+
+        valid = np.ones(n, dtype=bool)
+        for values in columns:
+            valid &= ~np.isnan(values)
+
+        order = np.argsort(timestamp, kind="stable")
+        order = order[valid[order]]
+
+        return cls(timestamp[order], *(values[order] for values in columns))
+
+
+@dataclass(slots=True)
+class LatestIndicators:
+    """Typed view of the latest indicator values (None where unavailable)"""
+
+    sma_20: Optional[float] = None
+    sma_50: Optional[float] = None
+    sma_200: Optional[float] = None
+    ema_20: Optional[float] = None
+    ema_50: Optional[float] = None
+    rsi: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_hist: Optional[float] = None
+    bb_upper: Optional[float] = None
+    bb_middle: Optional[float] = None
+    bb_lower: Optional[float] = None
+    atr: Optional[float] = None
+    obv: Optional[float] = None
+    stoch_k: Optional[float] = None
+    stoch_d: Optional[float] = None
+    adx: Optional[float] = None
+
 
 class TechnicalIndicators:
     """Calculate technical indicators using TA-Lib"""
@@ -32,6 +131,8 @@ class TechnicalIndicators:
 
         Returns: Array of RSI values (0-100)
         """
+        if NUMBA_AVAILABLE:
+            return kernels.rsi(close, period)
         return talib.RSI(close, timeperiod=period)
 
     @staticmethod
@@ -46,6 +147,8 @@ class TechnicalIndicators:
 
         Returns: (macd, signal, histogram)
         """
+        if NUMBA_AVAILABLE:
+            return kernels.macd(close, fast_period, slow_period, signal_period)
         macd, signal, hist = talib.MACD(
             close,
             fastperiod=fast_period,
@@ -65,6 +168,8 @@ class TechnicalIndicators:
 
         Returns: (upper_band, middle_band, lower_band)
         """
+        if NUMBA_AVAILABLE:
+            return kernels.bollinger(close, period, std_dev)
         upper, middle, lower = talib.BBANDS(
             close,
             timeperiod=period,
@@ -76,11 +181,15 @@ class TechnicalIndicators:
     @staticmethod
     def calculate_ema(close: np.ndarray, period: int = 20) -> np.ndarray:
         """Calculate Exponential Moving Average"""
+        if NUMBA_AVAILABLE:
+            return kernels.ema(close, period)
         return talib.EMA(close, timeperiod=period)
 
     @staticmethod
     def calculate_sma(close: np.ndarray, period: int = 20) -> np.ndarray:
         """Calculate Simple Moving Average"""
+        if NUMBA_AVAILABLE:
+            return kernels.sma(close, period)
         return talib.SMA(close, timeperiod=period)
 
     @staticmethod
@@ -134,22 +243,36 @@ class TechnicalIndicators:
 
     @staticmethod
     def calculate_all_indicators(
-        df: pd.DataFrame,
+        df: Union[pd.DataFrame, OHLCVArrays],
     ) -> Dict[str, Any]:
         """
-        Calculate all indicators for a DataFrame with OHLCV data
+        Calculate all indicators for OHLCV data
 
         Args:
-            df: DataFrame with columns: open, high, low, close, volume
+            df: OHLCVArrays, or a DataFrame with columns: open, high, low,
+                close, volume
 
         Returns:
             Dictionary with all calculated indicators
+
+        With Numba available every indicator comes from one fused compiled
+        pass (fused_indicators); the values are rows of a single array. The
+        ahead-of-time built kernel is used instead when present.
         """
-        close = df["close"].values
-        high = df["high"].values
-        low = df["low"].values
-        open_price = df["open"].values
-        volume = df["volume"].values
+        close = np.asarray(df["close"], dtype=np.float64)
+        high = np.asarray(df["high"], dtype=np.float64)
+        low = np.asarray(df["low"], dtype=np.float64)
+        open_price = np.asarray(df["open"], dtype=np.float64)
+        volume = np.asarray(df["volume"], dtype=np.float64)
+
+        if AOT_AVAILABLE or NUMBA_AVAILABLE:
+            kernel = fused_all_aot if AOT_AVAILABLE else fused_all
+            try:
+                block = kernel(high, low, close, volume)
+            except Exception as e:
+                logger.error("indicator_calculation_failed", error=str(e))
+                raise
+            return dict(zip(FUSED_INDICATOR_KEYS, block))
 
         indicators = {}
 
@@ -199,26 +322,413 @@ class TechnicalIndicators:
 
         return indicators
 
+    @staticmethod
+    def calculate_all_indicators_batch(
+        bars: List[OHLCVArrays],
+    ) -> List[Dict[str, Any]]:
+        """
+        calculate_all_indicators for several symbols
+
+        With Numba available, symbols with equal bar counts are stacked into
+        (symbols, bars) arrays and computed in parallel by one fused_batch
+        call; the rest go through calculate_all_indicators one at a time.
+
+        Returns:
+            Indicator dictionaries in the order of bars
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(bars)
+
+        if NUMBA_AVAILABLE:
+            by_length: Dict[int, List[int]] = {}
+            for i, symbol_bars in enumerate(bars):
+                by_length.setdefault(len(symbol_bars), []).append(i)
+
+            for positions in by_length.values():
+                if len(positions) < 2:
+                    continue
+                try:
+                    block = fused_batch(
+                        *(
+                            np.stack([bars[i][column] for i in positions])
+                            for column in ("high", "low", "close", "volume")
+                        )
+                    )
+                except Exception as e:
+                    logger.error("indicator_calculation_failed", error=str(e))
+                    raise
+                for i, symbol_block in zip(positions, block):
+                    results[i] = dict(zip(FUSED_INDICATOR_KEYS, symbol_block))
+
+        for i, symbol_bars in enumerate(bars):
+            if results[i] is None:
+                results[i] = TechnicalIndicators.calculate_all_indicators(symbol_bars)
+
+        return results
+
     @staticmethod
     def get_latest_values(indicators: Dict[str, np.ndarray]) -> Dict[str, float]:
         """
         Get the latest (most recent) value from each indicator array
 
+        Values are coerced here, once, so the result can go straight into
+        a TradingSignal and the signals table.
+
         Args:
             indicators: Dictionary of indicator arrays
 
         Returns:
-            Dictionary with latest values
+            Dictionary with latest values as Python floats (None for NaN)
         """
-        latest = {}
+        # Gather the last values into one array; tolist() converts them all
+        # to Python floats in a single call
+        last = np.fromiter(
+            (values[-1] if len(values) > 0 else np.nan for values in indicators.values()),
+            dtype=np.float64,
+            count=len(indicators),
+        ).tolist()
+
+        return {
+            key: None if math.isnan(value) else value
+            for key, value in zip(indicators, last)
+        }
+
 
-        for key, values in indicators.items():
-            if len(values) > 0 and not np.isnan(values[-1]):
-                latest[key] = float(values[-1])
-            else:
-                latest[key] = None
+class _Window:
+    """Fixed-length window of the latest values with a running sum"""
+
+    def __init__(self, period: int, track_squares: bool = False):
+        self.period = period
+        self.values: deque = deque(maxlen=period)
+        self.track_squares = track_squares
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._updates = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.period
+
+    def append(self, value: float) -> None:
+        if self.full:
+            old = self.values[0]
+            self.total -= old
+            if self.track_squares:
+                self.total_sq -= old * old
+        self.values.append(value)
+        self.total += value
+        if self.track_squares:
+            self.total_sq += value * value
+
+        # Re-sum once per window length to stop rounding drift accumulating
+        self._updates += 1
+        if self._updates % self.period == 0:
+            self.total = math.fsum(self.values)
+            if self.track_squares:
+                self.total_sq = math.fsum(v * v for v in self.values)
+
+    def mean(self) -> Optional[float]:
+        return self.total / self.period if self.full else None
+
+    def pstd(self) -> Optional[float]:
+        """Population standard deviation, as used by Bollinger Bands"""
+        if not self.full:
+            return None
+        mean = self.total / self.period
+        return math.sqrt(max(self.total_sq / self.period - mean * mean, 0.0))
+
+
+class _EMA:
+    """Exponential moving average seeded with the SMA of the first period values"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.k = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed: List[float] = []
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is not None:
+            self.value += self.k * (x - self.value)
+        else:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = sum(self._seed) / self.period
+                self._seed = []
+        return self.value
+
+
+class _Wilder:
+    """Wilder smoothing seeded with the mean of the first period values"""
 
-        return latest
+    def __init__(self, period: int):
+        self.period = period
+        self.value: Optional[float] = None
+        self._seed: List[float] = []
+
+    def update(self, x: float) -> Optional[float]:
+        if self.value is not None:
+            self.value = (self.value * (self.period - 1) + x) / self.period
+        else:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = sum(self._seed) / self.period
+                self._seed = []
+        return self.value
+
+
+class _WilderSum:
+    """Wilder running sum, as in ADX: seeded with the sum of the first period - 1 values"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.total = 0.0
+        self._count = 0
+
+    def update(self, x: float) -> Optional[float]:
+        self._count += 1
+        if self._count < self.period:
+            self.total += x
+            return None
+        self.total = self.total - self.total / self.period + x
+        return self.total
+
+
+class _RollingExtreme:
+    """Rolling max (or min) of the latest period values via a monotonic deque"""
+
+    def __init__(self, period: int, highest: bool = True):
+        self.period = period
+        self.highest = highest
+        self._queue: deque = deque()  # (index, value), values monotonic
+        self._count = 0
+
+    @property
+    def full(self) -> bool:
+        return self._count >= self.period
+
+    @property
+    def value(self) -> float:
+        return self._queue[0][1]
+
+    def append(self, value: float) -> None:
+        queue = self._queue
+        if self.highest:
+            while queue and queue[-1][1] <= value:
+                queue.pop()
+        else:
+            while queue and queue[-1][1] >= value:
+                queue.pop()
+        queue.append((self._count, value))
+        self._count += 1
+        if queue[0][0] <= self._count - 1 - self.period:
+            queue.popleft()
+
+
+class IndicatorState:
+    """
+    Incrementally updated indicators for one symbol
+
+    Each closed bar updates every indicator in O(1) (amortized for the
+    stochastic high/low deques), producing the same keys as
+    TechnicalIndicators.calculate_all_indicators without recomputing the
+    whole lookback. Uses the TA-Lib default parameters and recurrences, so
+    after replaying the same bars the values match the full computation up
+    to rounding.
+
+    The exchange streams the forming bar repeatedly, so on_candle keeps the
+    latest bar pending and commits it only once a newer bar arrives.
+    """
+
+    def __init__(self, bar_seconds: float = 60.0):
+        self.bar_seconds = bar_seconds
+        self.bars = 0
+        self.stale = False
+        self.last_close: Optional[float] = None
+        self._pending: Optional[Tuple[float, float, float, float, float, float]] = None
+        self._prev_close: Optional[float] = None
+        self._prev_high: Optional[float] = None
+        self._prev_low: Optional[float] = None
+
+        # Trend
+        self._sma_20 = _Window(20, track_squares=True)  # Also the BB window
+        self._sma_50 = _Window(50)
+        self._sma_200 = _Window(200)
+        self._ema_20 = _EMA(20)
+        self._ema_50 = _EMA(50)
+
+        # Momentum
+        self._gain = _Wilder(14)
+        self._loss = _Wilder(14)
+        self._ema_12 = _EMA(12)  # Fed from bar 14 so it seeds with the slow EMA
+        self._ema_26 = _EMA(26)
+        self._macd_signal = _EMA(9)
+        self._macd: Optional[float] = None
+
+        # Volatility and volume
+        self._atr = _Wilder(14)
+        self._obv: Optional[float] = None
+
+        # Stochastic (14, 3, 3) and ADX (14)
+        self._highest = _RollingExtreme(14, highest=True)
+        self._lowest = _RollingExtreme(14, highest=False)
+        self._slow_k = _Window(3)
+        self._slow_d = _Window(3)
+        self._tr_sum = _WilderSum(14)
+        self._plus_dm = _WilderSum(14)
+        self._minus_dm = _WilderSum(14)
+        self._dx_count = 0
+        self._dx_sum = 0.0
+        self._adx: Optional[float] = None
+
+    @classmethod
+    def from_bars(cls, bars: "OHLCVArrays", bar_seconds: float = 60.0) -> "IndicatorState":
+        """Replay fetched bars; the newest one may still be forming and stays pending"""
+        state = cls(bar_seconds)
+        for i in range(len(bars)):
+            state.on_candle(
+                float(bars.timestamp[i]),
+                float(bars.open[i]),
+                float(bars.high[i]),
+                float(bars.low[i]),
+                float(bars.close[i]),
+                float(bars.volume[i]),
+            )
+        state.stale = False
+        return state
+
+    def on_candle(
+        self,
+        timestamp: float,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """
+        Record a (possibly still forming) bar
+
+        Args:
+            timestamp: Bar open time in epoch seconds
+        """
+        if self._pending is not None:
+            pending_ts = self._pending[0]
+            if timestamp < pending_ts:
+                return  # Out of order
+            if timestamp > pending_ts:
+                # The pending bar has closed
+                self.update(*self._pending[1:])
+                if timestamp - pending_ts > self.bar_seconds:
+                    self.stale = True  # Bars were missed
+        self._pending = (timestamp, open_price, high, low, close, volume)
+        self.last_close = close
+
+    def update(
+        self, open_price: float, high: float, low: float, close: float, volume: float
+    ) -> None:
+        """Apply one closed bar to every indicator"""
+        prev_close = self._prev_close
+
+        self._sma_20.append(close)
+        self._sma_50.append(close)
+        self._sma_200.append(close)
+        self._ema_20.update(close)
+        self._ema_50.update(close)
+
+        # MACD: signal line starts once both EMAs are seeded
+        slow = self._ema_26.update(close)
+        fast = self._ema_12.update(close) if self.bars >= 26 - 12 else None
+        if fast is not None and slow is not None:
+            self._macd = fast - slow
+            self._macd_signal.update(self._macd)
+
+        # Stochastic
+        self._highest.append(high)
+        self._lowest.append(low)
+        if self._highest.full:
+            lowest = self._lowest.value
+            diff = (self._highest.value - lowest) / 100.0
+            fast_k = (close - lowest) / diff if diff != 0.0 else 0.0
+            self._slow_k.append(fast_k)
+            if self._slow_k.full:
+                self._slow_d.append(self._slow_k.mean())
+
+        if prev_close is None:
+            self._obv = volume
+        else:
+            change = close - prev_close
+            self._gain.update(max(change, 0.0))
+            self._loss.update(max(-change, 0.0))
+
+            if change > 0:
+                self._obv += volume
+            elif change < 0:
+                self._obv -= volume
+
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            self._atr.update(true_range)
+
+            # Directional movement
+            up = high - self._prev_high
+            down = self._prev_low - low
+            tr = self._tr_sum.update(true_range)
+            plus_dm = self._plus_dm.update(up if up > 0 and up > down else 0.0)
+            minus_dm = self._minus_dm.update(down if down > 0 and up < down else 0.0)
+            if tr is not None:
+                dx = None
+                if tr != 0:
+                    minus_di = 100.0 * (minus_dm / tr)
+                    plus_di = 100.0 * (plus_dm / tr)
+                    di_sum = minus_di + plus_di
+                    if di_sum != 0:
+                        dx = 100.0 * (abs(minus_di - plus_di) / di_sum)
+
+                # ADX is the mean of the first 14 DX values, then Wilder
+                # smoothed; bars without a defined DX leave it unchanged
+                if self._adx is None:
+                    self._dx_count += 1
+                    if dx is not None:
+                        self._dx_sum += dx
+                    if self._dx_count == 14:
+                        self._adx = self._dx_sum / 14
+                elif dx is not None:
+                    self._adx = (self._adx * 13 + dx) / 14
+
+        self._prev_close = close
+        self._prev_high = high
+        self._prev_low = low
+        self.bars += 1
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Latest value of every indicator as Python floats (None while warming up)"""
+        middle = self._sma_20.mean()
+        std = self._sma_20.pstd()
+        gain, loss = self._gain.value, self._loss.value
+        if gain is None or loss is None:
+            rsi = None
+        else:
+            rsi = 0.0 if gain + loss == 0 else 100.0 * gain / (gain + loss)
+        macd_signal = self._macd_signal.value
+
+        return {
+            "sma_20": middle,
+            "sma_50": self._sma_50.mean(),
+            "sma_200": self._sma_200.mean(),
+            "ema_20": self._ema_20.value,
+            "ema_50": self._ema_50.value,
+            "rsi": rsi,
+            "macd": self._macd if macd_signal is not None else None,
+            "macd_signal": macd_signal,
+            "macd_hist": self._macd - macd_signal if macd_signal is not None else None,
+            "bb_upper": middle + 2 * std if middle is not None else None,
+            "bb_middle": middle,
+            "bb_lower": middle - 2 * std if middle is not None else None,
+            "atr": self._atr.value,
+            "obv": self._obv,
+            "stoch_k": self._slow_k.mean() if self._slow_d.full else None,
+            "stoch_d": self._slow_d.mean(),
+            "adx": self._adx,
+        }
 
 
 class SignalGenerator:
@@ -382,14 +892,18 @@ class SignalGenerator:
                 "details": [],
             }
 
+        # One pass sums the strengths and collects the reasons
         buy_strength = 0.0
         sell_strength = 0.0
+        reasoning = []
 
         for sig in signals:
-            if sig["signal"] == "BUY":
+            kind = sig["signal"]
+            if kind == "BUY":
                 buy_strength += sig["strength"]
-            elif sig["signal"] == "SELL":
+            elif kind == "SELL":
                 sell_strength += sig["strength"]
+            reasoning.append(sig["reason"])
 
         total_strength = buy_strength + sell_strength
 
@@ -411,6 +925,6 @@ class SignalGenerator:
             "confidence": confidence,
             "buy_strength": buy_strength,
             "sell_strength": sell_strength,
-            "reasoning": [s["reason"] for s in signals],
+            "reasoning": reasoning,
             "details": signals,
         }
@@ -0,0 +1,196 @@
+"""
+Indicator Kernels Module
+Compiled single-loop kernels for the trend, momentum and volatility
+indicator helpers of TechnicalIndicators.
+
+Each kernel reproduces TA-Lib's definition (seeding, lookback and NaN
+prefix) for float64 input, so its output can be used in place of the
+TA-Lib call. Like the TA-Lib wrapper, a leading run of NaN inputs is
+skipped and the lookback counts from the first valid value. Kernels are written in the NumPy subset supported by
+Numba; without Numba they still run, but as slow Python loops.
+"""
+
+from typing import Tuple
+import math
+import numpy as np
+
+from core.jit import njit, NUMBA_AVAILABLE
+
+
+@njit(cache=True)
+def _first_valid(values: np.ndarray) -> int:
+    """Index of the first non-NaN value (len(values) if there is none)"""
+    for i in range(len(values)):
+        if not math.isnan(values[i]):
+            return i
+    return len(values)
+
+
+@njit(cache=True)
+def sma(close: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average from a running window sum"""
+    n = len(close)
+    out = np.full(n, np.nan)
+    start = _first_valid(close)
+    if n - start < period:
+        return out
+
+    total = 0.0
+    for i in range(start, start + period - 1):
+        total += close[i]
+    for i in range(start + period - 1, n):
+        total += close[i]
+        out[i] = total / period
+        total -= close[i - period + 1]
+    return out
+
+
+@njit(cache=True)
+def _ema_into(values: np.ndarray, start: int, period: int, out: np.ndarray) -> None:
+    """
+    EMA of values[start:] written into out, seeded with the SMA of the
+    first period values; out before start + period - 1 is left untouched
+    """
+    k = 2.0 / (period + 1)
+    total = 0.0
+    for i in range(start, start + period):
+        total += values[i]
+    prev = total / period
+    out[start + period - 1] = prev
+    for i in range(start + period, len(values)):
+        prev = (values[i] - prev) * k + prev
+        out[i] = prev
+
+
+@njit(cache=True)
+def ema(close: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first period values"""
+    out = np.full(len(close), np.nan)
+    start = _first_valid(close)
+    if len(close) - start >= period:
+        _ema_into(close, start, period, out)
+    return out
+
+
+@njit(cache=True)
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """Relative Strength Index with Wilder smoothing of gains and losses"""
+    n = len(close)
+    out = np.full(n, np.nan)
+    start = _first_valid(close)
+    if n - start <= period:
+        return out
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(start + 1, start + period + 1):
+        diff = close[i] - close[i - 1]
+        if diff > 0:
+            gain += diff
+        else:
+            loss -= diff
+    gain /= period
+    loss /= period
+
+    i = start + period
+    while True:
+        total = gain + loss
+        out[i] = 0.0 if total == 0 else 100.0 * gain / total
+
+        i += 1
+        if i >= n:
+            break
+        diff = close[i] - close[i - 1]
+        gain *= period - 1
+        loss *= period - 1
+        if diff > 0:
+            gain += diff
+        else:
+            loss -= diff
+        gain /= period
+        loss /= period
+    return out
+
+
+@njit(cache=True)
+def macd(
+    close: np.ndarray, fast_period: int, slow_period: int, signal_period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    (macd, signal, histogram)
+
+    As in TA-Lib, the fast EMA is seeded at the same bar as the slow one,
+    and all three outputs start once the signal line is seeded.
+    """
+    n = len(close)
+    macd_line = np.full(n, np.nan)
+    signal = np.full(n, np.nan)
+    hist = np.full(n, np.nan)
+    valid = _first_valid(close)
+    first = valid + slow_period - 1
+    if n < first + signal_period:
+        return macd_line, signal, hist
+
+    fast = np.full(n, np.nan)
+    slow = np.full(n, np.nan)
+    _ema_into(close, valid + slow_period - fast_period, fast_period, fast)
+    _ema_into(close, valid, slow_period, slow)
+    for i in range(first, n):
+        macd_line[i] = fast[i] - slow[i]
+
+    _ema_into(macd_line, first, signal_period, signal)
+
+    start = first + signal_period - 1
+    macd_line[:start] = np.nan
+    for i in range(start, n):
+        hist[i] = macd_line[i] - signal[i]
+    return macd_line, signal, hist
+
+
+@njit(cache=True)
+def bollinger(
+    close: np.ndarray, period: int, num_std: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(upper, middle, lower) bands around the SMA using the population std"""
+    n = len(close)
+    upper = np.full(n, np.nan)
+    middle = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    start = _first_valid(close)
+    if n - start < period:
+        return upper, middle, lower
+
+    total = 0.0
+    total_sq = 0.0
+    for i in range(start, start + period - 1):
+        total += close[i]
+        total_sq += close[i] * close[i]
+    for i in range(start + period - 1, n):
+        total += close[i]
+        total_sq += close[i] * close[i]
+
+        mean = total / period
+        variance = total_sq / period - mean * mean
+        band = num_std * math.sqrt(variance) if variance > 0 else 0.0
+        middle[i] = mean
+        upper[i] = mean + band
+        lower[i] = mean - band
+
+        old = close[i - period + 1]
+        total -= old
+        total_sq -= old * old
+    return upper, middle, lower
+
+
+def _warm_up() -> None:
+    """Compile (or load from cache) every kernel for float64 input"""
+    close = np.linspace(100.0, 110.0, 64)
+    sma(close, 20)
+    ema(close, 20)
+    rsi(close, 14)
+    macd(close, 12, 26, 9)
+    bollinger(close, 20, 2.0)
+
+
+if NUMBA_AVAILABLE:
+    _warm_up()
@@ -5,14 +5,24 @@ Provides trading dashboard metrics and analytics endpoints
 
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List, Dict, Any
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 from datetime import datetime, timedelta
+import asyncio
+import time
 from decimal import Decimal
 import asyncpg
+from asyncpg.cursor import Cursor
+from asyncpg.transaction import Transaction
 from pydantic import BaseModel
 from core.config.settings import settings
 
-app = FastAPI(title="Trading Dashboard API", version="1.0.0")
+app = FastAPI(
+    title="Trading Dashboard API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # CORS middleware for frontend
 app.add_middleware(
@@ -26,6 +36,103 @@ app.add_middleware(
 # Database connection pool
 db_pool: Optional[asyncpg.Pool] = None
 
+# Materialized dashboard views refresh task (see migration 004)
+refresh_task: Optional[asyncio.Task] = None
+
+POSITIONS_CHANNEL = "positions_changed"
+POSITIONS_PREFETCH = 100  # rows per cursor fetch when streaming positions
+REFRESH_MIN_INTERVAL = 1.0  # seconds between refreshes
+REFRESH_FALLBACK_INTERVAL = 60.0  # refresh at least this often without notifications
+LISTEN_RETRY_MAX = 30.0  # longest wait between LISTEN reconnect attempts
+
+# /api/dashboard/metrics responses keyed by (period, start_date, end_date)
+METRICS_CACHE_TTL = {  # seconds
+    "today": 2.0,
+    "week": 10.0,
+    "month": 60.0,
+    "year": 300.0,
+    "all": 600.0,
+}
+metrics_cache: Dict[tuple, Tuple[float, "DashboardMetrics"]] = {}
+metrics_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+# =====================================================
+# Queries
+# =====================================================
+# Fixed SQL text only: asyncpg keeps a per-connection cache of prepared
+# statements keyed by query text, so repeated requests skip parse/plan
+
+PORTFOLIO_STATUS_QUERY = """
+    SELECT
+        open_positions,
+        total_unrealized_pnl,
+        total_realized_pnl,
+        total_pnl,
+        avg_execution_quality,
+        total_fees,
+        total_positions
+    FROM mv_portfolio_status
+"""
+
+WIN_LOSS_STATS_QUERY = """
+    SELECT wins, losses, win_rate, avg_win, avg_loss, best_trade, worst_trade
+    FROM mv_win_loss_stats
+"""
+
+REFRESH_DASHBOARD_VIEWS = (
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_portfolio_status",
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_win_loss_stats",
+)
+
+# Columns match PositionDetail fields; numerics are cast to float8 so rows
+# carry floats instead of Decimal. hold_duration is formatted as
+# "{hours}h {minutes}m" from epoch seconds (to_char would drop days).
+# $1 is the status filter or 'ALL', $2 the symbol or NULL.
+POSITIONS_QUERY = """
+    SELECT
+        id::text AS id, symbol, side, status,
+        quantity::float8 AS quantity,
+        entry_price::float8 AS entry_price,
+        current_price::float8 AS current_price,
+        stop_loss::float8 AS stop_loss,
+        take_profit::float8 AS take_profit,
+        pnl::float8 AS pnl,
+        pnl_pct::float8 AS pnl_pct,
+        (EXTRACT(EPOCH FROM hold_duration)::int / 3600) || 'h '
+            || (EXTRACT(EPOCH FROM hold_duration)::int % 3600 / 60) || 'm'
+            AS hold_duration,
+        opened_at, closed_at, strategy_tag,
+        execution_quality::float8 AS execution_quality
+    FROM v_position_dashboard
+    WHERE ($1 = 'ALL' OR status = $1)
+      AND ($2::text IS NULL OR symbol = $2)
+    ORDER BY opened_at DESC
+    LIMIT $3 OFFSET $4
+"""
+
+# group_by parameter -> positions column; one fixed query per column
+TRADE_DISTRIBUTION_COLUMNS = {
+    "symbol": "symbol",
+    "strategy": "strategy_tag",
+    "side": "side",
+    "status": "status",
+}
+
+TRADE_DISTRIBUTION_QUERIES = {
+    group_by: f"""
+        SELECT
+            {column} AS group_key,
+            COUNT(*) as count,
+            SUM(CASE WHEN status = 'OPEN' THEN unrealized_pnl ELSE realized_pnl END) as total_pnl,
+            AVG(CASE WHEN status = 'OPEN' THEN unrealized_pnl ELSE realized_pnl END) as avg_pnl
+        FROM positions
+        GROUP BY {column}
+        ORDER BY count DESC
+    """
+    for group_by, column in TRADE_DISTRIBUTION_COLUMNS.items()
+}
+
 
 # =====================================================
 # Pydantic Models
@@ -45,18 +152,18 @@ class PositionDetail(BaseModel):
     symbol: str
     side: str
     status: str
-    quantity: Decimal
-    entry_price: Decimal
-    current_price: Optional[Decimal]
-    stop_loss: Optional[Decimal]
-    take_profit: Optional[Decimal]
-    pnl: Decimal
-    pnl_pct: Decimal
+    quantity: float
+    entry_price: float
+    current_price: Optional[float]
+    stop_loss: Optional[float]
+    take_profit: Optional[float]
+    pnl: float
+    pnl_pct: float
     hold_duration: str
     opened_at: datetime
     closed_at: Optional[datetime]
     strategy_tag: Optional[str]
-    execution_quality: Optional[Decimal]
+    execution_quality: Optional[float]
 
 
 class PerformanceSnapshot(BaseModel):
@@ -88,16 +195,105 @@ async def startup():
     )
     print("✅ Database connection pool initialized")
 
+    global refresh_task
+    refresh_task = asyncio.create_task(listen_refresh())
+
 
 @app.on_event("shutdown")
 async def shutdown():
-    """Close database connection pool"""
+    """Stop the view refresh task and close database connection pool"""
     global db_pool
+    if refresh_task:
+        refresh_task.cancel()
+        try:
+            await refresh_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Dashboard view refresh task failed: {e}")
     if db_pool:
         await db_pool.close()
     print("❌ Database connection pool closed")
 
 
+async def refresh_dashboard_views():
+    """Recompute the materialized dashboard summary views"""
+    async with db_pool.acquire() as conn:
+        for query in REFRESH_DASHBOARD_VIEWS:
+            await conn.execute(query)
+    metrics_cache.clear()
+
+
+async def listen_refresh():
+    """
+    Refresh the materialized views on position changes
+
+    The positions trigger notifies once per statement; notifications that
+    arrive while a refresh is running or within REFRESH_MIN_INTERVAL of the
+    last one are coalesced into a single follow-up refresh. The views are
+    also refreshed every REFRESH_FALLBACK_INTERVAL, and a dropped LISTEN
+    connection is reopened with exponential backoff.
+    """
+    changed = asyncio.Event()
+    listener: Optional[asyncpg.Connection] = None
+    retry_delay = REFRESH_MIN_INTERVAL
+
+    def on_notify(connection, pid, channel, payload):
+        changed.set()
+
+    def on_terminate(connection):
+        # Wake the loop so it reconnects right away
+        changed.set()
+
+    try:
+        while True:
+            if listener is None or listener.is_closed():
+                try:
+                    # LISTEN needs a connection held open, kept out of the pool
+                    listener = await asyncpg.connect(
+                        host=settings.postgres.host,
+                        port=settings.postgres.port,
+                        database=settings.postgres.database,
+                        user=settings.postgres.user,
+                        password=settings.postgres.password,
+                    )
+                    listener.add_termination_listener(on_terminate)
+                    await listener.add_listener(POSITIONS_CHANNEL, on_notify)
+                    retry_delay = REFRESH_MIN_INTERVAL
+                    # Catch up on changes made while not listening
+                    changed.set()
+                except Exception as e:
+                    print(f"⚠️ Dashboard LISTEN connection failed, retrying in {retry_delay:.0f}s: {e}")
+                    if listener is not None:
+                        listener.terminate()
+                    listener = None
+
+            # Without a listener, poll at the retry delay until reconnected
+            timeout = REFRESH_FALLBACK_INTERVAL if listener is not None else retry_delay
+            try:
+                await asyncio.wait_for(changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            if listener is None:
+                retry_delay = min(retry_delay * 2, LISTEN_RETRY_MAX)
+
+            changed.clear()
+            started = time.monotonic()
+            try:
+                await refresh_dashboard_views()
+            except Exception as e:
+                print(f"⚠️ Dashboard view refresh failed: {e}")
+            elapsed = time.monotonic() - started
+            if elapsed < REFRESH_MIN_INTERVAL:
+                await asyncio.sleep(REFRESH_MIN_INTERVAL - elapsed)
+    finally:
+        if listener is not None and not listener.is_closed():
+            try:
+                await listener.close()
+            except Exception:
+                listener.terminate()
+
+
 # =====================================================
 # API Endpoints
 # =====================================================
@@ -126,6 +322,54 @@ async def get_dashboard_metrics(
     - start_date: Custom start date (optional)
     - end_date: Custom end date (optional)
     """
+    key = (period, start_date, end_date)
+    now = time.monotonic()
+
+    cached = metrics_cache.get(key)
+    if cached and now - cached[0] < METRICS_CACHE_TTL[period]:
+        return cached[1]
+
+    # Concurrent identical requests wait for the one already querying.
+    # wait() leaves the shared future alone when this request is cancelled;
+    # if the querying request was cancelled instead, the next waiter queries.
+    pending = metrics_inflight.get(key)
+    while pending:
+        await asyncio.wait((pending,))
+        if not pending.cancelled():
+            return pending.result()
+        pending = metrics_inflight.get(key)
+
+    pending = asyncio.get_running_loop().create_future()
+    metrics_inflight[key] = pending
+    try:
+        metrics = await load_dashboard_metrics(period, start_date, end_date)
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except Exception as e:
+        pending.set_exception(e)
+        # Mark retrieved so the loop does not log it when nobody was waiting
+        pending.exception()
+        raise
+    else:
+        pending.set_result(metrics)
+    finally:
+        del metrics_inflight[key]
+
+    # Drop expired entries so custom date ranges do not accumulate
+    for stale in [k for k, (ts, _) in metrics_cache.items()
+                  if now - ts >= METRICS_CACHE_TTL[k[0]]]:
+        del metrics_cache[stale]
+    metrics_cache[key] = (now, metrics)
+    return metrics
+
+
+async def load_dashboard_metrics(
+    period: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+) -> DashboardMetrics:
+    """Query dashboard summary metrics from the database"""
     # Calculate date range
     end_dt = end_date or datetime.now()
     if period == "today":
@@ -145,23 +389,10 @@ async def get_dashboard_metrics(
     # Query database
     async with db_pool.acquire() as conn:
         # Portfolio status
-        portfolio = await conn.fetchrow("""
-            SELECT
-                open_positions,
-                total_unrealized_pnl,
-                total_realized_pnl,
-                total_pnl,
-                avg_execution_quality,
-                total_fees,
-                total_positions
-            FROM v_portfolio_status
-        """)
+        portfolio = await conn.fetchrow(PORTFOLIO_STATUS_QUERY)
 
         # Win/Loss stats
-        stats = await conn.fetchrow("""
-            SELECT wins, losses, win_rate, avg_win, avg_loss, best_trade, worst_trade
-            FROM v_win_loss_stats
-        """)
+        stats = await conn.fetchrow(WIN_LOSS_STATS_QUERY)
 
         # Get previous balance for change calculation (mock for now)
         current_balance = 10000.00 + float(portfolio['total_pnl'] or 0)
@@ -201,7 +432,11 @@ async def get_dashboard_metrics(
         )
 
 
-@app.get("/api/positions", response_model=List[PositionDetail])
+@app.get(
+    "/api/positions",
+    response_class=StreamingResponse,
+    responses={200: {"model": List[PositionDetail]}},
+)
 async def get_positions(
     status: str = Query("all", regex="^(all|open|closed)$"),
     symbol: Optional[str] = None,
@@ -211,70 +446,73 @@ async def get_positions(
     """
     Get position list with filtering
 
+    Rows are streamed as a JSON array of PositionDetail objects while they
+    are fetched, so memory stays bounded by the cursor prefetch.
+
     Parameters:
     - status: Position status filter (all, open, closed)
     - symbol: Symbol filter (e.g., BTC/USDT)
     - limit: Number of results
     - offset: Pagination offset
     """
-    query = """
-        SELECT
-            id, symbol, side, status, quantity,
-            entry_price, current_price, stop_loss, take_profit,
-            pnl, pnl_pct,
-            EXTRACT(EPOCH FROM hold_duration)::int as hold_seconds,
-            opened_at, closed_at, strategy_tag, execution_quality
-        FROM v_position_dashboard
-        WHERE 1=1
-    """
-
-    params = []
-    param_count = 1
-
-    if status != "all":
-        query += f" AND status = ${param_count}"
-        params.append(status.upper())
-        param_count += 1
-
-    if symbol:
-        query += f" AND symbol = ${param_count}"
-        params.append(symbol)
-        param_count += 1
+    # Run the query and fetch the first batch before any header is sent, so
+    # database and validation errors still become HTTP errors
+    conn = await db_pool.acquire()
+    transaction = conn.transaction()
+    try:
+        # Cursors only exist inside a transaction
+        await transaction.start()
+        cursor = await conn.cursor(
+            POSITIONS_QUERY, status.upper(), symbol or None, limit, offset
+        )
+        rows = await cursor.fetch(POSITIONS_PREFETCH)
+        first = encode_positions(rows)
+    except BaseException:
+        await release_positions_cursor(conn, transaction)
+        raise
+
+    more = len(rows) == POSITIONS_PREFETCH
+    return StreamingResponse(
+        stream_positions(cursor, first, more),
+        media_type="application/json",
+        # Runs after the body is sent or the client disconnects
+        background=BackgroundTask(release_positions_cursor, conn, transaction),
+    )
 
-    query += f" ORDER BY opened_at DESC LIMIT ${param_count} OFFSET ${param_count + 1}"
-    params.extend([limit, offset])
 
-    async with db_pool.acquire() as conn:
-        rows = await conn.fetch(query, *params)
-
-        positions = []
-        for row in rows:
-            # Format hold duration
-            seconds = row['hold_seconds']
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            hold_str = f"{hours}h {minutes}m"
-
-            positions.append(PositionDetail(
-                id=str(row['id']),
-                symbol=row['symbol'],
-                side=row['side'],
-                status=row['status'],
-                quantity=row['quantity'],
-                entry_price=row['entry_price'],
-                current_price=row['current_price'],
-                stop_loss=row['stop_loss'],
-                take_profit=row['take_profit'],
-                pnl=row['pnl'],
-                pnl_pct=row['pnl_pct'],
-                hold_duration=hold_str,
-                opened_at=row['opened_at'],
-                closed_at=row['closed_at'],
-                strategy_tag=row['strategy_tag'],
-                execution_quality=row['execution_quality'],
-            ))
-
-        return positions
+def encode_positions(rows: List[asyncpg.Record]) -> List[bytes]:
+    """Validate rows as PositionDetail and encode each as JSON"""
+    return [PositionDetail.model_validate(dict(row)).model_dump_json().encode() for row in rows]
+
+
+async def stream_positions(
+    cursor: Cursor, first: List[bytes], more: bool
+) -> AsyncIterator[bytes]:
+    """Yield the encoded first batch, then the rest of the cursor, as a JSON array"""
+    chunks = first
+    separator = b"["
+    while True:
+        for chunk in chunks:
+            yield separator + chunk
+            separator = b","
+        if not more:
+            break
+        rows = await cursor.fetch(POSITIONS_PREFETCH)
+        more = len(rows) == POSITIONS_PREFETCH
+        chunks = encode_positions(rows)
+    # An empty result never replaced the opening bracket
+    yield b"[]" if separator == b"[" else b"]"
+
+
+async def release_positions_cursor(
+    conn: asyncpg.Connection, transaction: Transaction
+) -> None:
+    """End the cursor's read-only transaction and return the connection"""
+    try:
+        if not conn.is_closed() and conn.is_in_transaction():
+            await transaction.rollback()
+    finally:
+        await db_pool.release(conn)
 
 
 @app.get("/api/analytics/equity-curve", response_model=List[Dict[str, Any]])
@@ -321,22 +559,11 @@ async def get_trade_distribution(
     - group_by: Field to group by (symbol, strategy, side, status)
     """
     async with db_pool.acquire() as conn:
-        query = f"""
-            SELECT
-                {group_by},
-                COUNT(*) as count,
-                SUM(CASE WHEN status = 'OPEN' THEN unrealized_pnl ELSE realized_pnl END) as total_pnl,
-                AVG(CASE WHEN status = 'OPEN' THEN unrealized_pnl ELSE realized_pnl END) as avg_pnl
-            FROM positions
-            GROUP BY {group_by}
-            ORDER BY count DESC
-        """
-
-        rows = await conn.fetch(query)
+        rows = await conn.fetch(TRADE_DISTRIBUTION_QUERIES[group_by])
 
         return [
             {
-                group_by: row[group_by],
+                group_by: row['group_key'],
                 "count": row['count'],
                 "total_pnl": float(row['total_pnl'] or 0),
                 "avg_pnl": float(row['avg_pnl'] or 0),
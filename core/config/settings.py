@@ -85,6 +85,9 @@ class TradingSettings(BaseSettings):
     take_profit_pct: float = Field(default=5.0, alias="TAKE_PROFIT_PCT")
     var_confidence: float = Field(default=0.95, alias="VAR_CONFIDENCE")
 
+    # Market data cache (seconds)
+    market_data_cache_ttl: float = Field(default=15.0, alias="MARKET_DATA_CACHE_TTL")
+
     @validator("max_position_size_pct", "max_daily_loss_pct")
     def validate_percentage(cls, v: float) -> float:
         if not 0 < v <= 100:
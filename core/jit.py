@@ -0,0 +1,25 @@
+"""
+JIT Compatibility Module
+Optional Numba acceleration for numeric kernels.
+
+Kernels decorated with njit must stay within the NumPy subset supported by
+Numba. When Numba is not installed njit is a no-op and they run as plain
+Python/NumPy functions.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -4,6 +4,7 @@ InfluxDB time-series database for market data storage.
 
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import asyncio
 from influxdb_client import InfluxDBClient, Point, WritePrecision
 from influxdb_client.client.write_api import SYNCHRONOUS
 from core.config.settings import settings
@@ -168,22 +169,63 @@ class InfluxDBManager:
 
         result = self._query_api.query(org=settings.influxdb.org, query=query)
 
-        data = []
+        return [
+            self._ohlcv_row(record) for table in result for record in table.records
+        ]
+
+    def query_ohlcv_multi(
+        self,
+        symbols: List[str],
+        exchange: str,
+        start_time: datetime,
+        end_time: Optional[datetime] = None,
+        interval: str = "1m",
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Query OHLCV data for several symbols in one request, keyed by symbol"""
+        end_time = end_time or datetime.utcnow()
+        symbol_set = ", ".join(f'"{symbol}"' for symbol in symbols)
+
+        query = f'''
+        from(bucket: "{settings.influxdb.bucket}")
+            |> range(
+                start: {start_time.isoformat()}Z,
+                stop: {end_time.isoformat()}Z
+            )
+            |> filter(fn: (r) => r["_measurement"] == "ohlcv")
+            |> filter(fn: (r) => contains(value: r["symbol"], set: [{symbol_set}]))
+            |> filter(fn: (r) => r["exchange"] == "{exchange}")
+            |> filter(fn: (r) => r["interval"] == "{interval}")
+            |> pivot(
+                rowKey:["_time"],
+                columnKey: ["_field"],
+                valueColumn: "_value"
+            )
+        '''
+
+        result = self._query_api.query(org=settings.influxdb.org, query=query)
+
+        data: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in symbols}
         for table in result:
             for record in table.records:
-                data.append({
-                    "timestamp": record.get_time(),
-                    "symbol": record.values.get("symbol"),
-                    "exchange": record.values.get("exchange"),
-                    "open": record.values.get("open"),
-                    "high": record.values.get("high"),
-                    "low": record.values.get("low"),
-                    "close": record.values.get("close"),
-                    "volume": record.values.get("volume"),
-                })
+                row = self._ohlcv_row(record)
+                data.setdefault(row["symbol"], []).append(row)
 
         return data
 
+    @staticmethod
+    def _ohlcv_row(record: Any) -> Dict[str, Any]:
+        """OHLCV row dict from a pivoted Flux record"""
+        return {
+            "timestamp": record.get_time(),
+            "symbol": record.values.get("symbol"),
+            "exchange": record.values.get("exchange"),
+            "open": record.values.get("open"),
+            "high": record.values.get("high"),
+            "low": record.values.get("low"),
+            "close": record.values.get("close"),
+            "volume": record.values.get("volume"),
+        }
+
     def query_indicators(
         self,
         symbol: str,
@@ -242,14 +284,15 @@ class InfluxDBManager:
     async def query(self, flux_query: str) -> List[Dict[str, Any]]:
         """
         Execute a Flux query and return results as list of dicts.
-        Wrapper for async compatibility with agents.
+        The blocking HTTP call runs in a worker thread so other coroutines
+        (e.g. exchange requests) can proceed meanwhile.
         """
         if not self._query_api:
             raise RuntimeError("InfluxDB not connected. Call connect() first.")
 
         try:
-            result = self._query_api.query(
-                org=settings.influxdb.org, query=flux_query
+            result = await asyncio.to_thread(
+                self._query_api.query, org=settings.influxdb.org, query=flux_query
             )
 
             data = []
@@ -0,0 +1,13 @@
+-- Indexes for the dashboard trade distribution queries
+-- Migration: 003_add_position_group_indexes.sql
+
+-- symbol and status are indexed in schema.sql; strategy_tag has a partial
+-- index (001), which cannot serve a GROUP BY that includes NULL tags
+
+-- Add index for grouping by side
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_positions_side
+ON positions(side);
+
+-- Add index for grouping by strategy, including untagged positions
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_positions_strategy_tag_all
+ON positions(strategy_tag);
@@ -0,0 +1,42 @@
+-- Materialize dashboard summary views and notify on position changes
+-- Migration: 004_materialize_dashboard_stats.sql
+
+-- v_portfolio_status and v_win_loss_stats aggregate the positions table on
+-- every /api/dashboard/metrics request. The materialized copies are
+-- single-row tables that the dashboard API refreshes when it receives a
+-- 'positions_changed' notification.
+--
+-- REFRESH ... CONCURRENTLY needs a unique index on plain columns (not an
+-- expression), hence the constant singleton column. The 30-day window is
+-- evaluated at refresh time.
+
+-- Portfolio status snapshot
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_portfolio_status AS
+SELECT 1 AS singleton, *
+FROM v_portfolio_status;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_portfolio_status_singleton
+ON mv_portfolio_status(singleton);
+
+-- Win/Loss statistics snapshot
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_win_loss_stats AS
+SELECT 1 AS singleton, *
+FROM v_win_loss_stats;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_win_loss_stats_singleton
+ON mv_win_loss_stats(singleton);
+
+-- Notify listeners once per statement that touches positions
+CREATE OR REPLACE FUNCTION notify_positions_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('positions_changed', '');
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS trg_positions_refresh ON positions;
+CREATE TRIGGER trg_positions_refresh
+    AFTER INSERT OR UPDATE OR DELETE ON positions
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_positions_changed();
@@ -4,6 +4,7 @@ PostgreSQL database connection and operations.
 
 from typing import Any, Dict, List, Optional
 from contextlib import asynccontextmanager
+import asyncio
 import asyncpg
 from asyncpg.pool import Pool
 from core.config.settings import settings
@@ -30,6 +31,9 @@ class PostgreSQLDatabase:
                 min_size=5,
                 max_size=20,
                 command_timeout=60,
+                # Per-connection prepared statement cache; repeated queries
+                # with identical text skip parse/plan on the server
+                statement_cache_size=100,
             )
             logger.info(
                 "postgres_connected",
@@ -67,6 +71,17 @@ class PostgreSQLDatabase:
             logger.debug("query_executed", query=query[:100], result=result)
             return result
 
+    async def execute_many(
+        self,
+        query: str,
+        args: List[Any],
+        timeout: float = 30.0,
+    ) -> None:
+        """Execute a query once per argument tuple in a single round-trip"""
+        async with self.acquire() as conn:
+            await conn.executemany(query, args, timeout=timeout)
+            logger.debug("query_executed_many", query=query[:100], rows=len(args))
+
     async def fetch_one(
         self,
         query: str,
@@ -197,6 +212,112 @@ class PostgreSQLDatabase:
             return await self.fetch_all(query)
 
 
+class BatchWriter:
+    """
+    Background writer that inserts queued rows with execute_many
+
+    Rows added with put() are collected until batch_size rows are queued or
+    flush_interval seconds have passed since the first one, then written in
+    one round-trip. stop() writes everything queued before it returns.
+    """
+
+    # Queued by stop(); the writer exits once every row before it is written
+    _STOP = object()
+
+    def __init__(
+        self,
+        db: PostgreSQLDatabase,
+        query: str,
+        name: str,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+    ) -> None:
+        self._db = db
+        self._query = query
+        self._name = name
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background writer task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def put(self, row: tuple) -> None:
+        """Queue a row of query arguments"""
+        self._queue.put_nowait(row)
+
+    async def stop(self) -> None:
+        """Write all queued rows and stop the writer task"""
+        if self._task is not None:
+            self._queue.put_nowait(self._STOP)
+            await self._task
+            self._task = None
+
+        # Rows queued without a running writer (or after the stop marker)
+        rows = []
+        while not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not self._STOP:
+                rows.append(row)
+        if rows:
+            await self._write(rows)
+
+    async def _run(self) -> None:
+        """Collect queued rows into batches and write them"""
+        loop = asyncio.get_running_loop()
+        rows: List[tuple] = []
+
+        try:
+            while True:
+                # Block until at least one row is available
+                row = await self._queue.get()
+                if row is self._STOP:
+                    return
+                rows = [row]
+                deadline = loop.time() + self._flush_interval
+                stopping = False
+
+                # Collect more rows until the batch is full or the window closes
+                while len(rows) < self._batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        row = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if row is self._STOP:
+                        stopping = True
+                        break
+                    rows.append(row)
+
+                # Cleared only once written, so a cancelled write is retried below
+                await self._write(rows)
+                rows = []
+                if stopping:
+                    return
+        except asyncio.CancelledError:
+            # Write the current batch along with everything still queued
+            while not self._queue.empty():
+                row = self._queue.get_nowait()
+                if row is not self._STOP:
+                    rows.append(row)
+            if rows:
+                await self._write(rows)
+            raise
+
+    async def _write(self, rows: List[tuple]) -> None:
+        """Insert a batch of rows, logging instead of raising on failure"""
+        try:
+            await self._db.execute_many(self._query, rows)
+            logger.debug("batch_written", writer=self._name, rows=len(rows))
+        except Exception as e:
+            logger.error("batch_write_failed", writer=self._name, rows=len(rows), error=str(e))
+
+
 # Global database instance
 db = PostgreSQLDatabase()
 
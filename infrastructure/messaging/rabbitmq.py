@@ -3,9 +3,9 @@ RabbitMQ message broker for inter-agent communication.
 """
 
 from typing import Any, Callable, Dict, Optional
-import json
 import asyncio
 import aio_pika
+import orjson
 from aio_pika import Message, ExchangeType, DeliveryMode
 from aio_pika.abc import AbstractRobustConnection, AbstractRobustChannel
 from core.config.settings import settings
@@ -13,6 +13,10 @@ from core.logging.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Message bodies: NumPy scalars/arrays and non-string keys are accepted
+# like they would be after a model_dump(mode="json")
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 
 class RabbitMQBroker:
     """RabbitMQ message broker with async support"""
@@ -89,7 +93,7 @@ class RabbitMQBroker:
         }
 
         msg = Message(
-            body=json.dumps(message).encode(),
+            body=orjson.dumps(message, option=ORJSON_OPTIONS),
             delivery_mode=DeliveryMode.PERSISTENT,
             priority=priority,
             content_type="application/json",
@@ -137,7 +141,7 @@ class RabbitMQBroker:
         async def process_message(message: aio_pika.IncomingMessage):
             async with message.process():
                 try:
-                    data = json.loads(message.body.decode())
+                    data = orjson.loads(message.body)
                     await callback(data)
                     logger.debug(
                         "message_processed",
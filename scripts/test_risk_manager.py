@@ -171,6 +171,25 @@ def test_var_calculation():
     print(f"\n⚠️  Conditional VaR (Expected Shortfall):")
     print(f"  CVaR 95%: ${cvar:,.2f}")
 
+    # Plain lists (as kept in RiskManagerAgent.returns_history)
+    returns_list = returns.tolist()
+    assert var_calc.parametric_var(returns_list, position_value) == (
+        var_95_param, var_99_param
+    ), "Parametric VaR should accept a list"
+    assert var_calc.historical_var(returns_list, position_value) == (
+        var_95_hist, var_99_hist
+    ), "Historical VaR should accept a list"
+
+    # Read-only arrays are memoized and give the same result
+    frozen = returns.copy()
+    frozen.flags.writeable = False
+    for _ in range(2):
+        assert np.allclose(
+            var_calc.parametric_var(frozen, position_value),
+            (var_95_param, var_99_param),
+        ), "Memoized parametric VaR should match"
+    print(f"\n📋 List and read-only inputs give the same VaR")
+
     assert var_95_hist > 0, "VaR should be positive"
     assert var_99_hist > var_95_hist, "VaR 99% should be higher than 95%"
     print("\n✅ VaR calculation tests passed")
@@ -239,6 +258,57 @@ def test_stop_loss_placement():
     print("\n✅ Stop-loss placement tests passed")
 
 
+def test_stop_loss_batch_equivalence():
+    """Test that calculate_stops_batch matches calculate_stops row by row"""
+    print("\n" + "=" * 60)
+    print("🛡️  TESTING BATCH STOP-LOSS EQUIVALENCE")
+    print("=" * 60)
+
+    manager = StopLossManager(
+        default_method=StopLossMethod.ATR, default_rr_ratio=2.0
+    )
+    rng = np.random.default_rng(42)
+    n = 3000
+
+    prices = rng.uniform(10, 1000, n).round(2)
+    sides = rng.choice(["BUY", "SELL"], n)
+    inputs = {
+        StopLossMethod.ATR: {"atrs": rng.uniform(0, 50, n)},
+        StopLossMethod.VOLATILITY: {"price_stds": rng.uniform(0, 50, n)},
+        # Levels on either side of price, so some stops sit beyond price
+        StopLossMethod.SUPPORT_RESISTANCE: {
+            "supports": prices * rng.uniform(0.7, 1.3, n),
+            "resistances": prices * rng.uniform(0.7, 1.3, n),
+        },
+        StopLossMethod.PERCENTAGE: {},
+    }
+    scalar_names = {
+        "atrs": "atr",
+        "price_stds": "price_std",
+        "supports": "support",
+        "resistances": "resistance",
+    }
+
+    for method, columns in inputs.items():
+        batch = manager.calculate_stops_batch(
+            [f"SYM{i}" for i in range(n)], prices, sides, method=method, **columns
+        )
+        for i in range(n):
+            stops = manager.calculate_stops(
+                symbol=f"SYM{i}",
+                current_price=float(prices[i]),
+                side=str(sides[i]),
+                method=method,
+                **{scalar_names[k]: float(v[i]) for k, v in columns.items()},
+            )
+            assert stops.stop_loss == batch.stop_loss[i], (method, i, "stop_loss")
+            assert stops.take_profit == batch.take_profit[i], (method, i, "take_profit")
+            assert stops.method == batch.methods[i], (method, i, "method")
+        print(f"  {method.value}: {n} rows match")
+
+    print("\n✅ Batch stop-loss equivalence tests passed")
+
+
 def test_trade_validator():
     """Test trade validation logic"""
     print("\n" + "=" * 60)
@@ -389,6 +459,7 @@ def main():
         test_position_sizer()
         test_var_calculation()
         test_stop_loss_placement()
+        test_stop_loss_batch_equivalence()
         test_trade_validator()
         test_portfolio_risk_analyzer()
 
@@ -12,6 +12,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from agents.technical_analysis.indicators import TechnicalIndicators, SignalGenerator
+from agents.technical_analysis import indicators_kernels as kernels
+from agents.technical_analysis.fused_indicators import FUSED_INDICATOR_KEYS, fused_all
 import pandas as pd
 import numpy as np
 
@@ -140,6 +142,93 @@ def test_signal_generation(df, latest_indicators):
         print(f"    • {reason}")
 
 
+def _talib_reference(talib, high, low, close, volume):
+    """calculate_all_indicators' TA-Lib calls, keyed as FUSED_INDICATOR_KEYS"""
+    macd, signal, hist = talib.MACD(close, fastperiod=12, slowperiod=26, signalperiod=9)
+    upper, middle, lower = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
+    slowk, slowd = talib.STOCH(high, low, close, fastk_period=14, slowk_period=3, slowd_period=3)
+    return {
+        "sma_20": talib.SMA(close, timeperiod=20),
+        "sma_50": talib.SMA(close, timeperiod=50),
+        "sma_200": talib.SMA(close, timeperiod=200),
+        "ema_20": talib.EMA(close, timeperiod=20),
+        "ema_50": talib.EMA(close, timeperiod=50),
+        "rsi": talib.RSI(close, timeperiod=14),
+        "macd": macd,
+        "macd_signal": signal,
+        "macd_hist": hist,
+        "bb_upper": upper,
+        "bb_middle": middle,
+        "bb_lower": lower,
+        "atr": talib.ATR(high, low, close, timeperiod=14),
+        "obv": talib.OBV(close, volume),
+        "stoch_k": slowk,
+        "stoch_d": slowd,
+        "adx": talib.ADX(high, low, close, timeperiod=14),
+    }
+
+
+def test_kernels_match_talib():
+    """Compiled kernels and fused_all against TA-Lib, NaN prefixes included"""
+    print("\n🔬 Testing Compiled Kernels Against TA-Lib...")
+    print("=" * 60)
+
+    try:
+        import talib
+    except ImportError:
+        print("  ⏭️  TA-Lib not installed, skipping")
+        return
+
+    def check(name, actual, expected):
+        # NaN positions must match exactly, values to floating point noise
+        np.testing.assert_array_equal(
+            np.isnan(actual), np.isnan(expected), err_msg=f"{name}: NaN positions differ"
+        )
+        np.testing.assert_allclose(
+            actual, expected, rtol=1e-9, atol=1e-9, equal_nan=True, err_msg=name
+        )
+
+    rng = np.random.default_rng(7)
+    walk = 50000 * np.cumprod(1 + rng.normal(0, 0.002, 300))
+    gappy = walk.copy()
+    gappy[:7] = np.nan
+    # label: (close, high/low spread); a zero spread gives Stochastic and
+    # ADX a zero range, which divides by zero unless guarded
+    cases = {
+        "leading NaN bars (300 bars)": (gappy, 1.0),
+        "all NaN (30 bars)": (np.full(30, np.nan), 1.0),
+        "random walk (300 bars)": (walk, 1.0),
+        "short series (10 bars)": (walk[:10].copy(), 1.0),
+        "short series (30 bars)": (walk[:30].copy(), 1.0),
+        "flat prices (300 bars)": (np.full(300, 50000.0), 0.0),
+    }
+
+    for label, (close, spread) in cases.items():
+        n = len(close)
+        high = close + spread * np.abs(rng.normal(20, 10, n))
+        low = close - spread * np.abs(rng.normal(20, 10, n))
+        volume = rng.uniform(100, 1000, n)
+        volume[np.isnan(close)] = np.nan
+
+        expected = _talib_reference(talib, high, low, close, volume)
+
+        check("sma_20", kernels.sma(close, 20), expected["sma_20"])
+        check("ema_20", kernels.ema(close, 20), expected["ema_20"])
+        check("rsi", kernels.rsi(close, 14), expected["rsi"])
+        for key, value in zip(("macd", "macd_signal", "macd_hist"), kernels.macd(close, 12, 26, 9)):
+            check(key, value, expected[key])
+        for key, value in zip(("bb_upper", "bb_middle", "bb_lower"), kernels.bollinger(close, 20, 2.0)):
+            check(key, value, expected[key])
+
+        block = fused_all(high, low, close, volume)
+        for key, row in zip(FUSED_INDICATOR_KEYS, block):
+            check(f"fused {key}", row, expected[key])
+
+        print(f"  ✓ {label}")
+
+    print("\n✅ Kernels match TA-Lib")
+
+
 def main():
     """Run tests"""
     print("\n🚀 Technical Analysis Agent - Test Suite")
@@ -152,6 +241,9 @@ def main():
         # Test signal generation
         test_signal_generation(df, latest_indicators)
 
+        # Compare compiled kernels with TA-Lib
+        test_kernels_match_talib()
+
         print("\n" + "=" * 60)
         print("✅ All tests completed successfully!")
         print("=" * 60)